@@ -0,0 +1,103 @@
+"""Brute-force vs spatial-hash swept bullet collision scaling.
+
+Run from the legacy-python folder:
+
+    python benchmarks/bench_collisions.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from game.entities.bullet import Bullet, create_bullet_store, spawn_bullet  # noqa: E402
+from game.entities.enemy import Enemy  # noqa: E402
+from game.entities.player import Player  # noqa: E402
+from game.entities.store import ComponentStore  # noqa: E402
+from game.settings import BULLET_SPEED  # noqa: E402
+from game.spatial_hash import SpatialHash  # noqa: E402
+from game.systems import collisions  # noqa: E402
+
+ENEMY_COUNTS = (10, 100, 500, 1000, 2500, 5000)
+# Keep density constant so the grid does the same work per query at every size.
+AREA_PER_ENEMY = 120.0 * 120.0
+
+
+def build_scene(
+    enemy_count: int, bullet_count: int, seed: int
+) -> tuple[list[Enemy], ComponentStore]:
+    rng = random.Random(seed)
+    half = math.sqrt(enemy_count * AREA_PER_ENEMY) / 2.0
+    enemies = [
+        Enemy(
+            x=rng.uniform(-half, half),
+            y=rng.uniform(-half, half),
+            speed=20.0,
+            hp=1e12,
+            damage=20.0,
+            sides=rng.choice((3, 4, 5, 6, 8)),
+            radius=rng.choice((10.0, 12.0, 14.0, 16.0, 20.0)),
+        )
+        for _ in range(enemy_count)
+    ]
+    bullets = create_bullet_store(bullet_count)
+    for _ in range(bullet_count):
+        angle = rng.uniform(0.0, math.tau)
+        vx = math.cos(angle) * BULLET_SPEED
+        vy = math.sin(angle) * BULLET_SPEED
+        bullet = Bullet(rng.uniform(-half, half), rng.uniform(-half, half), vx, vy, 1.0)
+        # One 60 Hz step of travel, so every bullet sweeps a real segment.
+        bullet.prev_x = bullet.x - vx / 60.0
+        bullet.prev_y = bullet.y - vy / 60.0
+        spawn_bullet(bullets, bullet)
+    return enemies, bullets
+
+
+def time_resolve(
+    enemies: list[Enemy], bullets: ComponentStore, use_grid: bool, repeats: int
+) -> tuple[float, list[tuple[float, float]]]:
+    best = math.inf
+    hits: list[tuple[float, float]] = []
+    grid = SpatialHash()
+    for _ in range(repeats):
+        player = Player(0.0, 0.0)
+        hit_positions: list[tuple[float, float]] = []
+        started = time.perf_counter()
+        if use_grid:
+            grid.rebuild(enemies)
+            collisions.resolve_bullet_hits(bullets, enemies, player, [], hit_positions, grid)
+        else:
+            collisions.resolve_bullet_hits(bullets, enemies, player, [], hit_positions)
+        best = min(best, time.perf_counter() - started)
+        hits = hit_positions
+    return best, hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bullets", type=int, default=256)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'enemies':>8} {'brute ms':>10} {'grid ms':>10} {'speedup':>8} {'hits':>6}")
+    for enemy_count in ENEMY_COUNTS:
+        enemies, bullets = build_scene(enemy_count, args.bullets, args.seed)
+        brute, brute_hits = time_resolve(enemies, bullets, False, args.repeats)
+        grid, grid_hits = time_resolve(enemies, bullets, True, args.repeats)
+        if brute_hits != grid_hits:
+            raise SystemExit(f"grid and brute force disagree at {enemy_count} enemies")
+        print(
+            f"{enemy_count:>8} {brute * 1000:>10.3f} {grid * 1000:>10.3f} "
+            f"{brute / grid:>7.1f}x {len(grid_hits):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Scalar vs batched enemy AI: parity check and timing.
+
+Run from the legacy-python folder:
+
+    python benchmarks/bench_enemy_ai.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from game.entities.enemy import Enemy  # noqa: E402
+from game.physics import (  # noqa: E402
+    BEHAVIOR_IDS,
+    attach_body,
+    create_space,
+    remove_body,
+    step_space,
+    update_enemy_ai,
+    update_enemy_ai_batch,
+)
+
+ENEMY_COUNTS = (1000, 10000)
+DT = 1.0 / 120.0
+PLAYER_POS = (0.0, 0.0)
+
+
+def build_enemies(count: int, seed: int) -> tuple[object, list[Enemy]]:
+    rng = random.Random(seed)
+    space = create_space()
+    enemies: list[Enemy] = []
+    for _ in range(count):
+        radius = rng.choice((10.0, 12.0, 14.0, 16.0, 20.0))
+        enemy = Enemy(
+            x=rng.uniform(-900.0, 900.0),
+            y=rng.uniform(-900.0, 900.0),
+            speed=rng.uniform(12.0, 40.0),
+            hp=30.0,
+            damage=20.0,
+            sides=rng.choice((3, 4, 5, 6, 8)),
+            radius=radius,
+            behavior=rng.choice(tuple(BEHAVIOR_IDS)),
+            preferred_range=rng.uniform(120.0, 360.0),
+        )
+        attach_body(space, enemy, radius)
+        enemies.append(enemy)
+    # Exercise the distance cut-off as well.
+    enemies[0].body.position = (PLAYER_POS[0] + 0.05, PLAYER_POS[1])
+    return space, enemies
+
+
+def snapshot(enemies: list[Enemy]) -> list[tuple[float, ...]]:
+    return [
+        (
+            enemy.ai_clock,
+            enemy.body.velocity.x,
+            enemy.body.velocity.y,
+            enemy.body.angle,
+            enemy.body.position.x,
+            enemy.body.position.y,
+        )
+        for enemy in enemies
+    ]
+
+
+def check_parity(count: int, ticks: int, seed: int) -> None:
+    scalar_space, scalar = build_enemies(count, seed)
+    batch_space, batch = build_enemies(count, seed)
+    for tick in range(ticks):
+        if tick == ticks // 2:
+            # Removals reorder the space's body list; the batch path must not care.
+            for space, enemies in ((scalar_space, scalar), (batch_space, batch)):
+                for enemy in enemies[::7]:
+                    remove_body(space, enemy)
+            scalar = [enemy for enemy in scalar if enemy.body is not None]
+            batch = [enemy for enemy in batch if enemy.body is not None]
+        update_enemy_ai(scalar, PLAYER_POS, DT)
+        update_enemy_ai_batch(batch_space, batch, PLAYER_POS, DT)
+        step_space(scalar_space, DT)
+        step_space(batch_space, DT)
+        if snapshot(scalar) != snapshot(batch):
+            raise SystemExit(f"batched AI diverged from the scalar version at tick {tick}")
+
+
+def time_update(update: Callable[[tuple[float, float], float], None], repeats: int) -> float:
+    best = math.inf
+    for _ in range(repeats):
+        started = time.perf_counter()
+        update(PLAYER_POS, DT)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=240)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    check_parity(500, args.ticks, args.seed)
+    print(f"parity: identical over {args.ticks} ticks")
+    print(f"{'enemies':>8} {'scalar ms':>10} {'batch ms':>10} {'speedup':>8}")
+    for count in ENEMY_COUNTS:
+        space, enemies = build_enemies(count, args.seed)
+        scalar = time_update(lambda pos, dt: update_enemy_ai(enemies, pos, dt), args.repeats)
+        batch = time_update(
+            lambda pos, dt: update_enemy_ai_batch(space, enemies, pos, dt), args.repeats
+        )
+        print(f"{count:>8} {scalar * 1000:>10.3f} {batch * 1000:>10.3f} {scalar / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Vector environment throughput, in-process and across worker processes.
+
+Run from the legacy-python folder:
+
+    python benchmarks/bench_env.py --envs 16 --workers 4
+
+Both variants are stepped with the same random actions and must return the
+same observations, so the comparison doubles as a parity check.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np  # noqa: E402
+
+from game.env import SubprocVectorEnv, VectorEnv  # noqa: E402
+
+
+def drive(env: VectorEnv | SubprocVectorEnv, steps: int, seed: int) -> tuple[np.ndarray, float]:
+    """Step ``env`` with random firing actions; returns final observations and env-steps/s."""
+    rng = np.random.default_rng(seed)
+    observations, _ = env.reset(seed)
+    actions = rng.uniform(-1.0, 1.0, (steps, env.num_envs, env.action_size))
+    actions[:, :, 4] = 1.0
+    started = time.perf_counter()
+    for step in range(steps):
+        observations, *_ = env.step(actions[step])
+    elapsed = time.perf_counter() - started
+    return observations, steps * env.num_envs / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--envs", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--action-repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    with VectorEnv(args.envs, action_repeat=args.action_repeat) as env:
+        local, local_rate = drive(env, args.steps, args.seed)
+    with SubprocVectorEnv(args.envs, args.workers, action_repeat=args.action_repeat) as env:
+        remote, remote_rate = drive(env, args.steps, args.seed)
+    if not np.array_equal(local, remote):
+        raise SystemExit("subprocess observations differ from the in-process run")
+    print(f"parity: identical observations after {args.steps} steps of {args.envs} envs")
+    print(f"in-process           {local_rate:>10.0f} env-steps/s")
+    print(f"{args.workers} worker processes {remote_rate:>10.0f} env-steps/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""Fail when engine hot paths run slower than a stored baseline.
+
+Run from the legacy-python folder:
+
+    python benchmarks/gate.py                 # compare against the committed baseline
+    python benchmarks/gate.py --cpu 2         # pin to one core for steadier numbers
+    python benchmarks/gate.py --update        # re-record the baseline on this machine
+
+Both the baseline and each check are measured over several separate runs
+(--runs, 5 by default), and a benchmark's median is the median of its run
+medians; the baseline stores only those. Each benchmark is compared by the
+ratio of current to baseline median. The confidence interval on that ratio
+adds the run-to-run spread of the run medians to a bootstrap over the current
+samples, because a fresh run differs from the last one by more than its own
+samples suggest. A benchmark regresses when its ratio is past the threshold
+and the whole interval sits above 1.0; an interval above 1.0 with a smaller
+ratio is reported as slower.
+
+Shared or frequency-scaling machines drift by 10-20% between runs, which would
+swamp real changes. A fixed reference workload is sampled alongside the
+benchmarks, and current timings are rescaled by how much it moved unless
+--no-normalize is given. Baselines still only mean something on the machine
+that recorded them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import os
+import statistics
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from suite import Case, Op, environment, format_latency, run_suite, select_cases
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "gate.json"
+GATE_CASES = (
+    "collisions.resolve_bullet_hits",
+    "collisions.resolve_player_hits",
+    "collisions.resolve_rocket_hits",
+    "collisions.resolve_mine_hits",
+    "collisions.resolve_laser_hits",
+    "physics.update_enemy_ai",
+    "physics.update_enemy_ai_batch",
+    "draw.background",
+    "draw.stars",
+    "draw.nebulae",
+)
+REFERENCE_KEY = "reference.interpreter[1]"
+# The kernel release changes with routine updates and does not move timings.
+IGNORED_ENVIRONMENT = ("platform",)
+
+
+def setup_reference(_: float, seed: int) -> Op:
+    """Plain interpreter and allocator work whose cost only tracks machine speed."""
+    values = list(range(seed, seed + 2000))
+
+    def op() -> None:
+        table = {}
+        for value in values:
+            table[value & 255] = table.get(value & 255, 0) + value * value
+        sorted(table.values())
+
+    return op
+
+
+REFERENCE = Case("reference.interpreter", (1,), "loops", setup_reference, counted=False)
+
+
+def run_gate(cases: list[Case], runs: int, repeats: int, seed: int, warmup: int) -> dict[str, Any]:
+    """Run the suite ``runs`` times and merge the runs into one report.
+
+    Every run is rescaled to the median speed of the reference workload over
+    all runs, so machine drift between runs does not count as benchmark spread.
+    A result's median is the median of its run medians; its samples are pooled.
+    """
+    reports = [run_suite(cases, repeats, seed, warmup) for _ in range(runs)]
+    reference = statistics.median(report["results"][REFERENCE_KEY]["median_s"] for report in reports)
+    scales = [reference / report["results"][REFERENCE_KEY]["median_s"] for report in reports]
+    merged = reports[0]
+    for key, result in merged["results"].items():
+        run_medians = [report["results"][key]["median_s"] * scale for report, scale in zip(reports, scales)]
+        samples = [
+            seconds * scale
+            for report, scale in zip(reports, scales)
+            for seconds in report["results"][key]["samples_s"]
+        ]
+        median = statistics.median(run_medians)
+        # Throughput is units per second, so it moves inversely with the median.
+        result["throughput"] *= result["median_s"] / median
+        result["median_s"] = median
+        result["min_s"] = min(samples)
+        result["run_medians_s"] = run_medians
+        result["samples_s"] = samples
+    return merged
+
+
+def run_spread(result: dict[str, Any]) -> tuple[float, int]:
+    """Standard deviation of the log run medians and how many runs there were."""
+    run_medians = result.get("run_medians_s", [result["median_s"]])
+    if len(run_medians) < 2:
+        return 0.0, len(run_medians)
+    return statistics.stdev(math.log(seconds) for seconds in run_medians), len(run_medians)
+
+
+def bootstrap_log_se(samples: list[float], resamples: int, seed: int = 0) -> float:
+    """Bootstrap standard error of the log median of ``samples``."""
+    rng = np.random.default_rng(seed)
+    values = np.asarray(samples)
+    medians = np.median(rng.choice(values, (resamples, len(values))), axis=1)
+    return float(np.std(np.log(medians)))
+
+
+def ratio_interval(
+    current: dict[str, Any], baseline: dict[str, Any], scale: float, confidence: float, resamples: int
+) -> tuple[float, float, float]:
+    """Median ratio current/baseline and its confidence interval.
+
+    The log ratio's variance is the bootstrap variance of the current median
+    plus the between-run variance, once for the current runs and once for the
+    baseline runs. The between-run spread comes from the baseline, whose runs
+    were recorded for that purpose, or from the current runs if it has one run.
+    """
+    ratio = current["median_s"] * scale / baseline["median_s"]
+    within = bootstrap_log_se(current["samples_s"], resamples)
+    spread, baseline_runs = run_spread(baseline)
+    current_spread, current_runs = run_spread(current)
+    if baseline_runs < 2:
+        spread = current_spread
+    error = math.sqrt(within**2 + spread**2 * (1.0 / current_runs + 1.0 / baseline_runs))
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    return ratio, ratio * math.exp(-z * error), ratio * math.exp(z * error)
+
+
+def same_environment(recorded: dict[str, str], current: dict[str, str]) -> bool:
+    def strip(env: dict[str, str]) -> dict[str, str]:
+        return {key: value for key, value in env.items() if key not in IGNORED_ENVIRONMENT}
+
+    return strip(recorded) == strip(current)
+
+
+def classify(ratio: float, low: float, high: float, threshold: float) -> str:
+    if low > 1.0:
+        return "REGRESSED" if ratio > 1.0 + threshold else "slower"
+    if high < 1.0:
+        return "faster"
+    return "ok"
+
+
+def pin_cpu(cpu: int) -> None:
+    if not hasattr(os, "sched_setaffinity"):
+        raise SystemExit("--cpu needs os.sched_setaffinity (Linux)")
+    allowed = os.sched_getaffinity(0)
+    if cpu not in allowed:
+        raise SystemExit(f"--cpu {cpu} is not available; choose from {sorted(allowed)}")
+    os.sched_setaffinity(0, {cpu})
+
+
+def compare(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+    confidence: float,
+    resamples: int,
+    normalize: bool,
+) -> int:
+    """Print the per-benchmark table and return how many regressed."""
+    scale = 1.0
+    reference = baseline["results"].get(REFERENCE_KEY)
+    if normalize and reference is not None:
+        scale = reference["median_s"] / report["results"][REFERENCE_KEY]["median_s"]
+        print(f"machine speed vs baseline: {1.0 / scale - 1.0:+.1%} (timings rescaled)")
+    print(
+        f"{'benchmark':<44} {'baseline':>11} {'current':>11} {'change':>8} "
+        f"{f'{confidence:.0%} CI':>17} status"
+    )
+    regressions = 0
+    for key, result in report["results"].items():
+        if key == REFERENCE_KEY:
+            continue
+        old = baseline["results"].get(key)
+        if old is None:
+            print(f"{key:<44} {'-':>11} {format_latency(result['median_s']):>11} {'':>8} {'':>17} new")
+            continue
+        ratio, low, high = ratio_interval(result, old, scale, confidence, resamples)
+        status = classify(ratio, low, high, threshold)
+        regressions += status == "REGRESSED"
+        interval = f"[{low - 1.0:+.1%}, {high - 1.0:+.1%}]"
+        print(
+            f"{key:<44} {format_latency(old['median_s']):>11} "
+            f"{format_latency(result['median_s'] * scale):>11} {ratio - 1.0:>+7.1%} {interval:>17} {status}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update", action="store_true", help="record a new baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown, e.g. 0.10 for 10%%")
+    parser.add_argument("--filter", default="", help="only run gate cases whose name contains this")
+    parser.add_argument("--runs", type=int, default=5, help="separate suite runs to merge")
+    parser.add_argument("--repeats", type=int, default=30, help="timed samples per benchmark per run")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed calls before sampling")
+    parser.add_argument("--cpu", type=int, help="pin the process to this CPU core")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--resamples", type=int, default=2000, help="bootstrap resamples")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--no-normalize",
+        action="store_true",
+        help="compare raw timings instead of rescaling by the reference workload",
+    )
+    args = parser.parse_args()
+
+    if args.cpu is not None:
+        pin_cpu(args.cpu)
+    cases = [case for case in select_cases(args.filter) if case.name in GATE_CASES]
+    if not cases:
+        raise SystemExit(f"no gate benchmark matches {args.filter!r}")
+
+    baseline = None
+    if not args.update:
+        if not args.baseline.exists():
+            raise SystemExit(f"no baseline at {args.baseline}; record one with --update")
+        baseline = json.loads(args.baseline.read_text())
+        if not same_environment(baseline["environment"], environment()):
+            print("warning: baseline was recorded in a different environment", file=sys.stderr)
+
+    # Collector pauses land in random samples; keep them out of the timings.
+    gc.collect()
+    gc.disable()
+    try:
+        report = run_gate([REFERENCE, *cases], args.runs, args.repeats, args.seed, args.warmup)
+    finally:
+        gc.enable()
+    report["settings"] = {"runs": args.runs, "repeats": args.repeats, "warmup": args.warmup, "cpu": args.cpu}
+
+    if baseline is None:
+        # Comparisons only read the baseline's run medians, so its samples are not kept.
+        for result in report["results"].values():
+            del result["samples_s"]
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return
+
+    regressions = compare(
+        report, baseline, args.threshold, args.confidence, args.resamples, not args.no_normalize
+    )
+    if regressions:
+        raise SystemExit(f"{regressions} benchmark(s) regressed by more than {args.threshold:.0%}")
+    print("no regressions")
+
+
+if __name__ == "__main__":
+    main()
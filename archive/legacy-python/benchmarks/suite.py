@@ -0,0 +1,480 @@
+"""Hot-path benchmark suite with scaling curves and JSON baselines.
+
+Run from the legacy-python folder:
+
+    python benchmarks/suite.py --save benchmarks/baselines/local.json
+    python benchmarks/suite.py --compare benchmarks/baselines/local.json
+
+Each case is timed at several sizes (entity count, or zoom for the background
+draws) and reported as per-op latency and throughput in items per second.
+Draw cases render into a window under SDL's dummy video driver.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+import pymunk  # noqa: E402
+
+from bench_collisions import build_scene  # noqa: E402
+from bench_enemy_ai import build_enemies  # noqa: E402
+from game.entities.bullet import create_bullet_store  # noqa: E402
+from game.entities.enemy import Enemy  # noqa: E402
+from game.entities.mine import Mine  # noqa: E402
+from game.entities.player import Player  # noqa: E402
+from game.entities.rocket import Rocket  # noqa: E402
+from game.particles import ParticleSystem  # noqa: E402
+from game.physics import step_space, update_enemy_ai, update_enemy_ai_batch  # noqa: E402
+from game.policies import POLICIES, make_policy  # noqa: E402
+from game.settings import BULLET_SPEED  # noqa: E402
+from game.simulation import Simulation, default_loadout  # noqa: E402
+from game.spatial_hash import SpatialHash  # noqa: E402
+from game.systems import collisions, combat, fitting, save_system, telemetry, threat_board  # noqa: E402
+from game.systems.spawner import Spawner  # noqa: E402
+
+DT = 1.0 / 120.0
+# Shortest stretch timed as one sample; fast ops are looped until they fill it.
+MIN_SAMPLE_SECONDS = 0.002
+# Draw benchmarks cycle through PAN_VIEWS views PAN_STEP world units apart,
+# stepping PAN_STRIDE views per call; PAN_VIEWS is prime so every view is hit.
+# The pan is short enough that every view's chunks stay in the surface caches.
+PAN_VIEWS = 97
+PAN_STEP = 8.0
+PAN_STRIDE = 31
+
+Op = Callable[[], object]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    params: tuple[float, ...]
+    # What one op processes; throughput is reported in these per second.
+    unit: str
+    setup: Callable[[float, int], Op]
+    # Whether the param is the number of units per op (else each op is one unit).
+    counted: bool = True
+
+
+def _scene_enemies(count: int, seed: int, spread: float = 120.0) -> list[Enemy]:
+    rng = random.Random(seed)
+    half = math.sqrt(count) * spread / 2.0
+    return [
+        Enemy(
+            x=rng.uniform(-half, half),
+            y=rng.uniform(-half, half),
+            speed=20.0,
+            hp=1e12,
+            damage=20.0,
+            sides=rng.choice((3, 4, 5, 6, 8)),
+            radius=rng.choice((10.0, 12.0, 14.0, 16.0, 20.0)),
+        )
+        for _ in range(count)
+    ]
+
+
+def _grid_for(enemies: list[Enemy]) -> SpatialHash:
+    grid = SpatialHash()
+    grid.rebuild(enemies)
+    return grid
+
+
+def setup_bullet_hits(count: float, seed: int) -> Op:
+    enemies, bullets = build_scene(int(count), 256, seed)
+    grid = _grid_for(enemies)
+    player = Player(0.0, 0.0)
+    return lambda: collisions.resolve_bullet_hits(bullets, enemies, player, [], [], grid)
+
+
+def setup_player_hits(count: float, seed: int) -> Op:
+    # Packed tightly enough that the player overlaps a handful of enemies.
+    enemies = _scene_enemies(int(count), seed, spread=40.0)
+    grid = _grid_for(enemies)
+    player = Player(0.0, 0.0)
+    return lambda: collisions.resolve_player_hits(player, enemies, DT, grid)
+
+
+def setup_rocket_hits(count: float, seed: int) -> Op:
+    enemies = _scene_enemies(int(count), seed)
+    grid = _grid_for(enemies)
+    rng = random.Random(seed)
+    reach = math.sqrt(count) * 60.0
+    rockets = [
+        Rocket(
+            rng.uniform(-reach, reach), rng.uniform(-reach, reach), 0.0, 0.0, 1e6, 1e6, 1.0, 40.0, 80.0
+        )
+        for _ in range(64)
+    ]
+    player = Player(0.0, 0.0)
+    return lambda: collisions.resolve_rocket_hits(rockets, enemies, player, [], [], grid)
+
+
+def setup_mine_hits(count: float, seed: int) -> Op:
+    enemies = _scene_enemies(int(count), seed)
+    grid = _grid_for(enemies)
+    rng = random.Random(seed)
+    reach = math.sqrt(count) * 60.0
+    mines = [
+        Mine(rng.uniform(-reach, reach), rng.uniform(-reach, reach), 1.0, 60.0, 90.0, 40.0)
+        for _ in range(64)
+    ]
+    player = Player(0.0, 0.0)
+    return lambda: collisions.resolve_mine_hits(mines, enemies, player, [], [], grid)
+
+
+def setup_laser_hits(count: float, seed: int) -> Op:
+    enemies = _scene_enemies(int(count), seed)
+    grid = _grid_for(enemies)
+    player = Player(0.0, 0.0)
+    end = (math.sqrt(count) * 60.0, 0.0)
+    return lambda: collisions.resolve_laser_hits(
+        player, enemies, (0.0, 0.0), end, 10.0, 4.0, [], [], grid
+    )
+
+
+def setup_enemy_ai(count: float, seed: int) -> Op:
+    _, enemies = build_enemies(int(count), seed)
+    return lambda: update_enemy_ai(enemies, (0.0, 0.0), DT)
+
+
+def setup_enemy_ai_batch(count: float, seed: int) -> Op:
+    space, enemies = build_enemies(int(count), seed)
+    return lambda: update_enemy_ai_batch(space, enemies, (0.0, 0.0), DT)
+
+
+def setup_step_space(count: float, seed: int) -> Op:
+    space, _ = build_enemies(int(count), seed)
+    return lambda: step_space(space, DT)
+
+
+def setup_update_bullets(count: float, seed: int) -> Op:
+    rng = np.random.default_rng(seed)
+    bullets = create_bullet_store(int(count))
+    for _ in range(int(count)):
+        bullets.spawn()
+    bullets["vx"][:] = rng.uniform(-900.0, 900.0, len(bullets))
+    bullets["vy"][:] = rng.uniform(-900.0, 900.0, len(bullets))
+    bullets["ttl"][:] = 1e9
+    return lambda: combat.update_bullets(bullets, DT)
+
+
+def setup_spawner(count: float, seed: int) -> Op:
+    spawner = Spawner(random.Random(seed))
+    spawner.max_enemies = int(count) + 1
+    interval = spawner._get_schedule(600.0)[0]
+    enemies: list[Enemy] = []
+
+    def op() -> None:
+        # One call that spawns ``count`` enemies into an empty field.
+        enemies.clear()
+        spawner.spawn_timer = 0.0
+        spawner.update(interval * count, 600.0, enemies, (0.0, 0.0))
+
+    return op
+
+
+def setup_ship_stats(count: float, seed: int) -> Op:
+    ship, modules, _ = default_loadout()
+    rng = random.Random(seed)
+    module_ids = sorted(modules)
+    equipment = {f"slot_{i}": rng.choice(module_ids) for i in range(int(count))}
+    return lambda: fitting.calculate_ship_stats(ship, modules, equipment)
+
+
+_game: Any = None
+
+
+def _policy_tick(name: str) -> Callable[[float, int], Op]:
+    """One decision of a scripted pilot facing ``count`` enemies."""
+
+    def setup(count: float, seed: int) -> Op:
+        sim = Simulation()
+        sim.reset(*default_loadout(), seed)
+        sim.enemies = _scene_enemies(int(count), seed)
+        sim.current_threats = threat_board.collect_threats(sim.enemies, sim.player.pos)
+        policy = make_policy(name)
+        policy.reset(sim)
+        return lambda: policy(sim)
+
+    return setup
+
+
+def _get_game() -> Any:
+    """One shared Game in PLAY state; its save and telemetry go to a temp dir."""
+    global _game
+    if _game is None:
+        scratch = Path(tempfile.mkdtemp(prefix="bench-"))
+        save_system.SAVE_PATH = scratch / "save_data.json"
+        telemetry.TELEMETRY_PATH = scratch / "run_telemetry.jsonl"
+        from game.world import Game
+
+        _game = Game()
+        _game.restart()
+    return _game
+
+
+def _panning_draw(draw_name: str) -> Callable[[float, int], Op]:
+    """Draw at a zoom level from a fixed set of views along a short diagonal pan.
+
+    The views are visited in a scrambled cycle rather than one drift, so any
+    run of calls sees the same mix of views however many calls a sample takes;
+    otherwise the calibrated loop count decides how far the camera travels and
+    how many chunk bakes land in each sample.
+    """
+
+    def setup(zoom: float, seed: int) -> Op:
+        game = _get_game()
+        game.sim.rng.cosmetic.seed(seed)
+        draw = getattr(game, draw_name)
+        views = [(index * PAN_STEP, index * PAN_STEP * 0.5) for index in range(PAN_VIEWS)]
+        cursor = [0]
+
+        def op() -> None:
+            # The game is shared between cases, so claim its zoom every call.
+            game.sim.zoom = zoom
+            cursor[0] = (cursor[0] + PAN_STRIDE) % PAN_VIEWS
+            cam_x, cam_y = views[cursor[0]]
+            draw(cam_x, cam_y, 0.0, 0.0)
+
+        # Bake every view so samples time drawing, not the first pass of chunk bakes.
+        for _ in range(PAN_VIEWS):
+            op()
+        return op
+
+    return setup
+
+
+def setup_draw_particles(count: float, seed: int) -> Op:
+    game = _get_game()
+    particles = ParticleSystem(int(count), np.random.default_rng(seed))
+    width, height = game.screen.get_size()
+    n = int(count)
+    rng = particles.rng
+    particles.emit(
+        rng.uniform(0.0, width, n),
+        rng.uniform(0.0, height, n),
+        np.zeros(n),
+        np.zeros(n),
+        np.full(n, 1e9),
+        rng.uniform(1.0, 3.0, n),
+        (255, 180, 90),
+    )
+
+    def op() -> None:
+        game.sim.zoom = 1.0
+        game.sim.particles = particles
+        game._draw_particles(0.0, 0.0, 0.0, 0.0, game._get_view_rect(0.0, 0.0))
+
+    return op
+
+
+def setup_draw_bullets(count: float, seed: int) -> Op:
+    game = _get_game()
+    width, height = game.screen.get_size()
+    bullets = create_bullet_store()
+    n = int(count)
+    rng = np.random.default_rng(seed)
+    xs = rng.uniform(0.0, width, n)
+    ys = rng.uniform(0.0, height, n)
+    heading = rng.uniform(0.0, math.tau, n)
+    step = BULLET_SPEED * DT
+    bullets.spawn_many(
+        x=xs,
+        y=ys,
+        prev_x=xs - np.cos(heading) * step,
+        prev_y=ys - np.sin(heading) * step,
+        ttl=np.full(n, 1e9),
+    )
+
+    def op() -> None:
+        game.sim.zoom = 1.0
+        game.sim.bullets = bullets
+        game._draw_bullets(0.0, 0.0, 0.0, 0.0, game._get_view_rect(0.0, 0.0))
+
+    return op
+
+
+def setup_draw_enemies(count: float, seed: int) -> Op:
+    game = _get_game()
+    width, height = game.screen.get_size()
+    enemies = _scene_enemies(int(count), seed)
+    rng = random.Random(seed)
+    for enemy in enemies:
+        enemy.x = enemy.prev_x = rng.uniform(0.0, width)
+        enemy.y = enemy.prev_y = rng.uniform(0.0, height)
+
+    def op() -> None:
+        game.sim.zoom = 1.0
+        game.sim.enemies = enemies
+        game._draw_enemies(0.0, 0.0, 0.0, 0.0, game._get_view_rect(0.0, 0.0))
+
+    return op
+
+
+ENEMY_COUNTS = (100, 1000, 5000)
+ZOOMS = (1.0, 0.5, 0.25)
+
+CASES: tuple[Case, ...] = (
+    Case("collisions.resolve_bullet_hits", ENEMY_COUNTS, "enemies", setup_bullet_hits),
+    Case("collisions.resolve_player_hits", ENEMY_COUNTS, "enemies", setup_player_hits),
+    Case("collisions.resolve_rocket_hits", ENEMY_COUNTS, "enemies", setup_rocket_hits),
+    Case("collisions.resolve_mine_hits", ENEMY_COUNTS, "enemies", setup_mine_hits),
+    Case("collisions.resolve_laser_hits", ENEMY_COUNTS, "enemies", setup_laser_hits),
+    Case("physics.update_enemy_ai", ENEMY_COUNTS, "enemies", setup_enemy_ai),
+    Case("physics.update_enemy_ai_batch", ENEMY_COUNTS, "enemies", setup_enemy_ai_batch),
+    Case("physics.step_space", ENEMY_COUNTS, "bodies", setup_step_space),
+    Case("combat.update_bullets", (256, 4096, 65536), "bullets", setup_update_bullets),
+    Case("spawner.Spawner.update", (1, 16, 256), "spawns", setup_spawner),
+    Case("fitting.calculate_ship_stats", (4, 16, 64), "modules", setup_ship_stats),
+    *(
+        Case(f"policies.{name}", (10, 100, 1000), "ticks", _policy_tick(name), counted=False)
+        for name in POLICIES
+    ),
+    Case("draw.background", ZOOMS, "frames", _panning_draw("_draw_background"), counted=False),
+    Case("draw.stars", ZOOMS, "frames", _panning_draw("_draw_stars"), counted=False),
+    Case("draw.nebulae", ZOOMS, "frames", _panning_draw("_draw_nebulae"), counted=False),
+    Case("draw.particles", (256, 1024, 4096), "particles", setup_draw_particles),
+    Case("draw.bullets", (256, 1024, 4096), "bullets", setup_draw_bullets),
+    Case("draw.enemies", ENEMY_COUNTS, "enemies", setup_draw_enemies),
+)
+
+
+def result_key(name: str, param: float) -> str:
+    return f"{name}[{param:g}]"
+
+
+def calibrate(op: Op, warmup: int = 1) -> int:
+    """How many calls of ``op`` fill one sample of at least MIN_SAMPLE_SECONDS."""
+    for _ in range(warmup):
+        op()
+    number = 1
+    while number < 1 << 16:
+        if sample(op, number) * number >= MIN_SAMPLE_SECONDS:
+            break
+        number *= 2
+    return number
+
+
+def sample(op: Op, number: int) -> float:
+    """Mean seconds per call over ``number`` back-to-back calls."""
+    started = time.perf_counter()
+    for _ in range(number):
+        op()
+    return (time.perf_counter() - started) / number
+
+
+def select_cases(pattern: str) -> list[Case]:
+    return [case for case in CASES if pattern in case.name]
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "system": platform.system(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+        "pymunk": pymunk.version,
+    }
+
+
+def run_suite(cases: list[Case], repeats: int, seed: int, warmup: int = 1) -> dict[str, Any]:
+    """Time every case at every param.
+
+    Samples are taken round-robin, one per benchmark per round, so slow drift
+    in machine speed spreads across all of a benchmark's samples instead of
+    shifting a few benchmarks wholesale.
+    """
+    benchmarks = []
+    for case in cases:
+        for param in case.params:
+            op = case.setup(param, seed)
+            benchmarks.append((case, param, op, calibrate(op, warmup)))
+    samples: list[list[float]] = [[] for _ in benchmarks]
+    for _ in range(repeats):
+        for timings, (_, _, op, number) in zip(samples, benchmarks):
+            timings.append(sample(op, number))
+
+    results: dict[str, dict[str, Any]] = {}
+    for timings, (case, param, _, _) in zip(samples, benchmarks):
+        median = statistics.median(timings)
+        results[result_key(case.name, param)] = {
+            "case": case.name,
+            "param": param,
+            "unit": case.unit,
+            "median_s": median,
+            "min_s": min(timings),
+            "throughput": (param if case.counted else 1.0) / median,
+            "samples_s": timings,
+        }
+    return {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "environment": environment(), "results": results}
+
+
+def format_latency(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+
+def print_report(report: dict[str, Any], baseline: dict[str, Any] | None = None) -> None:
+    header = f"{'benchmark':<44} {'latency':>11} {'throughput':>20}"
+    if baseline is not None:
+        header += f" {'baseline':>11} {'change':>8}"
+    print(header)
+    old_results = baseline["results"] if baseline is not None else {}
+    for key, result in report["results"].items():
+        line = (
+            f"{key:<44} {format_latency(result['median_s']):>11} "
+            f"{result['throughput']:>12.4g} {result['unit'] + '/s':<7}"
+        )
+        old = old_results.get(key)
+        if old is not None:
+            change = result["median_s"] / old["median_s"] - 1.0
+            line += f" {format_latency(old['median_s']):>11} {change:>+7.1%}"
+        elif baseline is not None:
+            line += f" {'-':>11} {'new':>8}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--repeats", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save", type=Path, help="write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to diff against")
+    args = parser.parse_args()
+
+    cases = select_cases(args.filter)
+    if not cases:
+        raise SystemExit(f"no benchmark matches {args.filter!r}")
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    report = run_suite(cases, args.repeats, args.seed)
+    print_report(report, baseline)
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"saved {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Monte Carlo balance runs: many headless rounds across a process pool.
+
+Each run gets its own seed, a scripted pilot from ``game.policies`` and either the starter fit or a
+random legal one, and is written as a ``run_telemetry.jsonl`` record with an
+extra ``pilot`` field. Survival time, kills, data and hull damage are then
+summarised per group, so edits to the spawner schedule or enemy profiles can
+be compared without hand-playing them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from game import settings
+from game.policies import POLICIES, make_policy
+from game.simulation import Simulation, default_loadout
+from game.systems import fitting, telemetry
+
+DEFAULT_OUT = telemetry.TELEMETRY_PATH.parent / "balance_telemetry.jsonl"
+METRICS = ("survival_time", "kills", "data_earned", "hull_damage")
+GROUP_KEYS = ("pilot", "ship_id", "primary_weapon", "secondary_weapon")
+
+
+def random_equipment(
+    ship: dict[str, Any], modules: dict[str, dict[str, Any]], rng: random.Random
+) -> dict[str, str]:
+    """Any module that fits each slot, ignoring what a save has unlocked."""
+    equipment: dict[str, str] = {}
+    for slot in ship.get("slots", []):
+        compatible = fitting.compatible_modules_for_slot(modules, set(modules), slot)
+        if compatible:
+            equipment[str(slot["id"])] = rng.choice(compatible)
+    return equipment
+
+
+# Per-worker state, built once by _init_worker so tasks only carry ids and seeds.
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(ship_id: str, effects: bool) -> None:
+    sim = Simulation()
+    sim.effects_enabled = effects
+    ship, modules, equipment = default_loadout(ship_id)
+    _worker.update(sim=sim, ship=ship, modules=modules, starter_equipment=equipment)
+
+
+def run_one(task: tuple[int, int, str, str, bool, float]) -> tuple[int, dict[str, Any]]:
+    """Play one seeded run; returns its index and telemetry record."""
+    index, seed, pilot_name, ship_id, random_fit, dt = task
+    sim: Simulation = _worker["sim"]
+    ship = _worker["ship"]
+    modules = _worker["modules"]
+    if random_fit:
+        equipment = random_equipment(ship, modules, random.Random(seed))
+    else:
+        equipment = _worker["starter_equipment"]
+    sim.reset(ship, modules, equipment, seed)
+    policy = make_policy(pilot_name)
+    policy.reset(sim)
+    sim.run(policy, dt)
+    entry = sim.telemetry_entry(index + 1, 0.0, ship_id, equipment)
+    entry["pilot"] = pilot_name
+    return index, entry
+
+
+def summarize(entries: list[dict[str, Any]], group_key: str) -> None:
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for entry in entries:
+        groups.setdefault(str(entry[group_key]), []).append(entry)
+    for name, group in sorted(groups.items()):
+        outcomes: dict[str, int] = {}
+        for entry in group:
+            outcomes[entry["outcome"]] = outcomes.get(entry["outcome"], 0) + 1
+        shares = ", ".join(f"{outcome} {count / len(group):.0%}" for outcome, count in sorted(outcomes.items()))
+        print(f"{group_key}={name}: {len(group)} runs ({shares})")
+        print(f"  {'metric':<14} {'mean':>9} {'p10':>9} {'p50':>9} {'p90':>9} {'max':>9}")
+        for metric in METRICS:
+            values = np.array([float(entry[metric]) for entry in group])
+            p10, p50, p90 = np.percentile(values, (10, 50, 90))
+            print(
+                f"  {metric:<14} {values.mean():>9.2f} {p10:>9.2f} {p50:>9.2f} {p90:>9.2f} {values.max():>9.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=len(os.sched_getaffinity(0)), help="worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first run; run i uses seed + i")
+    parser.add_argument("--pilots", default=",".join(POLICIES), help="comma-separated policies, used round-robin")
+    parser.add_argument("--ship", default="", help="ship id from ships.json")
+    parser.add_argument("--random-fits", action="store_true", help="fit a random legal module to every slot")
+    parser.add_argument("--hz", type=float, default=settings.SIM_HZ, help="simulation steps per second")
+    parser.add_argument("--effects", action="store_true", help="also simulate cosmetic particles")
+    parser.add_argument("--group-by", choices=GROUP_KEYS, default="pilot")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="telemetry file to overwrite")
+    args = parser.parse_args()
+
+    pilots = [name for name in args.pilots.split(",") if name]
+    unknown = [name for name in pilots if name not in POLICIES]
+    if unknown or not pilots:
+        raise SystemExit(f"unknown pilot(s) {unknown}; choose from {', '.join(POLICIES)}")
+    ships = fitting.load_ships()
+    ship_id = args.ship if args.ship in ships else next(iter(ships), "")
+    tasks = [
+        (index, args.seed + index, pilots[index % len(pilots)], ship_id, args.random_fits, 1.0 / args.hz)
+        for index in range(args.runs)
+    ]
+
+    entries: list[dict[str, Any]] = [{}] * args.runs
+    sim_seconds = 0.0
+    started = time.perf_counter()
+    # Runs share nothing and return a small dict, so throughput scales with workers.
+    with multiprocessing.Pool(args.workers, _init_worker, (ship_id, args.effects)) as pool:
+        for done, (index, entry) in enumerate(pool.imap_unordered(run_one, tasks), 1):
+            entries[index] = entry
+            sim_seconds += entry["survival_time"]
+            if done % max(1, args.runs // 20) == 0 or done == args.runs:
+                print(f"\r{done}/{args.runs} runs", end="", flush=True)
+    wall_time = time.perf_counter() - started
+    print(
+        f"\n{args.runs} runs on {args.workers} workers in {wall_time:.1f}s "
+        f"({args.runs / wall_time:.1f} runs/s, {sim_seconds / wall_time:.0f}x realtime)"
+    )
+
+    # As if one pilot had flown every run in order.
+    total_data_gb = 0.0
+    for entry in entries:
+        total_data_gb = round(total_data_gb + entry["data_earned"], 2)
+        entry["total_data_gb"] = total_data_gb
+    telemetry.write_run_telemetry(entries, args.out, append=False)
+    print(f"telemetry written to {args.out}")
+    summarize(entries, args.group_by)
+
+
+if __name__ == "__main__":
+    main()
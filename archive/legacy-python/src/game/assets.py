@@ -2,9 +2,11 @@
 
 import pygame
 
+from game.text_cache import get_font
+
 
 def load_fonts() -> tuple[pygame.font.Font, pygame.font.Font]:
     return (
-        pygame.font.SysFont("consolas", 20),
-        pygame.font.SysFont("consolas", 48),
+        get_font("consolas", 20),
+        get_font("consolas", 48),
     )
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import pygame
 
+from game.text_cache import render_text
+
 
 class Cutscene:
     def __init__(
@@ -72,13 +74,13 @@ class Cutscene:
             if not line:
                 y_offset += font.get_height() + self.line_spacing
                 continue
-            text_surface = font.render(line, True, color)
+            text_surface = render_text(font, line, True, color)
             text_rect = text_surface.get_rect(center=(width // 2, y_offset))
             screen.blit(text_surface, text_rect)
             y_offset += font.get_height() + self.line_spacing
 
         prompt_text = "Press SPACE to continue" if self.finished else "Press SPACE to skip"
-        prompt = font.render(prompt_text, True, prompt_color)
+        prompt = render_text(font, prompt_text, True, prompt_color)
         prompt_rect = prompt.get_rect(center=(width // 2, height - self.padding // 2))
         screen.blit(prompt, prompt_rect)
 
@@ -2,24 +2,48 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pygame
 
+from game.profiler import profiler
+from game.settings import FPS
+from game.text_cache import get_font, render_text, text_cache
+
+MODES = ("tuning", "preset", "profiler")
+
+# Stacked frame-time graph: one column per recorded frame, full height = two frame budgets.
+GRAPH_SIZE = (480, 100)
+GRAPH_SCALE_MS = 2000.0 / FPS
+# Percentile table refresh interval, in recorded frames.
+STATS_REFRESH_FRAMES = 30
+SCOPE_COLORS = np.array(
+    [
+        (90, 170, 255),
+        (255, 140, 60),
+        (120, 230, 120),
+        (240, 90, 110),
+        (200, 120, 255),
+        (255, 220, 80),
+        (80, 220, 220),
+        (255, 120, 200),
+        (170, 200, 90),
+        (150, 150, 255),
+    ],
+    dtype=np.uint8,
+)
+UNTRACKED_COLOR = (90, 90, 100)
+GRAPH_BG_COLOR = (12, 12, 20)
+
 
 class DebugOverlay:
     def __init__(self, game: object) -> None:
         self.game = game
         self.active = False
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
-
-        self.params: dict[str, float | bool] = {
-            "player_thrust_power": 73.125,
-            "player_strafe_power": 64.35,
-            "player_max_speed": 56.25,
-            "player_drift_factor": 0.992,
-            "enemy_speed": 19.40625,
-            "collision_enabled": True,
-        }
+        self.font = get_font(None, 24)
+        self.small_font = get_font(None, 18)
+
+        # Shared with the simulation, which applies them every tick.
+        self.params: dict[str, float | bool] = game.sim.tuning
 
         self.presets: dict[int, dict[str, float | str]] = {
             1: {
@@ -62,21 +86,32 @@ class DebugOverlay:
         self.selected_index = 0
         self.param_keys = list(self.params.keys())
         self.mode = "tuning"
+        self._stats: dict[str, tuple[float, float, float]] = {}
+        self._stats_frame = -STATS_REFRESH_FRAMES
+        self._table: pygame.Surface | None = None
 
     def toggle(self) -> None:
         self.active = not self.active
+        self._sync_profiler()
+
+    def _sync_profiler(self) -> None:
+        # Timing costs a little per scope, so only collect while the page is visible.
+        profiler.set_enabled(self.active and self.mode == "profiler")
 
     def handle_input(self, event: pygame.event.Event) -> bool:
         if not self.active or event.type != pygame.KEYDOWN:
             return False
 
         if event.key == pygame.K_TAB:
-            self.mode = "preset" if self.mode == "tuning" else "tuning"
+            self.mode = MODES[(MODES.index(self.mode) + 1) % len(MODES)]
+            self._sync_profiler()
             return True
 
         if self.mode == "tuning":
             return self._handle_tuning_input(event)
-        return self._handle_preset_input(event)
+        if self.mode == "preset":
+            return self._handle_preset_input(event)
+        return False
 
     def _handle_tuning_input(self, event: pygame.event.Event) -> bool:
         if event.key == pygame.K_UP:
@@ -157,37 +192,31 @@ class DebugOverlay:
             print("    },")
         print("}\n")
 
-    def apply_to_game(self) -> None:
-        player = getattr(self.game, "player", None)
-        if player is not None:
-            player.debug_thrust_power = float(self.params["player_thrust_power"])
-            player.debug_strafe_power = float(self.params["player_strafe_power"])
-            player.debug_max_speed = float(self.params["player_max_speed"])
-            player.debug_drift_factor = float(self.params["player_drift_factor"])
-
-        for enemy in getattr(self.game, "enemies", []):
-            enemy.speed = float(self.params["enemy_speed"])
-
     def draw(self, screen: pygame.Surface) -> None:
         if not self.active:
             return
-        overlay = pygame.Surface((520, 370), pygame.SRCALPHA)
+        size = (620, 400) if self.mode == "profiler" else (520, 370)
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
         overlay.fill((20, 20, 30, 210))
         screen.blit(overlay, (10, 10))
 
-        screen.blit(self.font.render("DEBUG MODE (F3)", True, (255, 255, 0)), (20, 20))
-        mode_text = self.small_font.render(
+        screen.blit(render_text(self.font, "DEBUG MODE (F3)", True, (255, 255, 0)), (20, 20))
+        mode_text = render_text(
+            self.small_font,
             f"Mode: {self.mode.upper()} (TAB to switch)", True, (100, 200, 255)
         )
         screen.blit(mode_text, (20, 45))
 
         if self.mode == "tuning":
             self._draw_tuning_mode(screen)
-        else:
+        elif self.mode == "preset":
             self._draw_preset_mode(screen)
+        else:
+            self._draw_profiler_mode(screen)
 
     def _draw_tuning_mode(self, screen: pygame.Surface) -> None:
-        instructions = self.small_font.render(
+        instructions = render_text(
+            self.small_font,
             "↑/↓: Select | ←/→: Adjust | [/]: Fast | C: Toggle collision",
             True,
             (150, 150, 150),
@@ -204,13 +233,14 @@ class DebugOverlay:
                 value_str = f"{value:.3f}"
             else:
                 value_str = str(value)
-            screen.blit(self.font.render(f"{key}: {value_str}", True, color), (30, y))
+            screen.blit(render_text(self.font, f"{key}: {value_str}", True, color), (30, y))
             if i == self.selected_index:
-                screen.blit(self.font.render(">", True, (255, 255, 0)), (15, y))
+                screen.blit(render_text(self.font, ">", True, (255, 255, 0)), (15, y))
             y += 30
 
         enabled = bool(self.params["collision_enabled"])
-        collision_status = self.small_font.render(
+        collision_status = render_text(
+            self.small_font,
             f"Collisions: {'ON' if enabled else 'OFF'}",
             True,
             (100, 255, 100) if enabled else (255, 100, 100),
@@ -218,7 +248,8 @@ class DebugOverlay:
         screen.blit(collision_status, (20, 340))
 
     def _draw_preset_mode(self, screen: pygame.Surface) -> None:
-        instructions = self.small_font.render(
+        instructions = render_text(
+            self.small_font,
             "1-5: Load preset | S: Save to slot 5 | P: Print to console",
             True,
             (150, 150, 150),
@@ -229,8 +260,9 @@ class DebugOverlay:
         for num in sorted(self.presets.keys()):
             preset = self.presets[num]
             color = (150, 255, 150) if num >= 5 else (200, 200, 200)
-            screen.blit(self.font.render(f"{num}: {preset['name']}", True, color), (30, y))
-            stats = self.small_font.render(
+            screen.blit(render_text(self.font, f"{num}: {preset['name']}", True, color), (30, y))
+            stats = render_text(
+                self.small_font,
                 "Thrust:{:.1f} Strafe:{:.1f} Max:{:.1f} Drift:{:.3f}".format(
                     float(preset["player_thrust_power"]),
                     float(preset["player_strafe_power"]),
@@ -242,3 +274,90 @@ class DebugOverlay:
             )
             screen.blit(stats, (50, y + 20))
             y += 50
+
+    def _draw_profiler_mode(self, screen: pygame.Surface) -> None:
+        samples, totals = profiler.recent()
+        graph_rect = pygame.Rect((20, 70), GRAPH_SIZE)
+        screen.blit(self._build_graph(samples, totals), graph_rect)
+        budget_y = graph_rect.bottom - int(GRAPH_SIZE[1] * (1000.0 / FPS) / GRAPH_SCALE_MS)
+        pygame.draw.line(
+            screen, (255, 255, 0), (graph_rect.left, budget_y), (graph_rect.right - 1, budget_y)
+        )
+
+        if profiler.frame_count - self._stats_frame >= STATS_REFRESH_FRAMES:
+            self._stats = profiler.percentiles()
+            self._stats_frame = profiler.frame_count
+            self._table = self._build_table()
+        if self._table is not None:
+            screen.blit(self._table, (20, 176))
+
+    def _build_table(self) -> pygame.Surface:
+        """Counts and percentile rows, rendered once per stats refresh.
+
+        These strings change nearly every frame, so they bypass the shared text
+        cache instead of churning it.
+        """
+        table = pygame.Surface((600, 240), pygame.SRCALPHA)
+        font = self.small_font
+        sim = self.game.sim
+        culled = self.game.cull_counts
+        counts = " | ".join(
+            f"{label}: {culled[key][0]}/{culled[key][1]} drawn" if key in culled else f"{label}: {total}"
+            for label, key, total in (
+                ("Enemies", "enemies", len(sim.enemies)),
+                ("Bullets", "bullets", len(sim.bullets)),
+                ("Particles", "particles", len(sim.particles)),
+            )
+        )
+        table.blit(font.render(counts, True, (150, 150, 150)), (0, 0))
+        frame = self._stats.get("frame")
+        if frame is not None:
+            summary = f"frame ms  p50 {frame[0]:.2f}  p95 {frame[1]:.2f}  p99 {frame[2]:.2f}"
+            table.blit(font.render(summary, True, (255, 255, 255)), (0, 18))
+
+        names = [name for name in profiler.names if name in self._stats]
+        rows = max(1, (len(names) + 1) // 2)
+        for i, name in enumerate(names):
+            x = (i // rows) * 300
+            y = 40 + (i % rows) * 16
+            color = SCOPE_COLORS[profiler.names.index(name) % len(SCOPE_COLORS)]
+            pygame.draw.rect(table, color.tolist(), (x, y + 3, 8, 8))
+            p50, p95, p99 = self._stats[name]
+            row = f"{name:<16} {p50:5.2f} {p95:5.2f} {p99:5.2f}"
+            table.blit(font.render(row, True, (200, 200, 200)), (x + 14, y))
+
+        caches = "text {entries} ({hits} hits, {misses} misses)".format(**text_cache.stats())
+        caches += f" | star surfaces {len(self.game.star_surfaces)}"
+        caches += f" | nebula surfaces {len(self.game.nebula_surfaces)}"
+        table.blit(font.render(caches, True, (150, 150, 150)), (0, 200))
+        sprites = (
+            f"sprites: enemy {len(self.game.enemy_sprites)} | hull {len(self.game.hull_renderer)} | "
+            f"bullet {len(self.game.bullet_sprites)} | grid tiles {len(self.game.grid_tiles)}"
+        )
+        table.blit(font.render(sprites, True, (150, 150, 150)), (0, 216))
+        return table
+
+    def _build_graph(self, samples: np.ndarray, totals: np.ndarray) -> pygame.Surface:
+        """Stacked per-scope bars, newest frame on the right, drawn as one pixel array."""
+        frames = profiler.history
+        width, height = frames, GRAPH_SIZE[1]
+        scopes = samples.shape[1]
+        # Time spent outside any scope (event handling, the frame cap) stacks on top.
+        untracked = np.maximum(totals - samples.sum(axis=1), 0.0)
+        tops = np.cumsum(np.column_stack((samples, untracked)), axis=1)
+        # Pixel row (from the bottom) where each segment ends; a row's layer is the
+        # number of segment tops at or below it.
+        top_rows = np.clip(np.ceil(tops * (height / GRAPH_SCALE_MS) - 0.5), 0, height)
+        offsets = np.arange(len(tops))[:, None] * (height + 1)
+        ends = np.bincount(
+            (top_rows.astype(np.intp) + offsets).ravel(), minlength=len(tops) * (height + 1)
+        )
+        layer = np.cumsum(ends.reshape(len(tops), height + 1)[:, :height], axis=1)[:, ::-1]
+
+        # An 8-bit surface whose palette maps layer index to scope colour.
+        pixels = np.full((width, height), scopes + 1, dtype=np.uint8)
+        pixels[width - len(layer) :] = layer
+        graph = pygame.surfarray.make_surface(pixels)
+        palette = [tuple(SCOPE_COLORS[i % len(SCOPE_COLORS)]) for i in range(scopes)]
+        graph.set_palette(palette + [UNTRACKED_COLOR, GRAPH_BG_COLOR])
+        return pygame.transform.scale(graph, GRAPH_SIZE)
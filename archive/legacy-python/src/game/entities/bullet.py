@@ -1,5 +1,21 @@
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from game.entities.store import ComponentStore
+
+# Live bullets are stored column-wise; Bullet is only the record a weapon fires.
+BULLET_COLUMNS = {
+    "x": np.float64,
+    "y": np.float64,
+    "vx": np.float64,
+    "vy": np.float64,
+    "ttl": np.float64,
+    "damage": np.float64,
+    "prev_x": np.float64,
+    "prev_y": np.float64,
+}
+
 
 @dataclass
 class Bullet:
@@ -19,3 +35,20 @@ class Bullet:
     def __post_init__(self) -> None:
         self.prev_x = self.x
         self.prev_y = self.y
+
+
+def create_bullet_store(capacity: int = 256) -> ComponentStore:
+    return ComponentStore(BULLET_COLUMNS, capacity)
+
+
+def spawn_bullet(store: ComponentStore, bullet: Bullet) -> int:
+    return store.spawn(
+        x=bullet.x,
+        y=bullet.y,
+        vx=bullet.vx,
+        vy=bullet.vy,
+        ttl=bullet.ttl,
+        damage=bullet.damage,
+        prev_x=bullet.prev_x,
+        prev_y=bullet.prev_y,
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,9 +19,17 @@ class Enemy:
     is_boss: bool = False
     behavior: str = "rush"
     preferred_range: float = 240.0
+    ai_clock: float = 0.0
     body: pymunk.Body | None = None
     shape: pymunk.Shape | None = None
+    body_id: int = 0
+    prev_x: float = field(init=False)
+    prev_y: float = field(init=False)
 
     @property
     def pos(self) -> tuple[float, float]:
         return (self.x, self.y)
+
+    def __post_init__(self) -> None:
+        self.prev_x = self.x
+        self.prev_y = self.y
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from game.settings import PLAYER_FUEL_START, PLAYER_MAX_HP, PLAYER_SPEED
@@ -34,10 +34,17 @@ class Player:
     damage_dealt: int = 0
     body: pymunk.Body | None = None
     shape: pymunk.Shape | None = None
+    body_id: int = 0
+    prev_x: float = field(init=False)
+    prev_y: float = field(init=False)
 
     @property
     def pos(self) -> tuple[float, float]:
         return (self.x, self.y)
 
+    def __post_init__(self) -> None:
+        self.prev_x = self.x
+        self.prev_y = self.y
+
     def get_speed(self) -> float:
         return self.speed_value
@@ -0,0 +1,147 @@
+"""Columnar (structure-of-arrays) entity storage with stable handles."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+class ComponentStore:
+    """NumPy-backed component columns for one entity archetype.
+
+    Live rows are packed at the front of every column so systems can work on
+    whole slices. Deleting swaps the last row into the hole; handles map
+    through a slot table, so they stay valid while rows move and go stale
+    (rather than aliasing a new entity) once their entity is removed.
+    """
+
+    def __init__(self, columns: dict[str, Any], capacity: int = 64) -> None:
+        capacity = max(1, int(capacity))
+        self.dtypes = {name: np.dtype(dtype) for name, dtype in columns.items()}
+        self._data = {name: np.zeros(capacity, dtype) for name, dtype in self.dtypes.items()}
+        self._slot_of_row = np.zeros(capacity, dtype=np.int64)
+        self._row_of_slot = np.full(capacity, -1, dtype=np.int64)
+        self._generation = np.zeros(capacity, dtype=np.int64)
+        self._free_slots: list[int] = []
+        self._slot_count = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Writable view of a column's live rows."""
+        return self._data[name][: self.count]
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slot_of_row)
+
+    @property
+    def handles(self) -> np.ndarray:
+        slots = self._slot_of_row[: self.count]
+        return (self._generation[slots] << 32) | slots
+
+    def clear(self) -> None:
+        live_slots = self._slot_of_row[: self.count]
+        self._row_of_slot[live_slots] = -1
+        self._generation[live_slots] += 1
+        self._free_slots.extend(live_slots.tolist())
+        self.count = 0
+
+    def spawn(self, **values: float) -> int:
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        row = self.count
+        for name, value in values.items():
+            self._data[name][row] = value
+        slot = self._free_slots.pop() if self._free_slots else self._new_slot()
+        self._slot_of_row[row] = slot
+        self._row_of_slot[slot] = row
+        self.count += 1
+        return int((self._generation[slot] << 32) | slot)
+
+    def spawn_many(self, **columns: np.ndarray) -> np.ndarray:
+        """Append rows from equal-length column arrays; returns their handles."""
+        count = len(next(iter(columns.values()), ()))
+        if self.count + count > self.capacity:
+            self._grow(max(self.capacity * 2, self.count + count))
+        rows = np.arange(self.count, self.count + count)
+        for name, values in columns.items():
+            self._data[name][rows] = values
+        reused = min(count, len(self._free_slots))
+        slots = np.empty(count, dtype=np.int64)
+        if reused:
+            slots[:reused] = self._free_slots[-reused:][::-1]
+            del self._free_slots[-reused:]
+        slots[reused:] = np.arange(self._slot_count, self._slot_count + count - reused)
+        self._slot_count += count - reused
+        self._slot_of_row[rows] = slots
+        self._row_of_slot[slots] = rows
+        self.count += count
+        return (self._generation[slots] << 32) | slots
+
+    def alive(self, handle: int) -> bool:
+        slot = handle & 0xFFFFFFFF
+        return (
+            slot < self._slot_count
+            and int(self._generation[slot]) == handle >> 32
+            and int(self._row_of_slot[slot]) >= 0
+        )
+
+    def row(self, handle: int) -> int:
+        if not self.alive(handle):
+            raise KeyError(f"stale entity handle {handle}")
+        return int(self._row_of_slot[handle & 0xFFFFFFFF])
+
+    def despawn(self, handle: int) -> None:
+        row = self.row(handle)
+        last = self.count - 1
+        if row != last:
+            for column in self._data.values():
+                column[row] = column[last]
+            moved_slot = self._slot_of_row[last]
+            self._slot_of_row[row] = moved_slot
+            self._row_of_slot[moved_slot] = row
+        self._release(np.array([handle & 0xFFFFFFFF], dtype=np.int64))
+        self.count = last
+
+    def remove_where(self, mask: np.ndarray) -> int:
+        """Drop every live row where ``mask`` is true in one pass; returns how many."""
+        removed = int(np.count_nonzero(mask))
+        if removed == 0:
+            return 0
+        keep = ~mask
+        kept = self.count - removed
+        for name, column in self._data.items():
+            column[:kept] = column[: self.count][keep]
+        dead_slots = self._slot_of_row[: self.count][mask]
+        self._slot_of_row[:kept] = self._slot_of_row[: self.count][keep]
+        self._row_of_slot[self._slot_of_row[:kept]] = np.arange(kept)
+        self._release(dead_slots)
+        self.count = kept
+        return removed
+
+    def _release(self, slots: np.ndarray) -> None:
+        self._row_of_slot[slots] = -1
+        self._generation[slots] += 1
+        self._free_slots.extend(slots.tolist())
+
+    def _new_slot(self) -> int:
+        slot = self._slot_count
+        self._slot_count += 1
+        return slot
+
+    def _grow(self, capacity: int) -> None:
+        for name, column in self._data.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: self.count] = column[: self.count]
+            self._data[name] = grown
+        self._slot_of_row = np.resize(self._slot_of_row, capacity)
+        row_of_slot = np.full(capacity, -1, dtype=np.int64)
+        row_of_slot[: self._slot_count] = self._row_of_slot[: self._slot_count]
+        self._row_of_slot = row_of_slot
+        generation = np.zeros(capacity, dtype=np.int64)
+        generation[: self._slot_count] = self._generation[: self._slot_count]
+        self._generation = generation
@@ -0,0 +1,291 @@
+"""Vectorized, gym-style environments over the headless simulation.
+
+``VectorEnv`` steps N ``Simulation`` instances in one process and returns
+stacked NumPy observations, rewards and done flags. ``SubprocVectorEnv`` has
+the same interface but spreads the instances over worker processes, one
+``VectorEnv`` each, so throughput scales with cores.
+
+Actions are float rows laid out as ``ACTION_FIELDS``; booleans are pressed
+above 0.5 and directional axes act on their sign. Observations are float32
+rows: player state, both weapons, then the ``threats`` soonest-arriving
+enemies as offsets from the player, zero-padded with a presence flag. The
+reward is data earned, the game's own score, so surviving and killing both
+pay and dying simply stops the income. A finished environment is reset with
+its next seed straight away; its last observation and run summary are in that
+step's info. Runs end on their own, so ``truncated`` is always False.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Any
+
+import numpy as np
+
+from game import settings
+from game.input import InputState
+from game.simulation import Simulation, default_loadout
+
+ACTION_FIELDS = (
+    "rotate",
+    "strafe",
+    "throttle",
+    "boost",
+    "fire_primary",
+    "fire_secondary",
+    "aim_x",
+    "aim_y",
+    "hurdle",
+    "extract",
+)
+ACTION_SIZE = len(ACTION_FIELDS)
+PLAYER_FEATURES = 13
+WEAPON_FEATURES = 4
+THREAT_FEATURES = 5
+# Distances and offsets are divided by this so typical values sit near 1.
+DISTANCE_SCALE = 1000.0
+ETA_SCALE = 30.0
+
+
+def observation_size(threats: int) -> int:
+    return PLAYER_FEATURES + WEAPON_FEATURES + THREAT_FEATURES * threats
+
+
+def action_to_input(action: np.ndarray) -> InputState:
+    rotate, strafe, throttle, boost, primary, secondary, aim_x, aim_y, hurdle, extract = action.tolist()
+    return InputState(
+        rotate=max(-1.0, min(1.0, rotate)),
+        strafe_left=strafe < -0.5,
+        strafe_right=strafe > 0.5,
+        throttle_up=throttle > 0.5,
+        throttle_down=throttle < -0.5,
+        boost=boost > 0.5,
+        fire_primary=primary > 0.5,
+        fire_secondary=secondary > 0.5,
+        aim_offset=(aim_x, aim_y) if aim_x or aim_y else None,
+        hurdle=-1.0 if hurdle < -0.5 else 1.0 if hurdle > 0.5 else 0.0,
+        extract=extract > 0.5,
+    )
+
+
+def score(sim: Simulation) -> float:
+    """Data earned so far, unrounded; the reward is its per-step change."""
+    data = sim.elapsed / 60.0 * settings.DATA_PER_MINUTE + sim.player.enemies_killed * settings.DATA_PER_KILL
+    if sim.outcome == "Extracted":
+        data += settings.DATA_EXTRACT_BONUS
+    return data
+
+
+def write_observation(sim: Simulation, out: np.ndarray, threats: int) -> None:
+    """Fill one observation row in place."""
+    player = sim.player
+    body = player.body
+    out[0] = body.velocity.x / settings.MAX_SPEED
+    out[1] = body.velocity.y / settings.MAX_SPEED
+    out[2] = math.sin(body.angle)
+    out[3] = math.cos(body.angle)
+    out[4] = body.angular_velocity
+    out[5] = player.hp / max(1.0, player.max_hp)
+    out[6] = player.fuel / max(1.0, player.max_fuel)
+    out[7] = player.throttle_level
+    out[8] = player.boost_charge
+    out[9] = player.hurdle_cooldown
+    out[10] = sim.remaining / settings.ROUND_SECONDS
+    out[11] = sim.elapsed >= settings.EXTRACTION_AVAILABLE_AT
+    out[12] = sim.extraction_active
+    index = PLAYER_FEATURES
+    for weapon in (sim.primary_weapon, sim.secondary_weapon):
+        out[index] = weapon.ammo_current / max(1, weapon.ammo_max)
+        out[index + 1] = weapon.cooldown_timer * weapon.fire_rate
+        index += 2
+    out[index:] = 0.0
+    px, py = player.x, player.y
+    for threat in sim.current_threats[:threats]:
+        enemy = threat["enemy"]
+        dx = enemy.x - px
+        dy = enemy.y - py
+        out[index] = dx / DISTANCE_SCALE
+        out[index + 1] = dy / DISTANCE_SCALE
+        out[index + 2] = math.hypot(dx, dy) / DISTANCE_SCALE
+        out[index + 3] = min(threat["eta"], ETA_SCALE) / ETA_SCALE
+        out[index + 4] = 1.0
+        index += THREAT_FEATURES
+
+
+class VectorEnv:
+    """``num_envs`` simulations stepped in lockstep in this process."""
+
+    def __init__(
+        self,
+        num_envs: int,
+        threats: int = 8,
+        action_repeat: int = 1,
+        ship_id: str = "",
+        hz: float = settings.SIM_HZ,
+        effects: bool = False,
+        seed_stride: int | None = None,
+    ) -> None:
+        self.num_envs = num_envs
+        # Gap between successive seeds of one environment; a subprocess worker
+        # uses the total env count so its runs match the in-process ones.
+        self.seed_stride = seed_stride or num_envs
+        self.threats = threats
+        self.action_repeat = action_repeat
+        self.dt = 1.0 / hz
+        self.observation_size = observation_size(threats)
+        self.action_size = ACTION_SIZE
+        self.loadout = default_loadout(ship_id)
+        self.sims = [Simulation() for _ in range(num_envs)]
+        for sim in self.sims:
+            sim.effects_enabled = effects
+        self._obs = np.zeros((num_envs, self.observation_size), dtype=np.float32)
+        self._scores = [0.0] * num_envs
+        self._seeds: list[int | None] = [None] * num_envs
+
+    def reset(self, seed: int | None = None) -> tuple[np.ndarray, list[dict[str, Any]]]:
+        """Start every environment; environment i uses ``seed + i``, then every
+        ``seed_stride``-th seed after it on later auto-resets."""
+        infos = []
+        for index in range(self.num_envs):
+            self._seeds[index] = (seed + index) if seed is not None else None
+            infos.append(self._reset_one(index))
+        return self._obs.copy(), infos
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict[str, Any]]]:
+        """Advance every environment by ``action_repeat`` simulation steps."""
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        infos: list[dict[str, Any]] = [{} for _ in range(self.num_envs)]
+        for index, sim in enumerate(self.sims):
+            controls = action_to_input(actions[index])
+            for _ in range(self.action_repeat):
+                sim.step(self.dt, controls)
+                if sim.outcome is not None:
+                    break
+                # Edge actions fire once, not on every repeated step.
+                controls.hurdle = 0.0
+            current = score(sim)
+            rewards[index] = current - self._scores[index]
+            self._scores[index] = current
+            write_observation(sim, self._obs[index], self.threats)
+            if sim.outcome is not None:
+                terminated[index] = True
+                infos[index] = {
+                    "final_observation": self._obs[index].copy(),
+                    "summary": sim.run_summary(),
+                }
+                if self._seeds[index] is not None:
+                    self._seeds[index] += self.seed_stride
+                self._reset_one(index)
+        return self._obs.copy(), rewards, terminated, truncated, infos
+
+    def close(self) -> None:
+        self.sims.clear()
+
+    def __enter__(self) -> VectorEnv:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _reset_one(self, index: int) -> dict[str, Any]:
+        sim = self.sims[index]
+        ship, modules, equipment = self.loadout
+        sim.reset(ship, modules, equipment, self._seeds[index])
+        self._scores[index] = 0.0
+        write_observation(sim, self._obs[index], self.threats)
+        return {"seed": sim.rng.seed}
+
+
+def _worker(connection: Connection, num_envs: int, kwargs: dict[str, Any]) -> None:
+    env = VectorEnv(num_envs, **kwargs)
+    try:
+        while True:
+            command, payload = connection.recv()
+            if command == "step":
+                connection.send(env.step(payload))
+            elif command == "reset":
+                connection.send(env.reset(payload))
+            else:
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        env.close()
+        connection.close()
+
+
+class SubprocVectorEnv:
+    """``VectorEnv`` split across worker processes, with the same interface.
+
+    Environment i sees the same seeds, and so the same runs, as in a single
+    in-process ``VectorEnv`` of the same size.
+    """
+
+    def __init__(self, num_envs: int, workers: int | None = None, **kwargs: Any) -> None:
+        workers = min(num_envs, workers or multiprocessing.cpu_count())
+        self.num_envs = num_envs
+        self.threats = kwargs.get("threats", 8)
+        self.observation_size = observation_size(self.threats)
+        self.action_size = ACTION_SIZE
+        # Contiguous slices, as even as possible.
+        bounds = [num_envs * worker // workers for worker in range(workers + 1)]
+        self._slices = [slice(start, end) for start, end in zip(bounds, bounds[1:])]
+        self._connections: list[Connection] = []
+        self._processes: list[multiprocessing.Process] = []
+        for part in self._slices:
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker,
+                args=(child, part.stop - part.start, {**kwargs, "seed_stride": num_envs}),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def reset(self, seed: int | None = None) -> tuple[np.ndarray, list[dict[str, Any]]]:
+        for part, connection in zip(self._slices, self._connections):
+            connection.send(("reset", None if seed is None else seed + part.start))
+        results = [connection.recv() for connection in self._connections]
+        observations, infos = zip(*results)
+        return np.concatenate(observations), [info for chunk in infos for info in chunk]
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict[str, Any]]]:
+        for part, connection in zip(self._slices, self._connections):
+            connection.send(("step", actions[part]))
+        results = [connection.recv() for connection in self._connections]
+        observations, rewards, terminated, truncated, infos = zip(*results)
+        return (
+            np.concatenate(observations),
+            np.concatenate(rewards),
+            np.concatenate(terminated),
+            np.concatenate(truncated),
+            [info for chunk in infos for info in chunk],
+        )
+
+    def close(self) -> None:
+        for connection in self._connections:
+            try:
+                connection.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join(timeout=5.0)
+        self._connections.clear()
+        self._processes.clear()
+
+    def __enter__(self) -> SubprocVectorEnv:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,174 @@
+"""Ship hull geometry from ``hulls.json``, drawn through a rotation and zoom sprite cache.
+
+A hull is a list of parts, each a polygon or line in design units with the
+ship facing up (-y). Part colours name entries of the hull's palette, so one
+hull can be recoloured without touching its geometry. Sprites are baked per
+(hull, palette, angle bucket, scale bucket), so drawing a ship is one blit and
+no per-frame vertex math however many hulls there are.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pygame
+
+from game import settings
+from game.surface_cache import SurfaceCache, quantize_zoom
+
+HULLS_PATH = Path(__file__).resolve().parent / "data" / "hulls.json"
+# Transparent margin so outlines on the outermost vertices are not clipped.
+SPRITE_PAD = 2
+
+Color = tuple[int, int, int]
+Point = tuple[float, float]
+
+
+@dataclass(frozen=True)
+class HullPart:
+    points: tuple[Point, ...]
+    # Palette keys; None skips the fill or the outline.
+    fill: str | None
+    outline: str | None
+    width: int
+    closed: bool
+
+
+@dataclass(frozen=True)
+class Hull:
+    id: str
+    name: str
+    # Design units across the hull, used to fit it to a collision radius.
+    size: float
+    tip: Point
+    palette: dict[str, Color]
+    parts: tuple[HullPart, ...]
+    # Furthest vertex from the origin, which sizes the sprite.
+    extent: float
+
+
+def _parse_hull(hull_id: str, raw: dict[str, Any]) -> Hull:
+    parts = []
+    for part in raw["parts"]:
+        closed = "polygon" in part
+        points = tuple((float(x), float(y)) for x, y in part["polygon" if closed else "line"])
+        parts.append(
+            HullPart(
+                points=points,
+                fill=part.get("fill") if closed else None,
+                outline=part.get("outline"),
+                width=int(part.get("width", 1)),
+                closed=closed,
+            )
+        )
+    extent = max(math.hypot(x, y) for part in parts for x, y in part.points)
+    return Hull(
+        id=hull_id,
+        name=str(raw.get("name", hull_id)),
+        size=float(raw.get("size", 2.0 * extent)),
+        tip=tuple(raw.get("tip", (0.0, -extent))),
+        palette={key: tuple(color) for key, color in raw.get("palette", {}).items()},
+        parts=tuple(parts),
+        extent=extent,
+    )
+
+
+def load_hulls(path: Path = HULLS_PATH) -> dict[str, Hull]:
+    with path.open("r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return {hull_id: _parse_hull(hull_id, raw) for hull_id, raw in payload["hulls"].items()}
+
+
+def rotate_point(point: Point, angle: float, scale: float) -> Point:
+    """Offset of a design-space point from the ship centre, on screen."""
+    x = point[0] * scale
+    y = point[1] * scale
+    sin_a = math.sin(angle)
+    cos_a = math.cos(angle)
+    return (x * cos_a - y * sin_a, x * sin_a + y * cos_a)
+
+
+def bake_hull(
+    hull: Hull, angle: float, scale: float, palette: dict[str, Color], outline_width: int | None = None
+) -> pygame.Surface:
+    """Render ``hull`` rotated by ``angle`` radians, centred in a new alpha surface."""
+    half = int(math.ceil(hull.extent * scale)) + SPRITE_PAD
+    surface = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+    sin_a = math.sin(angle)
+    cos_a = math.cos(angle)
+    for part in hull.parts:
+        points = [
+            (half + (x * cos_a - y * sin_a) * scale, half + (x * sin_a + y * cos_a) * scale)
+            for x, y in part.points
+        ]
+        width = part.width if outline_width is None else outline_width
+        if not part.closed:
+            pygame.draw.line(surface, palette[part.outline], points[0], points[1], width)
+            continue
+        if part.fill is not None:
+            pygame.draw.polygon(surface, palette[part.fill], points, 0)
+        if part.outline is not None:
+            pygame.draw.polygon(surface, palette[part.outline], points, width)
+    return surface.convert_alpha()
+
+
+class HullRenderer:
+    """Draws hulls from an LRU of baked sprites.
+
+    Angles snap to ``angle_buckets`` steps per turn and scales to hundredths,
+    so a turning ship reuses a bounded set of sprites.
+    """
+
+    def __init__(
+        self,
+        hulls: dict[str, Hull] | None = None,
+        max_bytes: int = settings.HULL_SPRITE_CACHE_BYTES,
+        angle_buckets: int = settings.HULL_ANGLE_BUCKETS,
+    ) -> None:
+        self.hulls = load_hulls() if hulls is None else hulls
+        self.angle_buckets = angle_buckets
+        self.sprites = SurfaceCache(max_bytes)
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def clear(self) -> None:
+        """Drop baked sprites, e.g. after the display's pixel format changes."""
+        self.sprites.clear()
+
+    def sprite(
+        self,
+        hull_id: str,
+        angle: float,
+        scale: float,
+        palette: dict[str, Color] | None = None,
+        outline_width: int | None = None,
+    ) -> pygame.Surface:
+        hull = self.hulls[hull_id]
+        colors = hull.palette if not palette else {**hull.palette, **palette}
+        bucket = round(angle / math.tau * self.angle_buckets) % self.angle_buckets
+        scale = quantize_zoom(scale)
+        key = (hull_id, tuple(sorted(colors.items())), outline_width, bucket, scale)
+        return self.sprites.get(
+            key,
+            lambda: bake_hull(hull, bucket * math.tau / self.angle_buckets, scale, colors, outline_width),
+        )
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        hull_id: str,
+        pos: tuple[float, float],
+        angle: float,
+        scale: float,
+        palette: dict[str, Color] | None = None,
+        outline_width: int | None = None,
+    ) -> None:
+        """Blit the hull centred on ``pos``; ``scale`` is screen pixels per design unit."""
+        sprite = self.sprite(hull_id, angle, scale, palette, outline_width)
+        half = sprite.get_width() // 2
+        surface.blit(sprite, (int(pos[0]) - half, int(pos[1]) - half))
@@ -1,31 +1,64 @@
 """Input handling."""
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+
 import pygame
 
 from game.entities.player import Player
 from game.physics import apply_player_controls
 
 
-def handle_player_input(player: Player, dt: float) -> None:
+@dataclass
+class InputState:
+    """One tick of pilot intent, independent of where it was read from."""
+
+    rotate: float = 0.0
+    strafe_left: bool = False
+    strafe_right: bool = False
+    throttle_up: bool = False
+    throttle_down: bool = False
+    max_thrust: bool = False
+    cut_engines: bool = False
+    boost: bool = False
+    fire_primary: bool = False
+    fire_secondary: bool = False
+    # Aim point relative to the player, in world units.
+    aim_offset: tuple[float, float] | None = None
+    # Edge-triggered actions: 0 keeps the current weapon group.
+    weapon_group: int = 0
+    zoom_steps: float = 0.0
+    extract: bool = False
+    # Direct lateral hurdle (-1 left, 1 right) for scripted pilots; keyboard
+    # players trigger it by double-tapping a strafe key instead.
+    hurdle: float = 0.0
+
+
+def read_keyboard_input() -> InputState:
     keys = pygame.key.get_pressed()
-    rotate = float(
-        (keys[pygame.K_e] or keys[pygame.K_RIGHT]) - (keys[pygame.K_q] or keys[pygame.K_LEFT])
+    return InputState(
+        rotate=float(
+            (keys[pygame.K_e] or keys[pygame.K_RIGHT]) - (keys[pygame.K_q] or keys[pygame.K_LEFT])
+        ),
+        strafe_left=bool(keys[pygame.K_a]),
+        strafe_right=bool(keys[pygame.K_d]),
+        # Incremental throttle control
+        throttle_up=bool(keys[pygame.K_w] or keys[pygame.K_UP]),
+        throttle_down=bool(keys[pygame.K_s] or keys[pygame.K_DOWN]),
+        # Instant throttle override
+        max_thrust=bool(keys[pygame.K_LSHIFT]),
+        cut_engines=bool(keys[pygame.K_LCTRL]),
+        boost=bool(keys[pygame.K_SPACE]),
     )
-    strafe = float((keys[pygame.K_d]) - (keys[pygame.K_a]))
-
-    # Incremental throttle control
-    throttle_increment = bool(keys[pygame.K_w] or keys[pygame.K_UP])
-    throttle_decrement = bool(keys[pygame.K_s] or keys[pygame.K_DOWN])
 
-    # Instant throttle override
-    max_thrust = bool(keys[pygame.K_LSHIFT])
-    cut_engines = bool(keys[pygame.K_LCTRL])
 
-    boost_pressed = bool(keys[pygame.K_SPACE])
+def apply_input(player: Player, controls: InputState, dt: float) -> None:
+    strafe = float(controls.strafe_right) - float(controls.strafe_left)
 
     player.tap_clock += dt
-    left_down = bool(keys[pygame.K_a])
-    right_down = bool(keys[pygame.K_d])
+    left_down = controls.strafe_left
+    right_down = controls.strafe_right
     hurdle_direction = 0.0
 
     if left_down and not player.left_was_down:
@@ -38,16 +71,18 @@ def handle_player_input(player: Player, dt: float) -> None:
         player.last_right_tap = player.tap_clock
     player.left_was_down = left_down
     player.right_was_down = right_down
+    if controls.hurdle:
+        hurdle_direction = controls.hurdle
 
     apply_player_controls(
         player,
-        rotate,
+        controls.rotate,
         strafe,
-        throttle_increment,
-        throttle_decrement,
-        max_thrust,
-        cut_engines,
-        boost_pressed,
+        controls.throttle_up,
+        controls.throttle_down,
+        controls.max_thrust,
+        controls.cut_engines,
+        controls.boost,
         hurdle_direction,
         dt,
     )
@@ -0,0 +1,122 @@
+"""Fixed-capacity, array-backed particle effects."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+# Velocity kept per step, matching the old per-particle drag.
+PARTICLE_DRAG = 0.98
+
+
+class ParticleSystem:
+    """Ring buffer of particles stored column-wise.
+
+    Emission writes at a cursor that wraps around, so once the buffer is full
+    the oldest particles are overwritten first. A slot is live while its ttl
+    is positive; nothing is compacted or reallocated after construction.
+    """
+
+    def __init__(self, capacity: int = 4096, rng: np.random.Generator | None = None) -> None:
+        self.capacity = max(1, int(capacity))
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.x = np.zeros(self.capacity)
+        self.y = np.zeros(self.capacity)
+        self.vx = np.zeros(self.capacity)
+        self.vy = np.zeros(self.capacity)
+        self.ttl = np.zeros(self.capacity)
+        self.radius = np.zeros(self.capacity)
+        self.color = np.zeros((self.capacity, 3), dtype=np.uint8)
+        self.cursor = 0
+        self.evicted = 0
+        # Upper bound on the longest remaining ttl; lets idle frames skip work.
+        self.live_for = 0.0
+
+    def __len__(self) -> int:
+        if self.live_for <= 0.0:
+            return 0
+        return int(np.count_nonzero(self.ttl > 0))
+
+    def clear(self) -> None:
+        self.ttl[:] = 0.0
+        self.cursor = 0
+        self.evicted = 0
+        self.live_for = 0.0
+
+    def emit(
+        self,
+        x: np.ndarray | float,
+        y: np.ndarray | float,
+        vx: np.ndarray,
+        vy: np.ndarray,
+        ttl: np.ndarray,
+        radius: np.ndarray,
+        color: tuple[int, int, int] | np.ndarray,
+    ) -> None:
+        """Write a batch of particles; scalars broadcast across the batch."""
+        count = len(vx)
+        if count == 0:
+            return
+        if count > self.capacity:
+            # Only the newest capacity-worth would survive the wrap anyway.
+            keep = slice(count - self.capacity, count)
+            x, y = np.broadcast_to(x, count)[keep], np.broadcast_to(y, count)[keep]
+            vx, vy, ttl, radius = vx[keep], vy[keep], ttl[keep], radius[keep]
+            color = np.broadcast_to(color, (count, 3))[keep]
+            count = self.capacity
+        slots = (self.cursor + np.arange(count)) % self.capacity
+        self.evicted += int(np.count_nonzero(self.ttl[slots] > 0))
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = vx
+        self.vy[slots] = vy
+        self.ttl[slots] = ttl
+        self.radius[slots] = radius
+        self.color[slots] = color
+        self.cursor = int((self.cursor + count) % self.capacity)
+        self.live_for = max(self.live_for, float(np.max(ttl)))
+
+    def emit_burst(
+        self,
+        x: float,
+        y: float,
+        count: int,
+        speed: tuple[float, float],
+        ttl: tuple[float, float],
+        radius: tuple[float, float],
+        color: tuple[int, int, int],
+    ) -> None:
+        """Spray ``count`` particles from one point in uniformly random directions."""
+        rng = self.rng
+        angle = rng.uniform(0.0, math.tau, count)
+        magnitude = rng.uniform(speed[0], speed[1], count)
+        self.emit(
+            x,
+            y,
+            np.cos(angle) * magnitude,
+            np.sin(angle) * magnitude,
+            rng.uniform(ttl[0], ttl[1], count),
+            rng.uniform(radius[0], radius[1], count),
+            color,
+        )
+
+    def update(self, dt: float) -> None:
+        if self.live_for <= 0.0:
+            return
+        self.live_for -= dt
+        # Integrating dead slots too is cheaper than masking them out; their
+        # velocity is zeroed so it never decays into denormals.
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.ttl -= dt
+        drag = np.where(self.ttl > 0, PARTICLE_DRAG, 0.0)
+        self.vx *= drag
+        self.vy *= drag
+
+    def live_slots(self) -> np.ndarray:
+        """Indices of live particles, oldest first."""
+        if self.live_for <= 0.0:
+            return np.empty(0, dtype=np.int64)
+        order = (self.cursor + np.arange(self.capacity)) % self.capacity
+        return order[self.ttl[order] > 0]
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import math
-from typing import Iterable
+from typing import Iterable, Sequence
 
+import numpy as np
 import pymunk
+from pymunk.batch import BodyFields, Buffer, get_space_bodies, set_space_bodies
 
 from game import settings
 from game.settings import (
@@ -53,6 +55,8 @@ def attach_body(space: pymunk.Space, entity: object, radius: float) -> None:
     space.add(body, shape)
     setattr(entity, "body", body)
     setattr(entity, "shape", shape)
+    # Cached because Body.id goes through cffi; batch reads report bodies by id.
+    setattr(entity, "body_id", body.id)
 
 
 def remove_body(space: pymunk.Space, entity: object) -> None:
@@ -63,6 +67,7 @@ def remove_body(space: pymunk.Space, entity: object) -> None:
     space.remove(body, shape)
     setattr(entity, "body", None)
     setattr(entity, "shape", None)
+    setattr(entity, "body_id", 0)
 
 
 def apply_rotation(
@@ -260,6 +265,129 @@ def update_enemy_ai(enemies: Iterable[object], player_pos: tuple[float, float],
         body.angle = math.atan2(body.velocity.y, body.velocity.x) + math.pi / 2
 
 
+BEHAVIOR_IDS = {"rush": 0, "skirmish": 1, "flank": 2, "siege": 3}
+_SIEGE = BEHAVIOR_IDS["siege"]
+_BODY_FIELDS = BodyFields.BODY_ID | BodyFields.POSITION | BodyFields.ANGLE | BodyFields.VELOCITY
+# Column layout of the float buffer for _BODY_FIELDS: x, y, angle, vx, vy.
+_WRITE_FIELDS = BodyFields.ANGLE | BodyFields.VELOCITY
+# Below this many enemies NumPy setup costs more than the scalar loop.
+ENEMY_AI_BATCH_MIN = 24
+
+
+def update_enemy_ai_batch(
+    space: pymunk.Space,
+    enemies: Sequence[object],
+    player_pos: tuple[float, float],
+    dt: float,
+) -> None:
+    """Vectorized update_enemy_ai for Enemy objects whose bodies live in ``space``.
+
+    Body state is read and written for the whole space through pymunk.batch,
+    and steering is computed per behavior group with NumPy. Arithmetic follows
+    the scalar version operation for operation, so movement is identical;
+    small groups simply run the scalar version.
+    """
+    if len(enemies) < ENEMY_AI_BATCH_MIN:
+        update_enemy_ai(enemies, player_pos, dt)
+        return
+    movers = [enemy for enemy in enemies if enemy.body is not None]
+    if not movers:
+        return
+    read = Buffer()
+    get_space_bodies(space, _BODY_FIELDS, read)
+    state = np.frombuffer(read.float_buf(), dtype=np.float64).reshape(-1, 5).copy()
+    body_ids = np.frombuffer(read.int_buf(), dtype=np.uintp).tolist()
+    row_of_body = dict(zip(body_ids, range(len(body_ids))))
+    rows = np.fromiter((row_of_body[enemy.body_id] for enemy in movers), np.intp, len(movers))
+
+    px, py = player_pos
+    dx = px - state[rows, 0]
+    dy = py - state[rows, 1]
+    distance = np.sqrt(dx * dx + dy * dy)
+    moving = distance > 0.1
+    if not moving.all():
+        movers = [movers[i] for i in np.flatnonzero(moving).tolist()]
+        if not movers:
+            return
+        rows = rows[moving]
+        dx = dx[moving]
+        dy = dy[moving]
+        distance = distance[moving]
+    count = len(movers)
+
+    speed = np.fromiter((enemy.speed for enemy in movers), np.float64, count)
+    preferred_range = np.fromiter((enemy.preferred_range for enemy in movers), np.float64, count)
+    sides = np.fromiter((enemy.sides for enemy in movers), np.float64, count)
+    behavior = np.fromiter(
+        (BEHAVIOR_IDS.get(enemy.behavior, _SIEGE) for enemy in movers), np.int8, count
+    )
+    ai_clock = np.fromiter((enemy.ai_clock for enemy in movers), np.float64, count) + dt
+
+    nx = dx / distance
+    ny = dy / distance
+    tangent_x = -ny
+    tangent_y = nx
+    vx = np.empty(count)
+    vy = np.empty(count)
+
+    group = behavior == BEHAVIOR_IDS["rush"]
+    if group.any():
+        vx[group] = nx[group] * speed[group]
+        vy[group] = ny[group] * speed[group]
+
+    group = behavior == BEHAVIOR_IDS["skirmish"]
+    if group.any():
+        s = speed[group]
+        orbit_sign = np.where(sides[group] % 2 == 0, 1.0, -1.0)
+        pref = preferred_range[group]
+        radial = np.clip((distance[group] - pref) / np.maximum(1.0, pref), -0.55, 0.55)
+        vx[group] = tangent_x[group] * s * orbit_sign + nx[group] * s * radial
+        vy[group] = tangent_y[group] * s * orbit_sign + ny[group] * s * radial
+
+    group = behavior == BEHAVIOR_IDS["flank"]
+    if group.any():
+        s = speed[group]
+        wave = np.sin(ai_clock[group] * 1.4 + sides[group] * 0.3)
+        inward_strength = np.where(distance[group] > preferred_range[group], 0.65, 0.2)
+        vx[group] = tangent_x[group] * s * wave * 0.85 + nx[group] * s * inward_strength
+        vy[group] = tangent_y[group] * s * wave * 0.85 + ny[group] * s * inward_strength
+
+    group = behavior == _SIEGE
+    if group.any():
+        s = speed[group]
+        weave = np.sin(ai_clock[group] * 0.8 + sides[group] * 0.2) * 0.35
+        vx[group] = nx[group] * s * 0.92 + tangent_x[group] * s * weave
+        vy[group] = ny[group] * s * 0.92 + tangent_y[group] * s * weave
+
+    # Vec2d.length squares with float.__pow__ (libm pow), which can differ
+    # from NumPy's x*x by an ulp, and math.atan2 from np.arctan2; both stay
+    # scalar so the result is bit-for-bit the same.
+    sqrt = math.sqrt
+    atan2 = math.atan2
+    vx_list = vx.tolist()
+    vy_list = vy.tolist()
+    length = np.fromiter(
+        (sqrt(x**2 + y**2) for x, y in zip(vx_list, vy_list)), np.float64, count
+    )
+    over = length > speed
+    if over.any():
+        vx[over] = vx[over] / length[over] * speed[over]
+        vy[over] = vy[over] / length[over] * speed[over]
+        vx_list = vx.tolist()
+        vy_list = vy.tolist()
+    heading = np.fromiter((atan2(y, x) for x, y in zip(vx_list, vy_list)), np.float64, count)
+
+    state[rows, 2] = heading + math.pi / 2
+    state[rows, 3] = vx
+    state[rows, 4] = vy
+    for enemy, clock in zip(movers, ai_clock.tolist()):
+        enemy.ai_clock = clock
+    # Bodies that were not steered are written back with the values just read.
+    write = Buffer()
+    write.set_float_buf(np.ascontiguousarray(state[:, 2:]))
+    set_space_bodies(space, _WRITE_FIELDS, write)
+
+
 def sync_entity_positions(entities: Iterable[object]) -> None:
     for entity in entities:
         body = getattr(entity, "body", None)
@@ -0,0 +1,207 @@
+"""Scripted pilots for headless runs.
+
+A policy turns the simulation state into one tick of ``InputState``, so any
+instance can be passed straight to ``Simulation.run``. Policies read the
+ETA-sorted ``sim.current_threats`` that ``collect_threats`` already builds each
+step rather than scanning every enemy, which keeps them at a few microseconds
+per tick however crowded the fight gets.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from game.input import InputState
+
+if TYPE_CHECKING:
+    from game.entities.enemy import Enemy
+    from game.simulation import Simulation
+
+# Threats further than this many seconds out are ignored by the evader.
+EVADE_HORIZON = 6.0
+# How many of the soonest threats the evader weighs.
+EVADE_THREATS = 8
+
+
+def _first_threat(sim: Simulation) -> Enemy | None:
+    for threat in sim.current_threats:
+        enemy = threat["enemy"]
+        if enemy.hp > 0:
+            return enemy
+    return None
+
+
+def _turn_towards(sim: Simulation, dx: float, dy: float) -> float:
+    # The ship points along (sin a, -cos a); damp the spin so it settles on target.
+    body = sim.player.body
+    error = math.atan2(dx, -dy) - body.angle
+    error = (error + math.pi) % math.tau - math.pi
+    return max(-1.0, min(1.0, 3.0 * error - 0.5 * body.angular_velocity))
+
+
+def _side_of(sim: Simulation, dx: float, dy: float) -> float:
+    """+1 when (dx, dy) lies to the ship's right, -1 when to its left."""
+    angle = sim.player.body.angle
+    # Dot product with the lateral axis (cos a, sin a).
+    return 1.0 if dx * math.cos(angle) + dy * math.sin(angle) >= 0.0 else -1.0
+
+
+class Policy:
+    """Base pilot; flies nothing. Subclasses override ``act``."""
+
+    name = "idle"
+
+    def reset(self, sim: Simulation) -> None:
+        """Called once before each run; clear any per-run memory here."""
+
+    def act(self, sim: Simulation) -> InputState:
+        return InputState()
+
+    def __call__(self, sim: Simulation) -> InputState:
+        return self.act(sim)
+
+
+class TurretPolicy(Policy):
+    """Holds still, turns towards the soonest threat and fires everything at it."""
+
+    name = "turret"
+
+    def act(self, sim: Simulation) -> InputState:
+        enemy = _first_threat(sim)
+        if enemy is None:
+            return InputState(cut_engines=True)
+        dx = enemy.x - sim.player.x
+        dy = enemy.y - sim.player.y
+        return InputState(
+            rotate=_turn_towards(sim, dx, dy),
+            cut_engines=True,
+            fire_primary=True,
+            fire_secondary=True,
+            aim_offset=(dx, dy),
+        )
+
+
+class KitingPolicy(Policy):
+    """Keeps the soonest threat inside a firing band, running when it gets close."""
+
+    name = "kiting"
+
+    def __init__(self, min_range: float = 260.0, max_range: float = 440.0) -> None:
+        self.min_range = min_range
+        self.max_range = max_range
+
+    def act(self, sim: Simulation) -> InputState:
+        enemy = _first_threat(sim)
+        if enemy is None:
+            return InputState(throttle_down=True)
+        dx = enemy.x - sim.player.x
+        dy = enemy.y - sim.player.y
+        distance = math.hypot(dx, dy)
+        if distance < self.min_range:
+            return InputState(
+                rotate=_turn_towards(sim, -dx, -dy),
+                max_thrust=True,
+                boost=distance < 0.5 * self.min_range,
+                fire_primary=True,
+                aim_offset=(dx, dy),
+            )
+        return InputState(
+            rotate=_turn_towards(sim, dx, dy),
+            throttle_up=distance > self.max_range,
+            cut_engines=distance <= self.max_range,
+            fire_primary=True,
+            fire_secondary=True,
+            aim_offset=(dx, dy),
+        )
+
+
+class OrbitPolicy(Policy):
+    """Circles the soonest threat by strafing while facing it."""
+
+    name = "orbit"
+
+    def __init__(self, radius: float = 320.0, direction: float = 1.0) -> None:
+        self.radius = radius
+        # +1 strafes to the ship's right, -1 to its left.
+        self.direction = direction
+
+    def act(self, sim: Simulation) -> InputState:
+        enemy = _first_threat(sim)
+        if enemy is None:
+            return InputState(throttle_down=True)
+        player = sim.player
+        dx = enemy.x - player.x
+        dy = enemy.y - player.y
+        distance = math.hypot(dx, dy)
+        too_close = distance < 0.85 * self.radius
+        return InputState(
+            rotate=_turn_towards(sim, dx, dy),
+            strafe_left=self.direction < 0.0,
+            strafe_right=self.direction > 0.0,
+            throttle_up=distance > 1.15 * self.radius,
+            cut_engines=distance <= 1.15 * self.radius,
+            fire_primary=True,
+            fire_secondary=True,
+            aim_offset=(dx, dy),
+            hurdle=self.direction if too_close and player.hurdle_cooldown <= 0.0 else 0.0,
+        )
+
+
+class EvaderPolicy(Policy):
+    """Flees the weighted sum of the threat board, hurdling aside from the soonest hit."""
+
+    name = "evader"
+
+    def act(self, sim: Simulation) -> InputState:
+        player = sim.player
+        px, py = player.x, player.y
+        away_x = away_y = 0.0
+        first: Enemy | None = None
+        first_eta = math.inf
+        for threat in sim.current_threats[:EVADE_THREATS]:
+            eta = threat["eta"]
+            if eta > EVADE_HORIZON:
+                break
+            enemy = threat["enemy"]
+            if enemy.hp <= 0:
+                continue
+            if first is None:
+                first, first_eta = enemy, eta
+            dx = px - enemy.x
+            dy = py - enemy.y
+            # Unit vector away from the threat, weighted by how soon it arrives.
+            weight = 1.0 / (max(eta, 0.25) * max(math.hypot(dx, dy), 1.0))
+            away_x += dx * weight
+            away_y += dy * weight
+        if first is None:
+            return TURRET.act(sim)
+        to_x = first.x - px
+        to_y = first.y - py
+        hurdle = 0.0
+        if first_eta < 1.0 and player.hurdle_cooldown <= 0.0:
+            # Dodge to whichever side the threat is not on.
+            hurdle = -_side_of(sim, to_x, to_y)
+        return InputState(
+            rotate=_turn_towards(sim, away_x, away_y),
+            max_thrust=True,
+            boost=first_eta < 2.0,
+            fire_primary=True,
+            aim_offset=(to_x, to_y),
+            hurdle=hurdle,
+        )
+
+
+# Stateless, so the evader can borrow it when nothing is close.
+TURRET = TurretPolicy()
+
+POLICIES: dict[str, type[Policy]] = {
+    policy.name: policy for policy in (Policy, TurretPolicy, KitingPolicy, OrbitPolicy, EvaderPolicy)
+}
+
+
+def make_policy(name: str) -> Policy:
+    try:
+        return POLICIES[name]()
+    except KeyError:
+        raise ValueError(f"unknown policy {name!r}; choose from {', '.join(POLICIES)}") from None
@@ -0,0 +1,185 @@
+"""Named scoped frame timers with a rolling history.
+
+Wrap work in ``with profiler.scope("sim.enemy_ai"):`` and bracket each frame
+with ``begin_frame``/``end_frame``. While disabled, ``scope`` hands back a
+shared no-op context manager, so instrumented code pays one attribute check.
+
+Scopes must not nest, since their times are stacked per frame. Enclosing
+spans such as a whole update use ``phase``, and ``traced`` functions are
+timed individually; both only show up in a trace capture.
+"""
+
+from __future__ import annotations
+
+import functools
+from contextlib import nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, ContextManager, TypeVar
+
+import numpy as np
+
+from game.trace import TraceWriter
+
+_NULL_SCOPE = nullcontext()
+
+F = TypeVar("F", bound=Callable[..., object])
+
+
+class _Scope:
+    __slots__ = ("sink", "name", "start")
+
+    def __init__(self, sink: Callable[[str, float, float], None], name: str) -> None:
+        self.sink = sink
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        self.sink(self.name, self.start, perf_counter())
+
+
+class FrameProfiler:
+    """Accumulates scope time per frame into a ring buffer of the last frames."""
+
+    def __init__(self, history: int = 240) -> None:
+        # True while either the overlay wants samples or a trace is recording.
+        self.enabled = False
+        self.collecting = False
+        self.trace: TraceWriter | None = None
+        self.history = history
+        # Scope names in first-seen order; column i of ``samples`` belongs to names[i].
+        self.names: list[str] = []
+        self._columns: dict[str, int] = {}
+        self._scopes: dict[str, _Scope] = {}
+        self._phases: dict[str, _Scope] = {}
+        self._current: dict[str, float] = {}
+        self.samples = np.zeros((history, 16))
+        self.frame_ms = np.zeros(history)
+        self.frame_count = 0
+        self._frame_start = 0.0
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Start or stop collecting per-frame samples for the overlay."""
+        if enabled and not self.collecting:
+            self.samples[:] = 0.0
+            self.frame_ms[:] = 0.0
+            self.frame_count = 0
+            self._current.clear()
+        self.collecting = enabled
+        self.enabled = self.collecting or self.trace is not None
+
+    def start_trace(self, path: Path) -> TraceWriter:
+        """Stream every span to a Chrome trace file until ``stop_trace``."""
+        self.stop_trace()
+        self.trace = TraceWriter(path)
+        self.enabled = True
+        # begin_frame was skipped while disabled; do not emit a frame from a stale start.
+        self._frame_start = perf_counter()
+        return self.trace
+
+    def stop_trace(self) -> Path | None:
+        trace, self.trace = self.trace, None
+        self.enabled = self.collecting
+        if trace is None:
+            return None
+        trace.close()
+        return trace.path
+
+    def scope(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return _NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(self.record, name)
+        return scope
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """Span that encloses scopes; recorded to the trace only."""
+        if self.trace is None:
+            return _NULL_SCOPE
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = _Scope(self._trace_span, name)
+        return phase
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """Add one timed span (perf_counter seconds) to the current frame."""
+        self._current[name] = self._current.get(name, 0.0) + (end - start)
+        if self.trace is not None:
+            self.trace.complete(name, start, end)
+
+    def _trace_span(self, name: str, start: float, end: float) -> None:
+        if self.trace is not None:
+            self.trace.complete(name, start, end)
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._current.clear()
+        self._frame_start = perf_counter()
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        row = self.frame_count % self.history
+        self.samples[row] = 0.0
+        for name, seconds in self._current.items():
+            column = self._column(name)
+            self.samples[row, column] = seconds * 1000.0
+        end = perf_counter()
+        self.frame_ms[row] = (end - self._frame_start) * 1000.0
+        self.frame_count += 1
+        if self.trace is not None:
+            self.trace.complete("frame", self._frame_start, end)
+
+    def recent(self) -> tuple[np.ndarray, np.ndarray]:
+        """Per-scope and total milliseconds of the recorded frames, oldest first."""
+        filled = min(self.frame_count, self.history)
+        order = (self.frame_count - filled + np.arange(filled)) % self.history
+        return self.samples[order, : len(self.names)], self.frame_ms[order]
+
+    def percentiles(self) -> dict[str, tuple[float, float, float]]:
+        """p50/p95/p99 milliseconds per scope, plus the whole frame under "frame"."""
+        samples, totals = self.recent()
+        if len(totals) == 0:
+            return {}
+        stats: dict[str, tuple[float, float, float]] = {}
+        columns = np.percentile(samples, (50, 95, 99), axis=0) if self.names else None
+        for i, name in enumerate(self.names):
+            stats[name] = (float(columns[0, i]), float(columns[1, i]), float(columns[2, i]))
+        p50, p95, p99 = np.percentile(totals, (50, 95, 99))
+        stats["frame"] = (float(p50), float(p95), float(p99))
+        return stats
+
+    def _column(self, name: str) -> int:
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = len(self.names)
+            self.names.append(name)
+            if column >= self.samples.shape[1]:
+                self.samples = np.pad(self.samples, ((0, 0), (0, self.samples.shape[1])))
+        return column
+
+
+profiler = FrameProfiler()
+
+
+def traced(function: F) -> F:
+    """Time each call of ``function`` as its own span while a trace is recording."""
+    name = f"{function.__module__.rsplit('.', 1)[-1]}.{function.__qualname__}"
+
+    @functools.wraps(function)
+    def wrapper(*args: object, **kwargs: object) -> object:
+        trace = profiler.trace
+        if trace is None:
+            return function(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            trace.complete(name, start, perf_counter())
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,191 @@
+"""Per-tick input recording and deterministic replay of runs.
+
+A replay is the run seed, the loadout and one packed ``InputState`` per
+simulation step, so re-stepping a fresh ``Simulation`` with them reproduces
+the run exactly. Files are compressed ``.npz`` archives, since held keys
+repeat for many ticks and compress well.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from game.input import InputState
+from game.simulation import Simulation
+from game.systems import fitting
+
+REPLAY_VERSION = 2
+# Version 1 files predate the hurdle field and still load.
+READABLE_VERSIONS = (1, 2)
+REPLAY_DIR = Path(__file__).resolve().parent / "data" / "replays"
+
+INPUT_DTYPE = np.dtype(
+    [
+        ("flags", "<u2"),
+        ("rotate", "<f8"),
+        ("aim_x", "<f8"),
+        ("aim_y", "<f8"),
+        ("weapon_group", "u1"),
+        ("zoom_steps", "<f8"),
+        ("hurdle", "<f8"),
+    ]
+)
+# InputState booleans in bit order; the next bit marks a present aim_offset.
+FLAG_FIELDS = (
+    "strafe_left",
+    "strafe_right",
+    "throttle_up",
+    "throttle_down",
+    "max_thrust",
+    "cut_engines",
+    "boost",
+    "fire_primary",
+    "fire_secondary",
+    "extract",
+)
+_AIM_FLAG = 1 << len(FLAG_FIELDS)
+
+
+def last_run_path() -> Path:
+    return REPLAY_DIR / "last_run.npz"
+
+
+def pack_input(controls: InputState) -> tuple[int, float, float, float, int, float, float]:
+    flags = 0
+    for bit, name in enumerate(FLAG_FIELDS):
+        if getattr(controls, name):
+            flags |= 1 << bit
+    aim_x = aim_y = 0.0
+    if controls.aim_offset is not None:
+        flags |= _AIM_FLAG
+        aim_x, aim_y = controls.aim_offset
+    return (
+        flags,
+        controls.rotate,
+        aim_x,
+        aim_y,
+        controls.weapon_group,
+        controls.zoom_steps,
+        controls.hurdle,
+    )
+
+
+def unpack_input(row: np.void) -> InputState:
+    flags = int(row["flags"])
+    controls = InputState(
+        rotate=float(row["rotate"]),
+        weapon_group=int(row["weapon_group"]),
+        zoom_steps=float(row["zoom_steps"]),
+    )
+    if "hurdle" in row.dtype.names:
+        controls.hurdle = float(row["hurdle"])
+    for bit, name in enumerate(FLAG_FIELDS):
+        if flags & (1 << bit):
+            setattr(controls, name, True)
+    if flags & _AIM_FLAG:
+        controls.aim_offset = (float(row["aim_x"]), float(row["aim_y"]))
+    return controls
+
+
+class InputRecorder:
+    """Collects the inputs of one run as the simulation steps it."""
+
+    def __init__(self, sim: Simulation, dt: float, ship_id: str, equipment: dict[str, str]) -> None:
+        self.header: dict[str, Any] = {
+            "version": REPLAY_VERSION,
+            "seed": sim.rng.seed,
+            "dt": dt,
+            "ship_id": ship_id,
+            "equipment": dict(equipment),
+            "tuning": dict(sim.tuning),
+        }
+        self.rows: list[tuple[int, float, float, float, int, float, float]] = []
+        # Debug-overlay edits made mid-run, as (tick, full tuning) pairs.
+        self.tuning_changes: list[tuple[int, dict[str, float | bool]]] = []
+        self._last_tuning = dict(sim.tuning)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def record(self, controls: InputState, tuning: dict[str, float | bool]) -> None:
+        if tuning != self._last_tuning:
+            self._last_tuning = dict(tuning)
+            self.tuning_changes.append((len(self.rows), self._last_tuning))
+        self.rows.append(pack_input(controls))
+
+    def save(self, path: Path, summary: dict[str, Any] | None = None) -> Path:
+        """Write the replay; ``summary`` is kept so a replay can verify its outcome."""
+        header = {**self.header, "tuning_changes": self.tuning_changes, "summary": summary}
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            np.savez_compressed(
+                handle,
+                inputs=np.array(self.rows, dtype=INPUT_DTYPE),
+                header=np.array(json.dumps(header)),
+            )
+        return path
+
+
+class Replay:
+    """A loaded recording that feeds its inputs back one tick at a time."""
+
+    def __init__(self, header: dict[str, Any], inputs: np.ndarray) -> None:
+        self.header = header
+        self.inputs = inputs
+        self.tick = 0
+        self._tuning_changes = {int(tick): tuning for tick, tuning in header.get("tuning_changes", [])}
+
+    @classmethod
+    def load(cls, path: Path) -> Replay:
+        with np.load(path) as archive:
+            header = json.loads(str(archive["header"]))
+            inputs = archive["inputs"]
+        if header.get("version") not in READABLE_VERSIONS:
+            raise ValueError(f"{path}: unsupported replay version {header.get('version')!r}")
+        return cls(header, inputs)
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    @property
+    def seed(self) -> int:
+        return int(self.header["seed"])
+
+    @property
+    def dt(self) -> float:
+        return float(self.header["dt"])
+
+    @property
+    def finished(self) -> bool:
+        return self.tick >= len(self.inputs)
+
+    def start(self, sim: Simulation) -> None:
+        """Reset ``sim`` into the recorded run's starting state."""
+        ships = fitting.load_ships()
+        ship = ships.get(self.header["ship_id"]) or next(iter(ships.values()), {})
+        sim.reset(ship, fitting.load_modules(), dict(self.header["equipment"]), self.seed)
+        sim.tuning.update(self.header["tuning"])
+        self.tick = 0
+
+    def next_input(self, sim: Simulation) -> InputState:
+        """Controls for the coming step; call once per ``sim.step``."""
+        tuning = self._tuning_changes.get(self.tick)
+        if tuning is not None:
+            sim.tuning.update(tuning)
+        if self.finished:
+            return InputState()
+        controls = unpack_input(self.inputs[self.tick])
+        self.tick += 1
+        return controls
+
+    def run(self, sim: Simulation) -> str | None:
+        """Re-simulate the whole recording as fast as possible; returns the outcome."""
+        self.start(sim)
+        while not self.finished and sim.outcome is None:
+            sim.step(self.dt, self.next_input(sim))
+        return sim.outcome
@@ -0,0 +1,30 @@
+"""Seeded random streams for one run."""
+
+from __future__ import annotations
+
+import random
+import secrets
+
+import numpy as np
+
+
+def new_seed() -> int:
+    return secrets.randbits(32)
+
+
+class RunRandom:
+    """Independent generators derived from a single run seed.
+
+    ``gameplay`` drives anything that can change the outcome (spawns, weapon
+    spread). ``effects`` feeds the simulation's particles and ``cosmetic`` the
+    render-side flourishes (screen shake, shooting stars), which run once per
+    drawn frame. Drawing from one stream never shifts another, so the same
+    seed replays the same fight whatever the frame rate or effects setting.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.seed = new_seed() if seed is None else int(seed)
+        # String seeds are hashed with SHA-512, so they are stable across processes.
+        self.gameplay = random.Random(f"{self.seed}:gameplay")
+        self.cosmetic = random.Random(f"{self.seed}:cosmetic")
+        self.effects = np.random.default_rng([self.seed, 1])
@@ -2,6 +2,8 @@
 
 WIDTH, HEIGHT = 1100, 700
 FPS = 120
+SIM_HZ = 120  # Fixed simulation rate, independent of the render rate
+MAX_SIM_STEPS_PER_FRAME = 6  # Catch-up cap; longer hitches slow the game instead
 
 BG = (0, 0, 0)
 NEON_CYAN = (0, 255, 255)
@@ -27,6 +29,7 @@ def get_ship_selection_colors() -> dict[str, tuple[int, int, int]]:
 
 PLAYER_SPEED = 37.125  # Reduced from 396 for slower movement
 PLAYER_RADIUS = 12
+PLAYER_HULL = "oba_catamaran"  # Hull from hulls.json for ships that do not name one
 PLAYER_MAX_HP = 100
 PLAYER_FUEL_START = 340.0
 FUEL_BURN_RATE = 1.05
@@ -57,6 +60,8 @@ BULLET_SPEED = 900.0
 BULLET_RADIUS = 3
 BULLET_DAMAGE = 12
 BULLET_LIFETIME = 1.2
+BULLET_TRAIL_MIN_ZOOM = 0.45  # Below this zoom bullets draw as dots without trails
+BULLET_SPRITE_CACHE_BYTES = 4 * 1024 * 1024  # Budget for baked bullet streak sprites
 PDC_AMMO_START = 1200
 PDC_FIRE_RATE = 10.0
 PDC_GIMBAL_DEGREES = 15.0
@@ -69,6 +74,7 @@ ROCKET_SPEED = 520.0
 ROCKET_LIFETIME = 2.2
 LASER_LIFETIME = 0.12
 LASER_WIDTH = 6
+PARTICLE_CAPACITY = 4096  # Ring buffer size; the oldest particles are overwritten past this
 EMP_PULSE_LIFETIME = 0.25
 
 FIRE_COOLDOWN_START = 0.14
@@ -100,3 +106,11 @@ ZOOM_MIN = 0.3
 ZOOM_MAX = 1.0
 ZOOM_STEP = 0.05
 ZOOM_SMOOTH_SPEED = 6.0
+STAR_CHUNK_DATA_LIMIT = 512  # Star layouts kept around; evicted ones regenerate from their seed
+STAR_SURFACE_CACHE_BYTES = 48 * 1024 * 1024  # Budget for baked star chunk surfaces
+NEBULA_CHUNK_DATA_LIMIT = 256  # Nebula parameters kept around; evicted ones regenerate from their seed
+NEBULA_SURFACE_CACHE_BYTES = 64 * 1024 * 1024  # Budget for nebula originals and their scaled copies
+ENEMY_SPRITE_CACHE_BYTES = 8 * 1024 * 1024  # Budget for baked enemy archetype sprites
+GRID_TILE_CACHE_BYTES = 8 * 1024 * 1024  # Budget for baked background grid tiles
+HULL_SPRITE_CACHE_BYTES = 16 * 1024 * 1024  # Budget for baked ship hull rotations
+HULL_ANGLE_BUCKETS = 256  # Rotation steps per turn for baked hulls
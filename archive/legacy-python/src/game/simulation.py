@@ -0,0 +1,497 @@
+"""Display-free gameplay simulation shared by the game loop and headless tools."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+
+from game import settings
+from game.entities.bullet import create_bullet_store, spawn_bullet
+from game.entities.enemy import Enemy
+from game.entities.player import Player
+from game.entities.weapon_state import WeaponState
+from game.input import InputState, apply_input
+from game.particles import ParticleSystem
+from game.physics import (
+    attach_body,
+    clamp_entity_speeds,
+    create_space,
+    remove_body,
+    step_space,
+    sync_entity_positions,
+    update_enemy_ai_batch,
+)
+from game.profiler import profiler
+from game.rng import RunRandom
+from game.settings import (
+    DATA_EXTRACT_BONUS,
+    DATA_PER_KILL,
+    DATA_PER_MINUTE,
+    EXTRACTION_AVAILABLE_AT,
+    EXTRACTION_CHANNEL_TIME,
+    NEON_BLUE,
+    NEON_YELLOW,
+    PLAYER_RADIUS,
+    RED,
+)
+from game.spatial_hash import SpatialHash
+from game.systems import (
+    collisions,
+    combat,
+    fitting,
+    progression,
+    save_system,
+    spawner,
+    threat_board,
+)
+
+if TYPE_CHECKING:
+    from game.replay import InputRecorder
+
+
+def default_tuning() -> dict[str, float | bool]:
+    """Runtime tuning values; the debug overlay edits these in place."""
+    return {
+        "player_thrust_power": 73.125,
+        "player_strafe_power": 64.35,
+        "player_max_speed": 56.25,
+        "player_drift_factor": 0.992,
+        "enemy_speed": 19.40625,
+        "collision_enabled": True,
+    }
+
+
+def default_loadout(
+    ship_id: str = "",
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]], dict[str, str]]:
+    """Ship, module table and starter equipment as a fresh save would fit them."""
+    modules = fitting.load_modules()
+    ships = fitting.load_ships()
+    ship = ships.get(ship_id) or next(iter(ships.values()), {})
+    unlocked_module_ids = fitting.get_unlocked_module_ids(save_system.default_save_data())
+    equipment = fitting.default_equipment_for_ship(ship, modules, unlocked_module_ids)
+    return ship, modules, equipment
+
+
+class Simulation:
+    """One run of gameplay state, stepped from an injected input source.
+
+    Nothing here touches the display, fonts or the pygame event queue, so a
+    full round can be stepped as fast as the CPU allows.
+    """
+
+    def __init__(self) -> None:
+        self.rng = RunRandom()
+        self.spawner = spawner.Spawner(self.rng.gameplay)
+        self.tuning = default_tuning()
+        self.effects_enabled = True
+        self.player = Player(settings.WIDTH / 2, settings.HEIGHT / 2)
+        self.space = create_space()
+        attach_body(self.space, self.player, PLAYER_RADIUS)
+        self.enemies: list[Enemy] = []
+        # Enemy broadphase, rebuilt once per step and shared by every resolver.
+        self.enemy_grid = SpatialHash()
+        self.bullets = create_bullet_store()
+        self.particles = ParticleSystem(settings.PARTICLE_CAPACITY, self.rng.effects)
+        self.primary_weapon = WeaponState(
+            name="PDC",
+            ammo_max=1,
+            ammo_current=1,
+            damage=settings.BULLET_DAMAGE,
+            fire_rate=1.0,
+            gimbal_degrees=15.0,
+            mounting="forward",
+        )
+        self.secondary_weapon = WeaponState(
+            name="RAIL",
+            ammo_max=1,
+            ammo_current=1,
+            damage=100.0,
+            fire_rate=0.5,
+            gimbal_degrees=5.0,
+            mounting="forward",
+        )
+        self.shake_timer = 0.0
+        self.shake_strength = 0.0
+        self.elapsed, self.remaining = progression.reset_timer()
+        self.selected_weapon_group = 3
+        self.extraction_active = False
+        self.extraction_timer = 0.0
+        self.current_threats: list[dict[str, object]] = []
+        self.run_start_ammo = 0
+        self.run_start_fuel = 0.0
+        self.run_start_hp = 0.0
+        self.zoom = settings.ZOOM_DEFAULT
+        self.zoom_target = settings.ZOOM_DEFAULT
+        self.outcome: str | None = None
+        # When set, every step's controls are captured for replay.
+        self.recorder: InputRecorder | None = None
+
+    def reset(
+        self,
+        ship: dict[str, Any],
+        modules: dict[str, dict[str, Any]],
+        equipment: dict[str, str],
+        seed: int | None = None,
+    ) -> None:
+        """Start a fresh run with the given ship and (already sanitized) equipment.
+
+        The same ``seed`` and inputs replay the same run; None picks a new one.
+        """
+        self.rng = RunRandom(seed)
+        self.recorder = None
+        self.spawner.rng = self.rng.gameplay
+        self.particles.rng = self.rng.effects
+        self.player = Player(settings.WIDTH / 2, settings.HEIGHT / 2)
+        self.space = create_space()
+        attach_body(self.space, self.player, PLAYER_RADIUS)
+        self.enemies.clear()
+        self.enemy_grid.clear()
+        self.bullets.clear()
+        self.particles.clear()
+        self._apply_loadout(ship, modules, equipment)
+        self.shake_timer = 0.0
+        self.shake_strength = 0.0
+        self.spawner.reset()
+        self.elapsed, self.remaining = progression.reset_timer()
+        self.selected_weapon_group = 3
+        self.extraction_active = False
+        self.extraction_timer = 0.0
+        self.current_threats = []
+        self.run_start_ammo = self.primary_weapon.ammo_current + self.secondary_weapon.ammo_current
+        self.run_start_fuel = self.player.fuel
+        self.run_start_hp = self.player.hp
+        self.zoom = settings.ZOOM_DEFAULT
+        self.zoom_target = settings.ZOOM_DEFAULT
+        self.tuning["collision_enabled"] = True
+        self.outcome = None
+
+    def _apply_loadout(
+        self,
+        ship: dict[str, Any],
+        modules: dict[str, dict[str, Any]],
+        equipment: dict[str, str],
+    ) -> None:
+        stats = fitting.calculate_ship_stats(ship, modules, equipment)
+        self.player.max_fuel = float(stats["fuel"])
+        self.player.fuel = self.player.max_fuel
+        self.player.max_hp = float(stats["hull"])
+        self.player.hp = self.player.max_hp
+        self.player.fuel_rate = float(stats["fuel_rate"])
+        self.player.speed_value = float(stats["speed"])
+
+        slots = ship.get("slots", [])
+        primary_module = fitting.get_module_for_slot(slots, equipment, modules, "weapon_primary")
+        secondary_module = fitting.get_module_for_slot(slots, equipment, modules, "weapon_secondary")
+        self.primary_weapon = fitting.build_weapon_state(primary_module, "PRIMARY")
+        self.secondary_weapon = fitting.build_weapon_state(secondary_module, "SECONDARY")
+
+    def run(
+        self,
+        input_source: Callable[[Simulation], InputState],
+        dt: float,
+    ) -> str:
+        """Step until the run ends and return its outcome."""
+        while self.outcome is None:
+            with profiler.phase("Simulation.step"):
+                self.step(dt, input_source(self))
+        return self.outcome
+
+    def step(self, dt: float, controls: InputState) -> None:
+        if self.outcome is not None:
+            return
+        if self.recorder is not None:
+            self.recorder.record(controls, self.tuning)
+        self._store_previous_positions()
+        self._apply_actions(controls)
+
+        self.elapsed, self.remaining, completed = progression.update_timer(
+            self.elapsed, self.remaining, dt
+        )
+        if completed:
+            self.outcome = "Signal Lost"
+            return
+
+        with profiler.scope("sim.input"):
+            apply_input(self.player, controls, dt)
+            self._apply_tuning()
+
+            # Smooth zoom interpolation
+            if abs(self.zoom - self.zoom_target) > 0.001:
+                self.zoom += (self.zoom_target - self.zoom) * min(1.0, settings.ZOOM_SMOOTH_SPEED * dt)
+            else:
+                self.zoom = self.zoom_target
+
+        with profiler.scope("sim.spawner"):
+            self.spawner.update(dt, self.elapsed, self.enemies, self.player.pos, self.zoom)
+            for enemy in self.enemies:
+                attach_body(self.space, enemy, enemy.radius)
+        with profiler.scope("sim.enemy_ai"):
+            update_enemy_ai_batch(self.space, self.enemies, self.player.pos, dt)
+        with profiler.scope("sim.physics"):
+            step_space(self.space, dt)
+            clamp_entity_speeds(self.player, self.enemies)
+            sync_entity_positions([self.player])
+            sync_entity_positions(self.enemies)
+        with profiler.scope("sim.threats"):
+            self.current_threats = threat_board.collect_threats(self.enemies, self.player.pos)
+        with profiler.scope("sim.broadphase"):
+            self.enemy_grid.rebuild(self.enemies)
+
+        death_positions: list[tuple[float, float]] = []
+        hit_positions: list[tuple[float, float]] = []
+        collisions_enabled = bool(self.tuning["collision_enabled"])
+        with profiler.scope("sim.weapons"):
+            self.primary_weapon.update(dt)
+            self.secondary_weapon.update(dt)
+
+            aim_world = None
+            if controls.aim_offset is not None:
+                aim_world = (
+                    self.player.x + controls.aim_offset[0],
+                    self.player.y + controls.aim_offset[1],
+                )
+            if self.selected_weapon_group == 1:
+                primary_enabled = True
+                secondary_enabled = False
+            elif self.selected_weapon_group == 2:
+                primary_enabled = False
+                secondary_enabled = True
+            else:
+                primary_enabled = True
+                secondary_enabled = True
+            if controls.fire_primary and primary_enabled:
+                bullet = combat.fire_weapon(
+                    self.player, self.primary_weapon, aim_world, self.rng.gameplay
+                )
+                if bullet is not None:
+                    spawn_bullet(self.bullets, bullet)
+            if controls.fire_secondary and secondary_enabled:
+                bullet = combat.fire_weapon(
+                    self.player, self.secondary_weapon, aim_world, self.rng.gameplay
+                )
+                if bullet is not None:
+                    spawn_bullet(self.bullets, bullet)
+
+            combat.update_bullets(self.bullets, dt)
+            self.bullets.remove_where(self.bullets["ttl"] <= 0)
+
+        with profiler.scope("sim.collisions"):
+            if collisions_enabled:
+                collisions.resolve_bullet_hits(
+                    self.bullets,
+                    self.enemies,
+                    self.player,
+                    death_positions,
+                    hit_positions,
+                    self.enemy_grid,
+                )
+
+            alive_enemies: list[Enemy] = []
+            for enemy in self.enemies:
+                if enemy.hp > 0:
+                    alive_enemies.append(enemy)
+                else:
+                    remove_body(self.space, enemy)
+                    self.enemy_grid.remove(enemy)
+            self.enemies = alive_enemies
+            total_damage = (
+                collisions.resolve_player_hits(self.player, self.enemies, dt, self.enemy_grid)
+                if collisions_enabled
+                else 0.0
+            )
+        if total_damage > 0:
+            self.add_screen_shake(min(6.0, 2.0 + total_damage * 1.5))
+        with profiler.scope("sim.particles"):
+            for pos in death_positions:
+                self._spawn_explosion(pos, RED, 12)
+            self._spawn_hit_sparks(hit_positions)
+
+        if self.elapsed >= EXTRACTION_AVAILABLE_AT:
+            if self.extraction_active:
+                self.extraction_timer = max(0.0, self.extraction_timer - dt)
+                if self.extraction_timer <= 0:
+                    self.outcome = "Extracted"
+                    return
+
+        # Check death
+        if self.player.hp <= 0:
+            self.player.hp = 0
+            self._spawn_explosion(self.player.pos, NEON_BLUE, 18)
+            self.add_screen_shake(10.0)
+            self.outcome = "Destroyed"
+            return
+
+        with profiler.scope("sim.particles"):
+            self.particles.update(dt)
+            self._spawn_engine_particles()
+        if self.shake_timer > 0:
+            self.shake_timer = max(0.0, self.shake_timer - dt)
+
+    def _store_previous_positions(self) -> None:
+        """Remember where movers started the step so draws can interpolate."""
+        self.player.prev_x = self.player.x
+        self.player.prev_y = self.player.y
+        for enemy in self.enemies:
+            enemy.prev_x = enemy.x
+            enemy.prev_y = enemy.y
+
+    def _apply_actions(self, controls: InputState) -> None:
+        if controls.zoom_steps:
+            self.zoom_target += controls.zoom_steps * settings.ZOOM_STEP
+            self.zoom_target = max(settings.ZOOM_MIN, min(settings.ZOOM_MAX, self.zoom_target))
+        if 1 <= controls.weapon_group <= 5:
+            self.selected_weapon_group = controls.weapon_group
+        if controls.extract and self.elapsed >= EXTRACTION_AVAILABLE_AT:
+            if not self.extraction_active:
+                self.extraction_active = True
+                self.extraction_timer = EXTRACTION_CHANNEL_TIME
+
+    def _apply_tuning(self) -> None:
+        player = self.player
+        player.debug_thrust_power = float(self.tuning["player_thrust_power"])
+        player.debug_strafe_power = float(self.tuning["player_strafe_power"])
+        player.debug_max_speed = float(self.tuning["player_max_speed"])
+        player.debug_drift_factor = float(self.tuning["player_drift_factor"])
+
+        for enemy in self.enemies:
+            enemy.speed = float(self.tuning["enemy_speed"])
+
+    def run_summary(self) -> dict[str, Any]:
+        """Per-run stats in the shape used by the debrief and run telemetry."""
+        survival_time = self.elapsed
+        kills = self.player.enemies_killed
+        ammo_spent = max(
+            0,
+            self.run_start_ammo
+            - (self.primary_weapon.ammo_current + self.secondary_weapon.ammo_current),
+        )
+        fuel_spent = max(0.0, self.run_start_fuel - self.player.fuel)
+        hull_damage_taken = max(0.0, self.run_start_hp - self.player.hp)
+        data_earned = (survival_time / 60.0) * DATA_PER_MINUTE + kills * DATA_PER_KILL
+        if self.outcome == "Extracted":
+            data_earned += DATA_EXTRACT_BONUS
+        return {
+            "seed": self.rng.seed,
+            "outcome": self.outcome,
+            "survival_time": survival_time,
+            "kills": kills,
+            "ammo_spent": ammo_spent,
+            "fuel_spent": fuel_spent,
+            "hull_damage": hull_damage_taken,
+            "data_earned": round(data_earned, 2),
+        }
+
+    def telemetry_entry(
+        self, clone_number: int, total_data_gb: float, ship_id: str, equipment: dict[str, str]
+    ) -> dict[str, Any]:
+        """This run as a ``run_telemetry.jsonl`` record, minus the timestamp."""
+        summary = self.run_summary()
+        return {
+            "clone_number": clone_number,
+            "seed": summary["seed"],
+            "outcome": summary["outcome"],
+            "survival_time": round(float(summary["survival_time"]), 2),
+            "kills": int(summary["kills"]),
+            "ammo_spent": int(summary["ammo_spent"]),
+            "fuel_spent": round(float(summary["fuel_spent"]), 2),
+            "hull_damage": round(float(summary["hull_damage"]), 2),
+            "data_earned": summary["data_earned"],
+            "total_data_gb": total_data_gb,
+            "primary_weapon": self.primary_weapon.name,
+            "secondary_weapon": self.secondary_weapon.name,
+            "primary_mounting": self.primary_weapon.mounting,
+            "secondary_mounting": self.secondary_weapon.mounting,
+            "ship_id": ship_id,
+            "equipment": dict(equipment),
+        }
+
+    def add_screen_shake(self, strength: float) -> None:
+        self.shake_strength = max(self.shake_strength, strength)
+        self.shake_timer = max(self.shake_timer, 0.18)
+
+    def _spawn_explosion(
+        self, pos: tuple[float, float], color: tuple[int, int, int], count: int
+    ) -> None:
+        if not self.effects_enabled:
+            return
+        x, y = pos
+        self.particles.emit_burst(x, y, count, (120, 280), (0.3, 0.6), (1.5, 3.5), color)
+
+    def _spawn_hit_sparks(self, positions: list[tuple[float, float]]) -> None:
+        if not self.effects_enabled or not positions:
+            return
+        # Four sparks per hit, all emitted as one batch.
+        origins = np.repeat(np.asarray(positions, dtype=np.float64), 4, axis=0)
+        count = len(origins)
+        rng = self.particles.rng
+        angle = rng.uniform(0, math.tau, count)
+        speed = rng.uniform(60, 160, count)
+        self.particles.emit(
+            origins[:, 0],
+            origins[:, 1],
+            np.cos(angle) * speed,
+            np.sin(angle) * speed,
+            rng.uniform(0.12, 0.25, count),
+            rng.uniform(1.0, 2.0, count),
+            NEON_YELLOW,
+        )
+
+    def _spawn_engine_particles(self) -> None:
+        """Spawn engine thrust particles from the back of the ship."""
+        if not self.effects_enabled or self.player.body is None:
+            return
+
+        angle = float(self.player.body.angle)
+        px, py = self.player.pos
+
+        throttle_level = max(0.0, min(1.0, float(getattr(self.player, "throttle_level", 0.0))))
+        boost_timer = float(getattr(self.player, "boost_timer", 0.0))
+        thrust_ratio = 1.0 if boost_timer > 0.0 else throttle_level
+
+        # Only spawn particles while thrust is applied
+        if thrust_ratio <= 0.0:
+            return
+
+        # Calculate back of ship position
+        size = PLAYER_RADIUS + 4
+        # Backward direction vector (opposite of forward which is (0, -1) rotated)
+        back_dx = -math.sin(angle)
+        back_dy = math.cos(angle)
+        back_offset = size * 0.8  # Position at back of ship
+        back_x = px + back_dx * back_offset
+        back_y = py + back_dy * back_offset
+
+        # Spawn 0-2 particles per frame depending on thrust ratio
+        rng = self.particles.rng
+        max_particles = 2
+        particle_count = int(thrust_ratio * max_particles)
+        if rng.random() < (thrust_ratio * max_particles - particle_count):
+            particle_count += 1
+        if particle_count == 0:
+            return
+
+        # Particles shoot out the back (opposite of ship direction)
+        particle_angle = math.atan2(back_dy, back_dx) + rng.uniform(-0.3, 0.3, particle_count)
+        particle_speed = rng.uniform(80, 150, particle_count) * (0.4 + 0.6 * thrust_ratio)
+
+        # Color shifts from cyan to white based on thrust
+        intensity = thrust_ratio
+        base_color = NEON_BLUE
+        color = (
+            int(base_color[0] + (255 - base_color[0]) * intensity * 0.3),
+            int(base_color[1] + (255 - base_color[1]) * intensity * 0.3),
+            int(base_color[2]),
+        )
+
+        self.particles.emit(
+            back_x,
+            back_y,
+            np.cos(particle_angle) * particle_speed,
+            np.sin(particle_angle) * particle_speed,
+            rng.uniform(0.12, 0.3, particle_count) * (0.6 + 0.4 * thrust_ratio),
+            rng.uniform(1.0, 2.2, particle_count) * (0.6 + 0.4 * thrust_ratio),
+            color,
+        )
@@ -0,0 +1,220 @@
+"""Whole-simulation snapshots: take, restore, save and load.
+
+A snapshot copies every piece of mutable run state, RNG streams included, so
+a run can resume late in the game, branch into many for balance analysis or
+recover from a crash checkpoint without replaying from tick 0.
+
+Pymunk bodies are not copied. Their motion state is read and written for the
+whole space through pymunk.batch, and restoring builds a fresh
+``pymunk.Space``, so entities get new ``body``, ``shape`` and ``body_id``
+values. Bodies are re-added in their original space order. Chipmunk's contact
+cache and broadphase tree cannot be rebuilt from outside, so a restored run
+matches the original bit for bit only while no bodies are touching; once they
+collide it drifts at solver precision. Every restore of the same snapshot
+behaves identically, so branches stay comparable with each other.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from pymunk.batch import BodyFields, Buffer, get_space_bodies, set_space_bodies
+
+from game.entities.bullet import BULLET_COLUMNS
+from game.entities.enemy import Enemy
+from game.entities.player import Player
+from game.entities.weapon_state import WeaponState
+from game.physics import attach_body, create_space
+from game.rng import RunRandom
+from game.settings import PLAYER_RADIUS
+from game.simulation import Simulation
+from game.systems import threat_board
+
+SNAPSHOT_VERSION = 1
+# Run-level attributes copied as-is; everything else is handled explicitly.
+SIM_FIELDS = (
+    "effects_enabled",
+    "shake_timer",
+    "shake_strength",
+    "elapsed",
+    "remaining",
+    "selected_weapon_group",
+    "extraction_active",
+    "extraction_timer",
+    "run_start_ammo",
+    "run_start_fuel",
+    "run_start_hp",
+    "zoom",
+    "zoom_target",
+    "outcome",
+)
+PARTICLE_ARRAYS = ("x", "y", "vx", "vy", "ttl", "radius", "color")
+# Entity attributes owned by the pymunk space rather than the entity.
+_BODY_ATTRS = ("body", "shape", "body_id")
+# Float columns, in pymunk.batch order: x, y, angle, vx, vy, angular velocity.
+_MOTION_FIELDS = BodyFields.POSITION | BodyFields.ANGLE | BodyFields.VELOCITY | BodyFields.ANGULAR_VELOCITY
+
+
+@dataclass
+class Snapshot:
+    state: dict[str, Any]
+    player: dict[str, Any]
+    enemies: list[dict[str, Any]]
+    # One row per body in the space's order: x, y, angle, vx, vy, angular velocity.
+    motion: np.ndarray
+    # Index into [player, *enemies] of each motion row.
+    space_order: np.ndarray
+    bullets: dict[str, np.ndarray]
+    particles: dict[str, np.ndarray]
+
+
+def _entity_fields(entity: object) -> dict[str, Any]:
+    # vars() rather than asdict(): the player also carries debug_* tuning attributes.
+    return {name: value for name, value in vars(entity).items() if name not in _BODY_ATTRS}
+
+
+def take_snapshot(sim: Simulation) -> Snapshot:
+    """Copy the state of ``sim``; the simulation itself is left untouched."""
+    entities = [sim.player, *sim.enemies]
+    buffer = Buffer()
+    get_space_bodies(sim.space, BodyFields.BODY_ID | _MOTION_FIELDS, buffer)
+    motion = np.frombuffer(buffer.float_buf(), dtype=np.float64).reshape(-1, 6).copy()
+    row_of_body = {entity.body_id: row for row, entity in enumerate(entities)}
+    body_ids = np.frombuffer(buffer.int_buf(), dtype=np.uintp).tolist()
+    space_order = np.fromiter((row_of_body[body_id] for body_id in body_ids), np.int64, len(body_ids))
+
+    rng = sim.rng
+    state = {name: getattr(sim, name) for name in SIM_FIELDS}
+    state.update(
+        tuning=dict(sim.tuning),
+        primary_weapon=asdict(sim.primary_weapon),
+        secondary_weapon=asdict(sim.secondary_weapon),
+        spawner={"spawn_timer": sim.spawner.spawn_timer, "max_enemies": sim.spawner.max_enemies},
+        rng={
+            "seed": rng.seed,
+            "gameplay": rng.gameplay.getstate(),
+            "cosmetic": rng.cosmetic.getstate(),
+            "effects": rng.effects.bit_generator.state,
+        },
+        particle_cursor=sim.particles.cursor,
+        particle_evicted=sim.particles.evicted,
+        particle_live_for=sim.particles.live_for,
+    )
+    return Snapshot(
+        state=state,
+        player=_entity_fields(sim.player),
+        enemies=[_entity_fields(enemy) for enemy in sim.enemies],
+        motion=motion,
+        space_order=space_order,
+        bullets={name: sim.bullets[name].copy() for name in BULLET_COLUMNS},
+        particles={name: getattr(sim.particles, name).copy() for name in PARTICLE_ARRAYS},
+    )
+
+
+def _new_entity(cls: type, fields: dict[str, Any]) -> Any:
+    # Skip __init__: every attribute, including prev_x/prev_y, comes from the snapshot.
+    entity = cls.__new__(cls)
+    entity.__dict__.update(fields)
+    entity.body = entity.shape = None
+    entity.body_id = 0
+    return entity
+
+
+def restore_snapshot(sim: Simulation, snapshot: Snapshot) -> None:
+    """Put ``sim`` back into the snapshotted state, rebuilding its physics space."""
+    state = snapshot.state
+    for name in SIM_FIELDS:
+        setattr(sim, name, state[name])
+    sim.tuning.clear()
+    sim.tuning.update(state["tuning"])
+    sim.primary_weapon = WeaponState(**state["primary_weapon"])
+    sim.secondary_weapon = WeaponState(**state["secondary_weapon"])
+    sim.spawner.spawn_timer = state["spawner"]["spawn_timer"]
+    sim.spawner.max_enemies = state["spawner"]["max_enemies"]
+
+    saved_rng = state["rng"]
+    rng = RunRandom(saved_rng["seed"])
+    rng.gameplay.setstate(saved_rng["gameplay"])
+    rng.cosmetic.setstate(saved_rng["cosmetic"])
+    rng.effects.bit_generator.state = saved_rng["effects"]
+    sim.rng = rng
+    sim.spawner.rng = rng.gameplay
+    sim.particles.rng = rng.effects
+    sim.recorder = None
+
+    sim.player = _new_entity(Player, snapshot.player)
+    sim.enemies = [_new_entity(Enemy, fields) for fields in snapshot.enemies]
+    entities = [sim.player, *sim.enemies]
+    sim.space = create_space()
+    for row in snapshot.space_order.tolist():
+        entity = entities[row]
+        attach_body(sim.space, entity, PLAYER_RADIUS if row == 0 else entity.radius)
+    # Bodies were added in the saved order, so one batch write sets them all.
+    buffer = Buffer()
+    buffer.set_float_buf(np.ascontiguousarray(snapshot.motion))
+    set_space_bodies(sim.space, _MOTION_FIELDS, buffer)
+    sim.enemy_grid.rebuild(sim.enemies)
+    # Threats are derived from positions; dead enemies the original list still
+    # held are gone, which only matters to readers between steps.
+    sim.current_threats = threat_board.collect_threats(sim.enemies, sim.player.pos)
+
+    sim.bullets.clear()
+    sim.bullets.spawn_many(**snapshot.bullets)
+    particles = sim.particles
+    for name in PARTICLE_ARRAYS:
+        getattr(particles, name)[:] = snapshot.particles[name]
+    particles.cursor = state["particle_cursor"]
+    particles.evicted = state["particle_evicted"]
+    particles.live_for = state["particle_live_for"]
+
+
+def save_snapshot(snapshot: Snapshot, path: Path) -> Path:
+    """Write ``snapshot`` as an ``.npz`` archive, e.g. for a crash checkpoint."""
+    state = dict(snapshot.state)
+    rng = dict(state["rng"])
+    # Random.getstate() is (version, tuple of ints, gauss); JSON turns tuples into lists.
+    rng["gameplay"] = [rng["gameplay"][0], list(rng["gameplay"][1]), rng["gameplay"][2]]
+    rng["cosmetic"] = [rng["cosmetic"][0], list(rng["cosmetic"][1]), rng["cosmetic"][2]]
+    state["rng"] = rng
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "state": state,
+        "player": snapshot.player,
+        "enemies": snapshot.enemies,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        np.savez_compressed(
+            handle,
+            header=np.array(json.dumps(header)),
+            motion=snapshot.motion,
+            space_order=snapshot.space_order,
+            **{f"bullet_{name}": values for name, values in snapshot.bullets.items()},
+            **{f"particle_{name}": values for name, values in snapshot.particles.items()},
+        )
+    return path
+
+
+def load_snapshot(path: Path) -> Snapshot:
+    with np.load(path) as archive:
+        header = json.loads(str(archive["header"]))
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"{path}: unsupported snapshot version {header.get('version')!r}")
+        state = header["state"]
+        for stream in ("gameplay", "cosmetic"):
+            version, internal, gauss = state["rng"][stream]
+            state["rng"][stream] = (version, tuple(internal), gauss)
+        return Snapshot(
+            state=state,
+            player=header["player"],
+            enemies=header["enemies"],
+            motion=archive["motion"],
+            space_order=archive["space_order"],
+            bullets={name: archive[f"bullet_{name}"] for name in BULLET_COLUMNS},
+            particles={name: archive[f"particle_{name}"] for name in PARTICLE_ARRAYS},
+        )
@@ -0,0 +1,108 @@
+"""Uniform grid broadphase for circle-shaped entities."""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+
+class SpatialHash:
+    """Buckets entities by the grid cells their bounding box touches.
+
+    Queries return candidates in insertion order, so callers that stop at the
+    first hit behave exactly like a linear scan over the source list.
+    """
+
+    def __init__(self, cell_size: float = 64.0) -> None:
+        self.cell_size = float(cell_size)
+        self.cells: dict[tuple[int, int], list[tuple[int, object]]] = {}
+        self._entries: dict[int, tuple[int, list[tuple[int, int]]]] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self._entries.clear()
+        self._next_order = 0
+
+    def rebuild(self, entities: Iterable[object]) -> None:
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def insert(self, entity: object) -> None:
+        if id(entity) in self._entries:
+            self.remove(entity)
+        x = float(getattr(entity, "x"))
+        y = float(getattr(entity, "y"))
+        radius = float(getattr(entity, "radius", 0.0))
+        order = self._next_order
+        self._next_order += 1
+        keys: list[tuple[int, int]] = []
+        min_cx, min_cy, max_cx, max_cy = self._cell_range(x - radius, y - radius, x + radius, y + radius)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                key = (cx, cy)
+                self.cells.setdefault(key, []).append((order, entity))
+                keys.append(key)
+        self._entries[id(entity)] = (order, keys)
+
+    def remove(self, entity: object) -> None:
+        entry = self._entries.pop(id(entity), None)
+        if entry is None:
+            return
+        order, keys = entry
+        for key in keys:
+            bucket = self.cells[key]
+            for i, (item_order, _) in enumerate(bucket):
+                if item_order == order:
+                    del bucket[i]
+                    break
+            if not bucket:
+                del self.cells[key]
+
+    def query_circle(self, x: float, y: float, radius: float) -> list[object]:
+        """Entities whose bounds may overlap the circle; callers do the exact test."""
+        return self._collect(*self._cell_range(x - radius, y - radius, x + radius, y + radius))
+
+    def query_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[object]:
+        return self._collect(*self._cell_range(min_x, min_y, max_x, max_y))
+
+    def query_segment(
+        self, ax: float, ay: float, bx: float, by: float, padding: float = 0.0
+    ) -> list[object]:
+        return self._collect(
+            *self._cell_range(
+                min(ax, bx) - padding,
+                min(ay, by) - padding,
+                max(ax, bx) + padding,
+                max(ay, by) + padding,
+            )
+        )
+
+    def _cell_range(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            math.floor(min_x / size),
+            math.floor(min_y / size),
+            math.floor(max_x / size),
+            math.floor(max_y / size),
+        )
+
+    def _collect(self, min_cx: int, min_cy: int, max_cx: int, max_cy: int) -> list[object]:
+        cells = self.cells
+        if min_cx == max_cx and min_cy == max_cy:
+            bucket = cells.get((min_cx, min_cy))
+            return [entity for _, entity in bucket] if bucket else []
+        found: dict[int, object] = {}
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for order, entity in bucket:
+                        found[order] = entity
+        return [found[order] for order in sorted(found)]
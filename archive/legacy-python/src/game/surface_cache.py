@@ -0,0 +1,62 @@
+"""Byte-budgeted LRU cache for pre-rendered surfaces."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pygame
+
+
+def quantize_zoom(zoom: float, step: float = 0.01) -> float:
+    """Snap a zoom level to a bucket so nearby zooms share cached art."""
+    return max(step, round(zoom / step) * step)
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceCache:
+    """Least-recently-used surfaces, evicted once their pixels exceed a budget."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = int(max_bytes)
+        self.entries: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def get(self, key: Hashable, create: Callable[[], pygame.Surface]) -> pygame.Surface:
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = create()
+        self.entries[key] = surface
+        self.bytes_used += surface_bytes(surface)
+        # Never evict the entry just made, even if it alone exceeds the budget.
+        while self.bytes_used > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes_used -= surface_bytes(evicted)
+            self.evictions += 1
+        return surface
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes_used,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
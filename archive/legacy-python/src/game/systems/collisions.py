@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
-from game.entities.bullet import Bullet
 from game.entities.enemy import Enemy
 from game.entities.player import Player
+from game.entities.store import ComponentStore
+from game.profiler import traced
 from game.settings import BULLET_RADIUS, PLAYER_RADIUS
-from game.util import dist2, norm, dist_to_segment2
+from game.spatial_hash import SpatialHash
+from game.util import dist2, norm, dist_to_segment2, segment_circle_hit_t
+
+
+def _nearby(
+    enemies: list[Enemy],
+    grid: SpatialHash | None,
+    x: float,
+    y: float,
+    reach: float,
+) -> list[Enemy]:
+    """Broadphase candidates whose bounds come within ``reach`` of (x, y)."""
+    if grid is None:
+        return enemies
+    return grid.query_circle(x, y, reach)
 
 
 def update_enemy_positions(enemies: list[Enemy], player: Player, dt: float) -> None:
@@ -18,30 +33,52 @@ def update_enemy_positions(enemies: list[Enemy], player: Player, dt: float) -> N
         enemy.y += ny * enemy.speed * dt
 
 
+@traced
 def resolve_bullet_hits(
-    bullets: list[Bullet],
+    bullets: ComponentStore,
     enemies: list[Enemy],
     player: Player,
     death_positions: list[tuple[float, float]],
     hit_positions: list[tuple[float, float]],
+    grid: SpatialHash | None = None,
 ) -> None:
-    """Handle bullet collisions and apply damage."""
-    for bullet in bullets:
-        for enemy in enemies:
-            if dist2(bullet.x, bullet.y, enemy.x, enemy.y) <= (
-                BULLET_RADIUS + enemy.radius
-            ) ** 2:
-                apply_enemy_damage(
-                    enemy,
-                    bullet.damage,
-                    player,
-                    death_positions,
-                    hit_positions,
-                    (bullet.x, bullet.y),
-                )
-                bullet.ttl = 0
-                
-                break
+    """Handle bullet collisions and apply damage.
+
+    Each bullet is swept from its previous to its current position and hits
+    the first live enemy along that path, so fast shots cannot skip targets
+    at low tick rates.
+    """
+    ttl = bullets["ttl"]
+    for row, (ax, ay, bx, by, damage) in enumerate(
+        zip(
+            bullets["prev_x"].tolist(),
+            bullets["prev_y"].tolist(),
+            bullets["x"].tolist(),
+            bullets["y"].tolist(),
+            bullets["damage"].tolist(),
+        )
+    ):
+        candidates = enemies if grid is None else grid.query_segment(ax, ay, bx, by, BULLET_RADIUS)
+        first_enemy: Enemy | None = None
+        first_t = 2.0
+        for enemy in candidates:
+            if enemy.hp <= 0:
+                continue
+            t = segment_circle_hit_t(ax, ay, bx, by, enemy.x, enemy.y, BULLET_RADIUS + enemy.radius)
+            if t is not None and t < first_t:
+                first_t = t
+                first_enemy = enemy
+        if first_enemy is None:
+            continue
+        apply_enemy_damage(
+            first_enemy,
+            damage,
+            player,
+            death_positions,
+            hit_positions,
+            (ax + (bx - ax) * first_t, ay + (by - ay) * first_t),
+        )
+        ttl[row] = 0
 
 
 def apply_enemy_damage(
@@ -69,10 +106,11 @@ def resolve_rocket_hits(
     player: Player,
     death_positions: list[tuple[float, float]],
     hit_positions: list[tuple[float, float]],
+    grid: SpatialHash | None = None,
 ) -> None:
     for rocket in rockets:
         exploded = False
-        for enemy in enemies:
+        for enemy in _nearby(enemies, grid, rocket.x, rocket.y, 6):
             if dist2(rocket.x, rocket.y, enemy.x, enemy.y) <= (
                 enemy.radius + 6
             ) ** 2:
@@ -83,7 +121,7 @@ def resolve_rocket_hits(
                 exploded = True
 
         if exploded:
-            for enemy in enemies:
+            for enemy in _nearby(enemies, grid, rocket.x, rocket.y, rocket.splash_radius):
                 if dist2(rocket.x, rocket.y, enemy.x, enemy.y) <= rocket.splash_radius**2:
                     apply_enemy_damage(
                         enemy,
@@ -105,10 +143,12 @@ def resolve_laser_hits(
     width: float,
     death_positions: list[tuple[float, float]],
     hit_positions: list[tuple[float, float]],
+    grid: SpatialHash | None = None,
 ) -> None:
     ax, ay = start
     bx, by = end
-    for enemy in enemies:
+    candidates = enemies if grid is None else grid.query_segment(ax, ay, bx, by, width)
+    for enemy in candidates:
         if dist_to_segment2(enemy.x, enemy.y, ax, ay, bx, by) <= (
             enemy.radius + width
         ) ** 2:
@@ -128,10 +168,11 @@ def resolve_mine_hits(
     player: Player,
     death_positions: list[tuple[float, float]],
     hit_positions: list[tuple[float, float]],
+    grid: SpatialHash | None = None,
 ) -> None:
     for mine in mines:
         triggered = False
-        for enemy in enemies:
+        for enemy in _nearby(enemies, grid, mine.x, mine.y, mine.trigger_radius):
             if dist2(mine.x, mine.y, enemy.x, enemy.y) <= mine.trigger_radius**2:
                 triggered = True
                 break
@@ -139,7 +180,7 @@ def resolve_mine_hits(
         if not triggered:
             continue
 
-        for enemy in enemies:
+        for enemy in _nearby(enemies, grid, mine.x, mine.y, mine.splash_radius):
             if dist2(mine.x, mine.y, enemy.x, enemy.y) <= mine.splash_radius**2:
                 apply_enemy_damage(
                     enemy,
@@ -152,12 +193,18 @@ def resolve_mine_hits(
         mine.ttl = 0
 
 
-def resolve_player_hits(player: Player, enemies: list[Enemy], dt: float) -> float:
+@traced
+def resolve_player_hits(
+    player: Player,
+    enemies: list[Enemy],
+    dt: float,
+    grid: SpatialHash | None = None,
+) -> float:
     """Handle enemy-player collisions."""
     px, py = player.pos
     total_damage = 0.0
     
-    for enemy in enemies:
+    for enemy in _nearby(enemies, grid, px, py, PLAYER_RADIUS):
         if dist2(px, py, enemy.x, enemy.y) <= (PLAYER_RADIUS + enemy.radius) ** 2:
             damage = enemy.damage * dt
             total_damage += damage
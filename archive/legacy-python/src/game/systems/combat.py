@@ -7,7 +7,9 @@ import random
 
 from game.entities.bullet import Bullet
 from game.entities.player import Player
+from game.entities.store import ComponentStore
 from game.entities.weapon_state import WeaponState
+from game.profiler import traced
 from game.settings import BULLET_LIFETIME, BULLET_SPEED, PLAYER_RADIUS
 
 
@@ -55,10 +57,12 @@ def _compute_mount_base_angle(
     return player_angle
 
 
+@traced
 def fire_weapon(
     player: Player,
     weapon: WeaponState,
-    aim_world_pos: tuple[float, float] | None = None,
+    aim_world_pos: tuple[float, float] | None,
+    rng: random.Random,
 ) -> Bullet | None:
     if player.body is None:
         return None
@@ -85,7 +89,7 @@ def fire_weapon(
             delta = max(-spread_radians, min(spread_radians, delta))
             shot_angle = base_angle + delta
     else:
-        shot_angle = base_angle + random.uniform(-spread_radians, spread_radians)
+        shot_angle = base_angle + rng.uniform(-spread_radians, spread_radians)
 
     forward_x = math.sin(shot_angle)
     forward_y = -math.cos(shot_angle)
@@ -114,11 +118,12 @@ def fire_weapon(
     )
 
 
-def update_bullets(bullets: list[Bullet], dt: float) -> list[Bullet]:
-    for bullet in bullets:
-        bullet.prev_x = bullet.x
-        bullet.prev_y = bullet.y
-        bullet.x += bullet.vx * dt
-        bullet.y += bullet.vy * dt
-        bullet.ttl -= dt
-    return bullets
+@traced
+def update_bullets(bullets: ComponentStore, dt: float) -> None:
+    x = bullets["x"]
+    y = bullets["y"]
+    bullets["prev_x"][:] = x
+    bullets["prev_y"][:] = y
+    x += bullets["vx"] * dt
+    y += bullets["vy"] * dt
+    bullets["ttl"][:] -= dt
@@ -6,7 +6,8 @@ import json
 from pathlib import Path
 from typing import Any
 
-from game.settings import PLAYER_SPEED
+from game.entities.weapon_state import WeaponState
+from game.settings import BULLET_DAMAGE, PLAYER_SPEED
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 MODULES_PATH = DATA_DIR / "modules.json"
@@ -171,6 +172,40 @@ def calculate_ship_stats(
     }
 
 
+def get_module_for_slot(
+    ship_slots: object,
+    equipment: dict[str, str],
+    modules: dict[str, dict[str, Any]],
+    slot_id: str,
+) -> dict[str, Any]:
+    if not isinstance(ship_slots, list):
+        return {}
+    for slot in ship_slots:
+        if not isinstance(slot, dict):
+            continue
+        if str(slot.get("id")) == slot_id:
+            module_id = equipment.get(slot_id)
+            if module_id and module_id in modules:
+                return modules[module_id]
+    return {}
+
+
+def build_weapon_state(module: dict[str, Any], fallback_name: str) -> WeaponState:
+    stats = module.get("stats", {}) if isinstance(module, dict) else {}
+    if not isinstance(stats, dict):
+        stats = {}
+    ammo = max(1, int(stats.get("ammo", 1)))
+    return WeaponState(
+        name=str(module.get("name", fallback_name)),
+        ammo_max=ammo,
+        ammo_current=ammo,
+        damage=float(stats.get("damage", BULLET_DAMAGE)),
+        fire_rate=float(stats.get("fire_rate", 1.0)),
+        gimbal_degrees=float(stats.get("gimbal_degrees", 15.0)),
+        mounting=str(module.get("mounting", "forward")),
+    )
+
+
 def format_module_stat_lines(module: dict[str, Any]) -> list[str]:
     stats = module.get("stats", {})
     if not isinstance(stats, dict):
@@ -7,10 +7,12 @@ import random
 
 from game import settings
 from game.entities.enemy import Enemy
+from game.profiler import traced
 
 
 class Spawner:
-    def __init__(self) -> None:
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self.rng = rng if rng is not None else random.Random()
         self.spawn_timer = 0.0
         self.max_enemies = 10
         self.sector_count = 8
@@ -70,6 +72,7 @@ class Spawner:
     def reset(self) -> None:
         self.spawn_timer = 0.0
 
+    @traced
     def update(
         self,
         dt: float,
@@ -105,9 +108,9 @@ class Spawner:
         distance = view_radius + margin
 
         sector_size = math.tau / self.sector_count
-        sector_indices = random.sample(range(self.sector_count), k=max(1, min(active_sectors, self.sector_count)))
-        sector = random.choice(sector_indices)
-        angle = sector * sector_size + random.uniform(0.0, sector_size)
+        sector_indices = self.rng.sample(range(self.sector_count), k=max(1, min(active_sectors, self.sector_count)))
+        sector = self.rng.choice(sector_indices)
+        angle = sector * sector_size + self.rng.uniform(0.0, sector_size)
         x = px + math.cos(angle) * distance
         y = py + math.sin(angle) * distance
 
@@ -128,7 +131,7 @@ class Spawner:
 
     def _weighted_choice(self, weights: list[tuple[str, float]]) -> str:
         total = sum(weight for _, weight in weights)
-        roll = random.random() * total
+        roll = self.rng.random() * total
         running = 0.0
         for value, weight in weights:
             running += weight
@@ -5,16 +5,21 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 TELEMETRY_PATH = Path(__file__).resolve().parent.parent / "data" / "run_telemetry.jsonl"
 
 
 def append_run_telemetry(entry: dict[str, Any]) -> None:
-    payload = {
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-        **entry,
-    }
-    TELEMETRY_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with TELEMETRY_PATH.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, separators=(",", ":")) + "\n")
+    write_run_telemetry([entry], TELEMETRY_PATH)
+
+
+def write_run_telemetry(entries: Iterable[dict[str, Any]], path: Path, append: bool = True) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a" if append else "w", encoding="utf-8") as handle:
+        for entry in entries:
+            payload = {
+                "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+                **entry,
+            }
+            handle.write(json.dumps(payload, separators=(",", ":")) + "\n")
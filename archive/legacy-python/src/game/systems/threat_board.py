@@ -7,9 +7,12 @@ import math
 import pygame
 
 from game.entities.enemy import Enemy
+from game.profiler import traced
 from game.settings import WHITE
+from game.text_cache import get_font, render_text
 
 
+@traced
 def collect_threats(
     enemies: list[Enemy],
     player_pos: tuple[float, float],
@@ -29,6 +32,7 @@ def collect_threats(
     return threats
 
 
+@traced
 def draw_edge_indicators(
     screen: pygame.Surface,
     threats: list[dict[str, float | Enemy]],
@@ -62,11 +66,12 @@ def draw_edge_indicators(
             ang = (math.tau / sides) * i - math.pi / 2.0
             points.append((int(cx + math.cos(ang) * radius), int(cy + math.sin(ang) * radius)))
         pygame.draw.polygon(screen, color, points, 2)
-        eta_font = pygame.font.SysFont("consolas", 13)
-        eta_text = eta_font.render(f"{eta:0.0f}s", True, color)
+        eta_font = get_font("consolas", 13)
+        eta_text = render_text(eta_font, f"{eta:0.0f}s", True, color)
         screen.blit(eta_text, (int(cx + 10), int(cy - 8)))
 
 
+@traced
 def draw_threat_board(
     screen: pygame.Surface,
     font: pygame.font.Font,
@@ -76,10 +81,10 @@ def draw_threat_board(
     panel = pygame.Surface((360, 240), pygame.SRCALPHA)
     panel.fill((0, 0, 0, 160))
     screen.blit(panel, (width - 380, 80))
-    title = font.render("THREAT BOARD", True, (255, 255, 255))
+    title = render_text(font, "THREAT BOARD", True, (255, 255, 255))
     screen.blit(title, (width - 368, 92))
     for i, threat in enumerate(threats[:8]):
         eta = float(threat["eta"])
         bearing = float(threat["bearing"])
-        text = font.render(f"{i+1}. ETA {eta:4.1f}s  BRG {bearing:6.1f}", True, (220, 220, 220))
+        text = render_text(font, f"{i+1}. ETA {eta:4.1f}s  BRG {bearing:6.1f}", True, (220, 220, 220))
         screen.blit(text, (width - 368, 118 + i * 22))
@@ -0,0 +1,81 @@
+"""Shared font registry and cached text surfaces.
+
+Looking fonts up and rasterizing glyphs are both slow, and most on-screen
+text is identical from one frame to the next. Surfaces handed out here are
+shared between callers, so blit them but never draw onto them.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Hashable
+
+import pygame
+
+_fonts: dict[tuple[str | None, int], pygame.font.Font] = {}
+
+
+def get_font(name: str | None, size: int) -> pygame.font.Font:
+    """System font ``name`` (pygame's default font for None), loaded once per size."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """Least-recently-used rendered text, keyed by (font, text, antialias, color)."""
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self.entries: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        antialias: bool,
+        color: tuple[int, int, int] | pygame.Color,
+    ) -> pygame.Surface:
+        key = (font, text, antialias, tuple(color))
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+text_cache = TextCache()
+
+
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    antialias: bool,
+    color: tuple[int, int, int] | pygame.Color,
+) -> pygame.Surface:
+    """Drop-in for ``font.render(text, antialias, color)`` backed by the shared cache."""
+    return text_cache.render(font, text, antialias, color)
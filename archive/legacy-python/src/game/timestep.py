@@ -0,0 +1,27 @@
+"""Fixed-rate simulation clock with render interpolation."""
+
+from __future__ import annotations
+
+
+class FixedTimestep:
+    def __init__(self, hz: float, max_steps: int) -> None:
+        self.step_dt = 1.0 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, frame_dt: float) -> int:
+        """Bank a frame's wall time and return how many fixed steps to run."""
+        self.accumulator += max(0.0, frame_dt)
+        steps = int(self.accumulator / self.step_dt)
+        if steps > self.max_steps:
+            # Drop time we cannot catch up on rather than spiral further behind.
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_dt
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step banked since the last one, for interpolating draws."""
+        return max(0.0, min(1.0, self.accumulator / self.step_dt))
@@ -0,0 +1,63 @@
+"""Streaming Chrome Trace Event Format writer.
+
+Spans are written as they finish, so captures are bounded by disk rather
+than memory. The output is the JSON array form, which chrome://tracing,
+Perfetto and speedscope all open, and which they still accept when the
+closing bracket is missing after a crash.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from time import perf_counter, strftime
+
+TRACE_DIR = Path(__file__).resolve().parent / "data" / "traces"
+
+
+def default_trace_path() -> Path:
+    return TRACE_DIR / f"trace-{strftime('%Y%m%d-%H%M%S')}.json"
+
+
+class TraceWriter:
+    """Appends complete ("X") events to ``path``; timestamps are perf_counter seconds."""
+
+    def __init__(self, path: Path, process_name: str = "legacy-python") -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8")
+        self._origin = perf_counter()
+        self._pid = os.getpid()
+        self.events = 0
+        self._heads: dict[str, str] = {}
+        self._file.write("[\n")
+        self._write(
+            {"name": "process_name", "ph": "M", "pid": self._pid, "tid": 0, "args": {"name": process_name}}
+        )
+
+    def complete(self, name: str, start: float, end: float) -> None:
+        head = self._heads.get(name)
+        if head is None:
+            head = self._heads[name] = json.dumps(
+                {"name": name, "cat": name.split(".", 1)[0], "ph": "X", "pid": self._pid, "tid": 0},
+                separators=(",", ":"),
+            )[:-1]
+        # Spans arrive every few microseconds, so format them by hand. The
+        # process_name record is always first, so every span needs a separator.
+        self._file.write(
+            f',\n{head},"ts":{(start - self._origin) * 1e6:.3f},"dur":{(end - start) * 1e6:.3f}}}'
+        )
+        self.events += 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.write("\n]\n")
+        self._file.close()
+
+    def _write(self, event: dict[str, object]) -> None:
+        if self.events:
+            self._file.write(",\n")
+        self._file.write(json.dumps(event, separators=(",", ":")))
+        self.events += 1
@@ -15,6 +15,7 @@ from game.settings import (
     WHITE,
     get_ship_selection_colors,
 )
+from game.text_cache import get_font, render_text
 
 
 def draw_hud(
@@ -39,24 +40,24 @@ def draw_hud(
     ss = int(remaining) % 60
     timer_text = f"{mm:02d}:{ss:02d}"
 
-    time_font = pygame.font.SysFont("consolas", 36)
-    time_surf = time_font.render(timer_text, True, text_color)
+    time_font = get_font("consolas", 36)
+    time_surf = render_text(time_font, timer_text, True, text_color)
     screen.blit(time_surf, (width // 2 - time_surf.get_width() // 2, 12))
 
-    kill_surf = font.render(f"{player.enemies_killed}", True, text_color)
+    kill_surf = render_text(font, f"{player.enemies_killed}", True, text_color)
     screen.blit(kill_surf, (width - kill_surf.get_width() - 16, 16))
-    clone_surf = font.render(f"CLONE #{clone_number}", True, text_color)
+    clone_surf = render_text(font, f"CLONE #{clone_number}", True, text_color)
     screen.blit(clone_surf, (width - clone_surf.get_width() - 16, 38))
     for i, slot in enumerate(weapon_slots[:2]):
         ammo_current = int(slot.get("ammo_current", 0))
         ammo_max = int(slot.get("ammo_max", 0))
         label = str(slot.get("label", f"W{i + 1}"))
-        ammo_surf = font.render(f"{label}: {ammo_current}/{ammo_max}", True, text_color)
+        ammo_surf = render_text(font, f"{label}: {ammo_current}/{ammo_max}", True, text_color)
         screen.blit(ammo_surf, (16, 16 + i * 20))
-    fuel_surf = font.render(f"FUEL: {int(player.fuel)}/{int(player.max_fuel)}", True, text_color)
+    fuel_surf = render_text(font, f"FUEL: {int(player.fuel)}/{int(player.max_fuel)}", True, text_color)
     screen.blit(fuel_surf, (16, 56))
     if extraction_text:
-        extract_surf = font.render(extraction_text, True, NEON_YELLOW)
+        extract_surf = render_text(font, extraction_text, True, NEON_YELLOW)
         screen.blit(extract_surf, (16, 80))
 
     # Bottom center - minimalist bars and minimap circle
@@ -161,8 +162,8 @@ def _draw_vertical_bar(
     screen.blit(bar_surface, (x, y))
 
     # Draw label above bar
-    label_font = pygame.font.SysFont("consolas", 12)
-    label_surf = label_font.render(label, True, text_color)
+    label_font = get_font("consolas", 12)
+    label_surf = render_text(label_font, label, True, text_color)
     screen.blit(label_surf, (x + width // 2 - label_surf.get_width() // 2, y - 14))
 
 
@@ -178,8 +179,8 @@ def draw_end_screen(
     width, height = screen.get_size()
     msg = "YOU SURVIVED" if state == "WIN" else "YOU DIED"
     sub = "Press R to restart or ESC to quit"
-    title = big_font.render(msg, True, NEON_GREEN if state == "WIN" else RED)
-    subtitle = font.render(sub, True, WHITE)
+    title = render_text(big_font, msg, True, NEON_GREEN if state == "WIN" else RED)
+    subtitle = render_text(font, sub, True, WHITE)
     screen.blit(title, (width // 2 - title.get_width() // 2, height // 2 - 80))
     screen.blit(subtitle, (width // 2 - subtitle.get_width() // 2, height // 2 + 80))
     
@@ -191,7 +192,7 @@ def draw_end_screen(
             f"Damage Dealt: {player.damage_dealt}",
         ]
         for i, stat in enumerate(stats):
-            stat_surf = font.render(stat, True, WHITE)
+            stat_surf = render_text(font, stat, True, WHITE)
             screen.blit(stat_surf, (width // 2 - stat_surf.get_width() // 2, stats_y + i * 25))
 
 
@@ -202,15 +203,15 @@ def draw_start_menu(
     selection: int,
 ) -> None:
     width, height = screen.get_size()
-    title = big_font.render("NEON SURVIVORS", True, NEON_CYAN)
+    title = render_text(big_font, "NEON SURVIVORS", True, NEON_CYAN)
     screen.blit(title, (width // 2 - title.get_width() // 2, height // 2 - 180))
-    prompt = font.render("Pilot the drone. Survive 15 minutes.", True, WHITE)
+    prompt = render_text(font, "Pilot the drone. Survive 15 minutes.", True, WHITE)
     screen.blit(prompt, (width // 2 - prompt.get_width() // 2, height // 2 - 130))
 
     options = ["Start Mission", "Options", "Quit"]
     for i, label in enumerate(options):
         color = NEON_YELLOW if i == selection else WHITE
-        text = font.render(label, True, color)
+        text = render_text(font, label, True, color)
         screen.blit(text, (width // 2 - text.get_width() // 2, height // 2 - 40 + i * 40))
 
 
@@ -223,7 +224,7 @@ def draw_options_menu(
     fullscreen: bool,
 ) -> None:
     width, height = screen.get_size()
-    title = big_font.render("OPTIONS", True, NEON_MAGENTA)
+    title = render_text(big_font, "OPTIONS", True, NEON_MAGENTA)
     screen.blit(title, (width // 2 - title.get_width() // 2, height // 2 - 180))
 
     items = [
@@ -233,10 +234,10 @@ def draw_options_menu(
     ]
     for i, label in enumerate(items):
         color = NEON_YELLOW if i == selection else WHITE
-        text = font.render(label, True, color)
+        text = render_text(font, label, True, color)
         screen.blit(text, (width // 2 - text.get_width() // 2, height // 2 - 40 + i * 40))
 
-    hint = font.render("Use ↑/↓ to select, ←/→ to change, Enter to confirm.", True, WHITE)
+    hint = render_text(font, "Use ↑/↓ to select, ←/→ to change, Enter to confirm.", True, WHITE)
     screen.blit(hint, (width // 2 - hint.get_width() // 2, height - 60))
 
 
@@ -250,7 +251,7 @@ def draw_intro_screen(
     overlay.fill((0, 0, 0, 200))
     screen.blit(overlay, (0, 0))
 
-    title = big_font.render("MISSION BRIEF", True, NEON_GREEN)
+    title = render_text(big_font, "MISSION BRIEF", True, NEON_GREEN)
     screen.blit(title, (width // 2 - title.get_width() // 2, height // 2 - 160))
 
     lines = [
@@ -259,10 +260,10 @@ def draw_intro_screen(
         "Get moving.",
     ]
     for i, line in enumerate(lines):
-        text = font.render(line, True, WHITE)
+        text = render_text(font, line, True, WHITE)
         screen.blit(text, (width // 2 - text.get_width() // 2, height // 2 - 90 + i * 32))
 
-    prompt = font.render("Press any key to deploy.", True, NEON_YELLOW)
+    prompt = render_text(font, "Press any key to deploy.", True, NEON_YELLOW)
     screen.blit(prompt, (width // 2 - prompt.get_width() // 2, height // 2 + 60))
 
 
@@ -277,16 +278,16 @@ def draw_pause_menu(
     overlay.fill((0, 0, 0, 180))
     screen.blit(overlay, (0, 0))
 
-    title = big_font.render("PAUSED", True, NEON_MAGENTA)
+    title = render_text(big_font, "PAUSED", True, NEON_MAGENTA)
     screen.blit(title, (width // 2 - title.get_width() // 2, height // 2 - 140))
 
     options = ["Resume", "Restart", "Quit to Menu"]
     for i, label in enumerate(options):
         color = NEON_YELLOW if i == selection else WHITE
-        text = font.render(label, True, color)
+        text = render_text(font, label, True, color)
         screen.blit(text, (width // 2 - text.get_width() // 2, height // 2 - 40 + i * 40))
 
-    hint = font.render("ESC to resume. Enter to select.", True, WHITE)
+    hint = render_text(font, "ESC to resume. Enter to select.", True, WHITE)
     screen.blit(hint, (width // 2 - hint.get_width() // 2, height // 2 + 100))
 
 
@@ -304,12 +305,12 @@ def draw_fitting_screen(
     status_text: str,
 ) -> None:
     width, height = screen.get_size()
-    title = big_font.render("FITTING BAY", True, NEON_CYAN)
+    title = render_text(big_font, "FITTING BAY", True, NEON_CYAN)
     screen.blit(title, (width // 2 - title.get_width() // 2, 70))
     ship_name = str(ship.get("name", "Unknown Ship"))
-    ship_surf = font.render(f"Hull: {ship_name}", True, WHITE)
+    ship_surf = render_text(font, f"Hull: {ship_name}", True, WHITE)
     screen.blit(ship_surf, (width // 2 - ship_surf.get_width() // 2, 118))
-    info = font.render(f"Research Data: {total_data_gb:.1f} GB", True, WHITE)
+    info = render_text(font, f"Research Data: {total_data_gb:.1f} GB", True, WHITE)
     screen.blit(info, (width // 2 - info.get_width() // 2, 144))
 
     y = 200
@@ -328,9 +329,10 @@ def draw_fitting_screen(
             selected_module = module
         module_name = str(module.get("name", "Empty"))
         color = NEON_YELLOW if i == selected_index else WHITE
-        text = font.render(f"{i + 1}. {slot_id}: {module_name}", True, color)
+        text = render_text(font, f"{i + 1}. {slot_id}: {module_name}", True, color)
         screen.blit(text, (width // 2 - 280, y))
-        details = font.render(
+        details = render_text(
+            font,
             f"Type: {slot.get('type')}  Size: {slot.get('slot_size')}  Mass {int(module.get('mass', 0))}",
             True,
             (180, 180, 180),
@@ -350,8 +352,9 @@ def draw_fitting_screen(
     overload_ratio = float(fitting_stats.get("overload_ratio", 0.0))
     overloaded = bool(fitting_stats.get("overloaded", 0))
     mass_color = RED if overloaded else WHITE
-    mass_surf = font.render(f"Mass: {mass:.0f}/{mass_limit:.0f}", True, mass_color)
-    hull_surf = font.render(
+    mass_surf = render_text(font, f"Mass: {mass:.0f}/{mass_limit:.0f}", True, mass_color)
+    hull_surf = render_text(
+        font,
         f"Hull: {hull:.0f} ({hull_delta:+.0f})  Fuel: {fuel:.0f} ({fuel_delta:+.0f})  Speed: {speed:.1f} ({speed_delta:+.1f})",
         True,
         WHITE,
@@ -362,7 +365,7 @@ def draw_fitting_screen(
     penalty_text = f"Fuel Burn Mult: x{fuel_rate:.2f}"
     if overloaded:
         penalty_text += f"  OVER LIMIT +{overload_ratio * 100:.0f}%"
-    penalty_surf = font.render(penalty_text, True, penalty_color)
+    penalty_surf = render_text(font, penalty_text, True, penalty_color)
     screen.blit(penalty_surf, (width // 2 - penalty_surf.get_width() // 2, height - 104))
 
     if selected_slot is not None:
@@ -390,7 +393,8 @@ def draw_fitting_screen(
                 ):
                     continue
                 unlocked_matches += 1
-        compat = font.render(
+        compat = render_text(
+            font,
             f"Compatible Modules: {unlocked_matches}/{type_matches} unlocked",
             True,
             (210, 210, 210),
@@ -414,12 +418,12 @@ def draw_fitting_screen(
             if "fuel_bonus" in stats:
                 stat_chunks.append(f"FUEL +{float(stats['fuel_bonus']):.0f}")
             if stat_chunks:
-                stat_surf = font.render(" | ".join(stat_chunks), True, (210, 210, 210))
+                stat_surf = render_text(font, " | ".join(stat_chunks), True, (210, 210, 210))
                 screen.blit(stat_surf, (width // 2 - stat_surf.get_width() // 2, height - 216))
     if status_text:
-        status_surf = font.render(status_text, True, NEON_YELLOW)
+        status_surf = render_text(font, status_text, True, NEON_YELLOW)
         screen.blit(status_surf, (width // 2 - status_surf.get_width() // 2, height - 96))
-    hint = font.render("↑/↓ Select Slot  ←/→ Cycle Module  ENTER Deploy  TAB Archive  ESC Menu", True, WHITE)
+    hint = render_text(font, "↑/↓ Select Slot  ←/→ Cycle Module  ENTER Deploy  TAB Archive  ESC Menu", True, WHITE)
     screen.blit(hint, (width // 2 - hint.get_width() // 2, height - 70))
 
 
@@ -430,7 +434,7 @@ def draw_debrief_screen(
     summary: dict[str, object],
 ) -> None:
     width, height = screen.get_size()
-    title = big_font.render("DEBRIEF", True, NEON_GREEN)
+    title = render_text(big_font, "DEBRIEF", True, NEON_GREEN)
     screen.blit(title, (width // 2 - title.get_width() // 2, 80))
     y = 170
     lines = [
@@ -445,10 +449,10 @@ def draw_debrief_screen(
         f"Total Data: {summary.get('total_data_gb', 0.0):.2f} GB",
     ]
     for line in lines:
-        surf = font.render(line, True, WHITE)
+        surf = render_text(font, line, True, WHITE)
         screen.blit(surf, (width // 2 - surf.get_width() // 2, y))
         y += 36
-    hint = font.render("ENTER Return To Fitting   M Main Menu", True, NEON_YELLOW)
+    hint = render_text(font, "ENTER Return To Fitting   M Main Menu", True, NEON_YELLOW)
     screen.blit(hint, (width // 2 - hint.get_width() // 2, height - 80))
 
 
@@ -464,7 +468,7 @@ def draw_data_archive_screen(
     status_text: str,
 ) -> None:
     width, height = screen.get_size()
-    title = big_font.render("DATA ARCHIVE", True, NEON_MAGENTA)
+    title = render_text(big_font, "DATA ARCHIVE", True, NEON_MAGENTA)
     screen.blit(title, (width // 2 - title.get_width() // 2, 80))
     lines = [
         f"Total Data: {total_data_gb:.2f} GB",
@@ -472,7 +476,7 @@ def draw_data_archive_screen(
     ]
     y = 180
     for line in lines:
-        surf = font.render(line, True, WHITE)
+        surf = render_text(font, line, True, WHITE)
         screen.blit(surf, (width // 2 - surf.get_width() // 2, y))
         y += 40
     y += 10
@@ -487,7 +491,8 @@ def draw_data_archive_screen(
             color = RED if i == selected_index else (200, 120, 120)
         else:
             color = NEON_YELLOW if i == selected_index else WHITE
-        text = font.render(
+        text = render_text(
+            font,
             f"{i + 1}. T{entry.get('tier', 1)} {entry.get('name', 'Unknown')} [{entry.get('type', '')}] - {status}",
             True,
             color,
@@ -515,10 +520,10 @@ def draw_data_archive_screen(
         detail_text = f"Mass {mass}"
         if stat_line:
             detail_text += " | " + " | ".join(stat_line)
-        detail_surf = font.render(detail_text, True, (210, 210, 210))
+        detail_surf = render_text(font, detail_text, True, (210, 210, 210))
         screen.blit(detail_surf, (width // 2 - detail_surf.get_width() // 2, height - 142))
     if status_text:
-        status_surf = font.render(status_text, True, NEON_YELLOW)
+        status_surf = render_text(font, status_text, True, NEON_YELLOW)
         screen.blit(status_surf, (width // 2 - status_surf.get_width() // 2, height - 112))
-    hint = font.render("↑/↓ Select  ENTER Unlock  ESC Back To Fitting", True, NEON_YELLOW)
+    hint = render_text(font, "↑/↓ Select  ENTER Unlock  ESC Back To Fitting", True, NEON_YELLOW)
     screen.blit(hint, (width // 2 - hint.get_width() // 2, height - 80))
@@ -43,3 +43,33 @@ def dist_to_segment2(
     cx = ax + abx * t
     cy = ay + aby * t
     return dist2(px, py, cx, cy)
+
+
+def segment_circle_hit_t(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    cx: float,
+    cy: float,
+    radius: float,
+) -> float | None:
+    """Fraction along segment A->B where it first touches the circle, if it does."""
+    fx = ax - cx
+    fy = ay - cy
+    c = fx * fx + fy * fy - radius * radius
+    if c <= 0:
+        return 0.0
+    dx = bx - ax
+    dy = by - ay
+    a = dx * dx + dy * dy
+    if a == 0:
+        return None
+    b = 2.0 * (fx * dx + fy * dy)
+    discriminant = b * b - 4.0 * a * c
+    if discriminant < 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / (2.0 * a)
+    if 0.0 <= t <= 1.0:
+        return t
+    return None
@@ -4,51 +4,40 @@ from __future__ import annotations
 
 import math
 import random
+from collections import OrderedDict
+from pathlib import Path
 
+import numpy as np
 import pygame
 
 from game import assets, settings
-from game.entities.bullet import Bullet
-from game.entities.enemy import Enemy
-from game.entities.particle import Particle
-from game.entities.player import Player
-from game.entities.weapon_state import WeaponState
 from game.cutscene import Cutscene
 from game.debug_overlay import DebugOverlay
-from game.input import handle_player_input
-from game.physics import (
-    attach_body,
-    clamp_entity_speeds,
-    create_space,
-    remove_body,
-    step_space,
-    sync_entity_positions,
-    update_enemy_ai,
-)
+from game.hulls import HullRenderer, rotate_point
+from game.input import InputState, read_keyboard_input
+from game.profiler import profiler
+from game.replay import InputRecorder, Replay, last_run_path
 from game.settings import (
     BG,
     BULLET_RADIUS,
+    BULLET_TRAIL_MIN_ZOOM,
     FPS,
-    NEON_BLUE,
     NEON_MAGENTA,
     NEON_YELLOW,
+    PLAYER_HULL,
     PLAYER_RADIUS,
-    RED,
     WHITE,
     EXTRACTION_AVAILABLE_AT,
-    EXTRACTION_CHANNEL_TIME,
-    DATA_PER_MINUTE,
-    DATA_PER_KILL,
-    DATA_EXTRACT_BONUS,
     get_ship_selection_colors,
 )
+from game.simulation import Simulation
+from game.surface_cache import SurfaceCache, quantize_zoom
+from game.text_cache import get_font
+from game.timestep import FixedTimestep
+from game.trace import default_trace_path
 from game.systems import (
-    collisions,
-    combat,
     fitting,
-    progression,
     save_system,
-    spawner,
     telemetry,
     threat_board,
 )
@@ -63,10 +52,34 @@ from game.ui import (
     draw_start_menu,
 )
 
+# Margin around baked star chunks so edge pixels are not clipped.
+STAR_CHUNK_PAD = 2
+# Nebula originals are rendered at this fraction of their world size.
+NEBULA_BASE_SCALE = 0.25
+NEBULA_ZOOM_STEP = 0.025
+# Transparent margin around baked enemy sprites so the outline is not clipped.
+ENEMY_SPRITE_PAD = 2
+GRID_SPACING = 60
+GRID_COLOR = (12, 12, 24)
+# Baked grid tiles are at least this many pixels across, to keep the blit count low.
+GRID_TILE_MIN_PX = 256
+# Screen pixels of slack around the culling rect, covering screen shake and
+# art that straddles the edge.
+CULL_MARGIN_PX = 32
+
+
+def _bullet_head(dx: int, dy: int, width: int, radius: int) -> tuple[int, int]:
+    """Where a bullet sprite's head sits, leaving room for the circle and a thick trail."""
+    return (max(radius, width - dx), max(radius, width - dy))
+
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, seed: int | None = None, replay: Replay | None = None) -> None:
         pygame.init()
+        # Seed for every run started from this window; None rolls a new one per run.
+        self.run_seed = seed
+        # A loaded recording drives the ship instead of the keyboard and mouse.
+        self.replay = replay
         pygame.display.set_caption("Clone Protocol (prototype)")
         self.fullscreen = False
         self.available_resolutions = [
@@ -79,47 +92,17 @@ class Game:
         self.clock = pygame.time.Clock()
         self.font, self.big_font = assets.load_fonts()
 
-        self.player = Player(settings.WIDTH / 2, settings.HEIGHT / 2)
-        self.space = create_space()
-        attach_body(self.space, self.player, PLAYER_RADIUS)
-        self.enemies: list[Enemy] = []
-        self.bullets: list[Bullet] = []
-        self.particles: list[Particle] = []
-        self.primary_weapon = WeaponState(
-            name="PDC",
-            ammo_max=1,
-            ammo_current=1,
-            damage=settings.BULLET_DAMAGE,
-            fire_rate=1.0,
-            gimbal_degrees=15.0,
-            mounting="forward",
-        )
-        self.secondary_weapon = WeaponState(
-            name="RAIL",
-            ammo_max=1,
-            ammo_current=1,
-            damage=100.0,
-            fire_rate=0.5,
-            gimbal_degrees=5.0,
-            mounting="forward",
-        )
-
-        self.shake_timer = 0.0
-        self.shake_strength = 0.0
-
-        self.spawner = spawner.Spawner()
-        self.elapsed, self.remaining = progression.reset_timer()
+        self.sim = Simulation()
+        self.timestep = FixedTimestep(settings.SIM_HZ, settings.MAX_SIM_STEPS_PER_FRAME)
+        self.render_alpha = 1.0
 
         self.running = True
         self.state = "MENU"
         self.menu_selection = 0
         self.options_selection = 0
         self.pause_selection = 0
-        self.selected_weapon_group = 3
-        self.extraction_active = False
-        self.extraction_timer = 0.0
         self.show_threat_board = False
-        self.current_threats: list[dict[str, object]] = []
+        self.pending_input = InputState()
         self.debrief_summary: dict[str, object] = {}
         self.save_data = save_system.load_save_data()
         self.modules = fitting.load_modules()
@@ -128,22 +111,34 @@ class Game:
         self.ship_equipment: dict[str, str] = {}
         self.fitting_selection = 0
         self.archive_selection = 0
-        self.run_start_ammo = 0
-        self.run_start_fuel = 0.0
-        self.run_start_hp = 0.0
         self.fitting_status = ""
         self.archive_status = ""
         self.cutscene: Cutscene | None = None
-        self.cutscene_font = pygame.font.SysFont("consolas", 24)
+        self.cutscene_font = get_font("consolas", 24)
         self.debug_overlay = DebugOverlay(self)
-        self.zoom = settings.ZOOM_DEFAULT
-        self.zoom_target = settings.ZOOM_DEFAULT
 
         self.background_seed = 1337
         self.star_chunk_size = 500
         self.nebula_chunk_size = 2000
-        self.star_chunks: dict[tuple[int, int], list[dict[str, object]]] = {}
-        self.nebula_chunks: dict[tuple[int, int], list[dict[str, object]]] = {}
+        # Star layouts are cheap to regenerate from their seed, so both they and
+        # their baked surfaces are bounded LRU caches.
+        self.star_chunks: OrderedDict[
+            tuple[int, int], tuple[list[dict[str, object]], list[dict[str, object]]]
+        ] = OrderedDict()
+        self.star_surfaces = SurfaceCache(settings.STAR_SURFACE_CACHE_BYTES)
+        # Nebula chunks only hold parameters; their art lives in the surface cache.
+        self.nebula_chunks: OrderedDict[tuple[int, int], list[dict[str, object]]] = OrderedDict()
+        self.nebula_surfaces = SurfaceCache(settings.NEBULA_SURFACE_CACHE_BYTES)
+        # One tile of background grid per zoom bucket, repeated across the screen.
+        self.grid_tiles = SurfaceCache(settings.GRID_TILE_CACHE_BYTES)
+        # Every enemy of a profile looks the same, so sprites are per archetype and zoom bucket.
+        self.enemy_sprites = SurfaceCache(settings.ENEMY_SPRITE_CACHE_BYTES)
+        # Keyed by the screen offset from a bullet's head to its tail.
+        self.bullet_sprites = SurfaceCache(settings.BULLET_SPRITE_CACHE_BYTES)
+        self.hull_renderer = HullRenderer()
+        self.ship_hulls = self._resolve_ship_hulls()
+        # Drawn and total counts per entity kind from the last frame, for the overlay.
+        self.cull_counts: dict[str, tuple[int, int]] = {}
         self.shooting_stars: list[dict[str, float]] = []
         self.vignette_surface: pygame.Surface | None = None
         self.vignette_size: tuple[int, int] | None = None
@@ -151,30 +146,20 @@ class Game:
         self._reset_fitting_state()
 
     def restart(self) -> None:
-        self.player = Player(settings.WIDTH / 2, settings.HEIGHT / 2)
-        self.space = create_space()
-        attach_body(self.space, self.player, PLAYER_RADIUS)
-        self.enemies.clear()
-        self.bullets.clear()
-        self.particles.clear()
-        self._apply_selected_loadout()
-        self.shake_timer = 0.0
-        self.shake_strength = 0.0
+        self._save_replay()
+        if self.replay is not None:
+            self.replay.start(self.sim)
+            if self.timestep.step_dt != self.replay.dt:
+                self.timestep = FixedTimestep(1.0 / self.replay.dt, settings.MAX_SIM_STEPS_PER_FRAME)
+        else:
+            self._apply_selected_loadout()
+            self.sim.recorder = InputRecorder(
+                self.sim, self.timestep.step_dt, self.selected_ship_id, self.ship_equipment
+            )
         self.shooting_stars.clear()
-        self.spawner.reset()
-        self.elapsed, self.remaining = progression.reset_timer()
         self.state = "PLAY"
-        self.selected_weapon_group = 3
-        self.extraction_active = False
-        self.extraction_timer = 0.0
-        self.current_threats = []
-        self.run_start_ammo = self.primary_weapon.ammo_current + self.secondary_weapon.ammo_current
-        self.run_start_fuel = self.player.fuel
-        self.run_start_hp = self.player.hp
+        self.pending_input = InputState()
         self.cutscene = None
-        self.zoom = settings.ZOOM_DEFAULT
-        self.zoom_target = settings.ZOOM_DEFAULT
-        self.debug_overlay.params["collision_enabled"] = True
 
     def _apply_selected_loadout(self) -> None:
         ship = self.ships.get(self.selected_ship_id, {})
@@ -185,34 +170,16 @@ class Game:
             self.modules,
             unlocked_module_ids,
         )
-        stats = fitting.calculate_ship_stats(ship, self.modules, self.ship_equipment)
-        self.player.max_fuel = float(stats["fuel"])
-        self.player.fuel = self.player.max_fuel
-        self.player.max_hp = float(stats["hull"])
-        self.player.hp = self.player.max_hp
-        self.player.fuel_rate = float(stats["fuel_rate"])
-        self.player.speed_value = float(stats["speed"])
-
-        slots = ship.get("slots", [])
-        primary_module = self._get_module_for_slot(slots, "weapon_primary")
-        secondary_module = self._get_module_for_slot(slots, "weapon_secondary")
-        self.primary_weapon = self._build_weapon_state(primary_module, "PRIMARY")
-        self.secondary_weapon = self._build_weapon_state(secondary_module, "SECONDARY")
+        self.sim.reset(ship, self.modules, self.ship_equipment, self.run_seed)
 
     def _finish_run(self, outcome: str) -> None:
-        survival_time = self.elapsed
-        kills = self.player.enemies_killed
-        ammo_spent = max(
-            0,
-            self.run_start_ammo
-            - (self.primary_weapon.ammo_current + self.secondary_weapon.ammo_current),
-        )
-        fuel_spent = max(0.0, self.run_start_fuel - self.player.fuel)
-        hull_damage_taken = max(0.0, self.run_start_hp - self.player.hp)
-        data_earned = (survival_time / 60.0) * DATA_PER_MINUTE + kills * DATA_PER_KILL
-        if outcome == "Extracted":
-            data_earned += DATA_EXTRACT_BONUS
-        data_earned = round(data_earned, 2)
+        summary = self.sim.run_summary()
+        survival_time = float(summary["survival_time"])
+        kills = int(summary["kills"])
+        ammo_spent = int(summary["ammo_spent"])
+        fuel_spent = float(summary["fuel_spent"])
+        hull_damage_taken = float(summary["hull_damage"])
+        data_earned = float(summary["data_earned"])
 
         meta = self.save_data["meta"]
         meta["total_runs"] = int(meta.get("total_runs", 0)) + 1
@@ -222,6 +189,7 @@ class Game:
         meta["total_fuel_burned"] = round(float(meta.get("total_fuel_burned", 0.0)) + fuel_spent, 2)
         meta["total_ammo_spent"] = int(meta.get("total_ammo_spent", 0)) + ammo_spent
         save_system.save_data(self.save_data)
+        self._save_replay(summary)
 
         self.debrief_summary = {
             "outcome": outcome,
@@ -235,26 +203,32 @@ class Game:
             "clone_number": meta["total_runs"],
         }
         telemetry.append_run_telemetry(
-            {
-                "clone_number": meta["total_runs"],
-                "outcome": outcome,
-                "survival_time": round(survival_time, 2),
-                "kills": int(kills),
-                "ammo_spent": int(ammo_spent),
-                "fuel_spent": round(fuel_spent, 2),
-                "hull_damage": round(hull_damage_taken, 2),
-                "data_earned": data_earned,
-                "total_data_gb": meta["total_data_gb"],
-                "primary_weapon": self.primary_weapon.name,
-                "secondary_weapon": self.secondary_weapon.name,
-                "primary_mounting": self.primary_weapon.mounting,
-                "secondary_mounting": self.secondary_weapon.mounting,
-                "ship_id": self.selected_ship_id,
-                "equipment": dict(self.ship_equipment),
-            }
+            self.sim.telemetry_entry(
+                meta["total_runs"], meta["total_data_gb"], self.selected_ship_id, self.ship_equipment
+            )
         )
         self.state = "DEBRIEF"
 
+    def _save_replay(self, summary: dict[str, object] | None = None) -> None:
+        """Write the current run's inputs to the last-run replay, once."""
+        recorder = self.sim.recorder
+        if recorder is None or not len(recorder):
+            return
+        self.sim.recorder = None
+        path = recorder.save(last_run_path(), summary)
+        print(f"Replay saved: {path}")
+
+    def _resolve_ship_hulls(self) -> dict[str, str]:
+        """Map each ship to a hull the renderer knows, checked once so drawing never misses."""
+        ship_hulls: dict[str, str] = {}
+        for ship_id, ship in self.ships.items():
+            hull_id = ship.get("hull", PLAYER_HULL)
+            if hull_id not in self.hull_renderer.hulls:
+                print(f"Warning: ship '{ship_id}' names unknown hull '{hull_id}', using '{PLAYER_HULL}'")
+                hull_id = PLAYER_HULL
+            ship_hulls[ship_id] = hull_id
+        return ship_hulls
+
     def _ensure_save_compatibility(self) -> None:
         defaults = save_system.default_save_data()
         for key, value in defaults.items():
@@ -288,33 +262,6 @@ class Game:
         )
         self.fitting_selection = 0
 
-    def _get_module_for_slot(self, ship_slots: object, slot_id: str) -> dict[str, object]:
-        if not isinstance(ship_slots, list):
-            return {}
-        for slot in ship_slots:
-            if not isinstance(slot, dict):
-                continue
-            if str(slot.get("id")) == slot_id:
-                module_id = self.ship_equipment.get(slot_id)
-                if module_id and module_id in self.modules:
-                    return self.modules[module_id]
-        return {}
-
-    def _build_weapon_state(self, module: dict[str, object], fallback_name: str) -> WeaponState:
-        stats = module.get("stats", {}) if isinstance(module, dict) else {}
-        if not isinstance(stats, dict):
-            stats = {}
-        ammo = max(1, int(stats.get("ammo", 1)))
-        return WeaponState(
-            name=str(module.get("name", fallback_name)),
-            ammo_max=ammo,
-            ammo_current=ammo,
-            damage=float(stats.get("damage", settings.BULLET_DAMAGE)),
-            fire_rate=float(stats.get("fire_rate", 1.0)),
-            gimbal_degrees=float(stats.get("gimbal_degrees", 15.0)),
-            mounting=str(module.get("mounting", "forward")),
-        )
-
     def _get_fitting_ship_and_stats(self) -> tuple[dict[str, object], dict[str, float | int]]:
         ship = self.ships.get(self.selected_ship_id, {})
         stats = fitting.calculate_ship_stats(ship, self.modules, self.ship_equipment)
@@ -371,105 +318,42 @@ class Game:
         if self.state != "PLAY":
             return
 
-        self.elapsed, self.remaining, completed = progression.update_timer(
-            self.elapsed, self.remaining, dt
-        )
-        if completed:
-            self._finish_run("Signal Lost")
+        if self.replay is not None:
+            self._update_replay(dt)
             return
-
-        handle_player_input(self.player, dt)
-        self.debug_overlay.apply_to_game()
-
-        # Smooth zoom interpolation
-        if abs(self.zoom - self.zoom_target) > 0.001:
-            self.zoom += (self.zoom_target - self.zoom) * min(1.0, settings.ZOOM_SMOOTH_SPEED * dt)
-        else:
-            self.zoom = self.zoom_target
-
-        self.spawner.update(dt, self.elapsed, self.enemies, self.player.pos, self.zoom)
-        for enemy in self.enemies:
-            attach_body(self.space, enemy, enemy.radius)
-        update_enemy_ai(self.enemies, self.player.pos, dt)
-        step_space(self.space, dt)
-        clamp_entity_speeds(self.player, self.enemies)
-        sync_entity_positions([self.player])
-        sync_entity_positions(self.enemies)
-        self.current_threats = threat_board.collect_threats(self.enemies, self.player.pos)
-
-        death_positions: list[tuple[float, float]] = []
-        hit_positions: list[tuple[float, float]] = []
-        collisions_enabled = bool(self.debug_overlay.params["collision_enabled"])
-        self.primary_weapon.update(dt)
-        self.secondary_weapon.update(dt)
-
-        mouse_buttons = pygame.mouse.get_pressed(3)
-        mouse_world = self._screen_to_world(pygame.mouse.get_pos())
-        if self.selected_weapon_group == 1:
-            primary_enabled = True
-            secondary_enabled = False
-        elif self.selected_weapon_group == 2:
-            primary_enabled = False
-            secondary_enabled = True
-        else:
-            primary_enabled = True
-            secondary_enabled = True
-        if mouse_buttons[0] and primary_enabled:
-            bullet = combat.fire_weapon(self.player, self.primary_weapon, mouse_world)
-            if bullet is not None:
-                self.bullets.append(bullet)
-        if mouse_buttons[2] and secondary_enabled:
-            bullet = combat.fire_weapon(self.player, self.secondary_weapon, mouse_world)
-            if bullet is not None:
-                self.bullets.append(bullet)
-
-        combat.update_bullets(self.bullets, dt)
-        self.bullets = [bullet for bullet in self.bullets if bullet.ttl > 0]
-        if collisions_enabled:
-            collisions.resolve_bullet_hits(
-                self.bullets,
-                self.enemies,
-                self.player,
-                death_positions,
-                hit_positions,
-            )
-
-        alive_enemies: list[Enemy] = []
-        for enemy in self.enemies:
-            if enemy.hp > 0:
-                alive_enemies.append(enemy)
-            else:
-                remove_body(self.space, enemy)
-        self.enemies = alive_enemies
-        total_damage = collisions.resolve_player_hits(self.player, self.enemies, dt) if collisions_enabled else 0.0
-        if total_damage > 0:
-            self._add_screen_shake(min(6.0, 2.0 + total_damage * 1.5))
-        for pos in death_positions:
-            self._spawn_explosion(pos, RED, 12)
-        for pos in hit_positions:
-            self._spawn_hit_sparks(pos)
-
-        if self.elapsed >= EXTRACTION_AVAILABLE_AT:
-            if self.extraction_active:
-                self.extraction_timer = max(0.0, self.extraction_timer - dt)
-                if self.extraction_timer <= 0:
-                    self._finish_run("Extracted")
-                    return
-
-        # Check death
-        if self.player.hp <= 0:
-            self.player.hp = 0
-            self._spawn_explosion(self.player.pos, NEON_BLUE, 18)
-            self._add_screen_shake(10.0)
-            self._finish_run("Destroyed")
+        self.sim.step(dt, self._read_input())
+        if self.sim.outcome is not None:
+            self._finish_run(self.sim.outcome)
             return
+        self._update_shooting_stars(dt)
 
-        self._update_particles(dt)
-        self._spawn_engine_particles()
-        if self.shake_timer > 0:
-            self.shake_timer = max(0.0, self.shake_timer - dt)
+    def _update_replay(self, dt: float) -> None:
+        # Replays never touch the save file or telemetry; they just end.
+        self.sim.step(dt, self.replay.next_input(self.sim))
+        if self.sim.outcome is not None or self.replay.finished:
+            print(f"Replay finished: {self.sim.outcome or 'no outcome'} at {self.sim.elapsed:.1f}s")
+            self.running = False
+            return
         self._update_shooting_stars(dt)
 
+    def _read_input(self) -> InputState:
+        """Sample held keys and the mouse, folding in edge actions queued by events."""
+        controls = read_keyboard_input()
+        mouse_buttons = pygame.mouse.get_pressed(3)
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        width, height = self.screen.get_size()
+        controls.fire_primary = bool(mouse_buttons[0])
+        controls.fire_secondary = bool(mouse_buttons[2])
+        controls.aim_offset = (
+            (mouse_x - width / 2.0) / self.sim.zoom,
+            (mouse_y - height / 2.0) / self.sim.zoom,
+        )
+        controls.weapon_group = self.pending_input.weapon_group
+        controls.zoom_steps = self.pending_input.zoom_steps
+        controls.extract = self.pending_input.extract
+        self.pending_input = InputState()
+        return controls
+
     def draw(self) -> None:
         if self.state in ("PLAY", "PAUSE", "WIN", "LOSE", "DEBRIEF"):
             shake_x, shake_y = self._get_shake_offset()
@@ -477,8 +361,9 @@ class Game:
         else:
             shake_x, shake_y = (0.0, 0.0)
             cam_x, cam_y = (0.0, 0.0)
-        self.screen.fill(BG)
-        self._draw_background(cam_x, cam_y, shake_x, shake_y)
+        with profiler.scope("draw.background"):
+            self.screen.fill(BG)
+            self._draw_background(cam_x, cam_y, shake_x, shake_y)
 
         if self.state == "MENU":
             draw_start_menu(self.screen, self.font, self.big_font, self.menu_selection)
@@ -543,76 +428,76 @@ class Game:
             pygame.display.flip()
             return
 
-        for bullet in self.bullets:
-            prev_x, prev_y = self._world_to_screen(
-                bullet.prev_x, bullet.prev_y, cam_x, cam_y, shake_x, shake_y
-            )
-            bullet_x, bullet_y = self._world_to_screen(
-                bullet.x, bullet.y, cam_x, cam_y, shake_x, shake_y
-            )
-            bullet_r = max(1, int(BULLET_RADIUS * self.zoom))
-            pygame.draw.line(
+        view = self._get_view_rect(cam_x, cam_y)
+        with profiler.scope("draw.bullets"):
+            self._draw_bullets(cam_x, cam_y, shake_x, shake_y, view)
+
+        with profiler.scope("draw.enemies"):
+            self._draw_enemies(cam_x, cam_y, shake_x, shake_y, view)
+            threat_board.draw_edge_indicators(
                 self.screen,
-                NEON_YELLOW,
-                (prev_x, prev_y),
-                (bullet_x, bullet_y),
-                max(1, int(2 * self.zoom)),
+                self.sim.current_threats,
+                self._world_to_screen,
+                cam_x,
+                cam_y,
+                shake_x,
+                shake_y,
             )
-            pygame.draw.circle(
-                self.screen,
-                NEON_YELLOW,
-                (bullet_x, bullet_y),
-                bullet_r,
+
+        with profiler.scope("draw.player"):
+            px, py = self._interpolate(self.sim.player)
+            screen_px, screen_py = self._world_to_screen(px, py, cam_x, cam_y, shake_x, shake_y)
+            angle = 0.0
+            if self.sim.player.body is not None:
+                angle = float(self.sim.player.body.angle)
+            ship_colors = get_ship_selection_colors()
+            hull_id = self.ship_hulls.get(self.selected_ship_id, PLAYER_HULL)
+            hull = self.hull_renderer.hulls[hull_id]
+            scale = (PLAYER_RADIUS * 2) / hull.size * self.sim.zoom
+            # The player's ship wears the selection palette: one fill, one outline.
+            palette = dict.fromkeys(hull.palette, ship_colors["ship_fill"])
+            palette["outline"] = ship_colors["ship_outline"]
+            self.hull_renderer.draw(
+                self.screen, hull_id, (screen_px, screen_py), angle, scale, palette, outline_width=2
             )
 
-        for enemy in self.enemies:
-            self._draw_enemy(enemy, cam_x, cam_y, shake_x, shake_y)
-        threat_board.draw_edge_indicators(
-            self.screen,
-            self.current_threats,
-            self._world_to_screen,
-            cam_x,
-            cam_y,
-            shake_x,
-            shake_y,
-        )
+            # Draw bright front tip glow for directionality
+            tip_x, tip_y = rotate_point(hull.tip, angle, scale)
+            front_x = screen_px + tip_x
+            front_y = screen_py + tip_y
+            tip_r_inner = max(1, int(3 * self.sim.zoom))
+            tip_r_outer = max(2, int(5 * self.sim.zoom))
+            pygame.draw.circle(self.screen, ship_colors["ship_tip"], (int(front_x), int(front_y)), tip_r_inner, 0)
+            pygame.draw.circle(self.screen, ship_colors["ship_tip"], (int(front_x), int(front_y)), tip_r_outer, 1)
+
+        with profiler.scope("draw.particles"):
+            self._draw_particles(cam_x, cam_y, shake_x, shake_y, view)
+        with profiler.scope("draw.hud"):
+            self._draw_vignette()
+            self._draw_hud()
+        if self.state in ("PLAY", "PAUSE"):
+            with profiler.scope("draw.overlay"):
+                self.debug_overlay.draw(self.screen)
 
-        px, py = self.player.pos
-        screen_px, screen_py = self._world_to_screen(px, py, cam_x, cam_y, shake_x, shake_y)
-        angle = 0.0
-        if self.player.body is not None:
-            angle = float(self.player.body.angle)
-        ship_colors = get_ship_selection_colors()
-        catamaran_polys, front_point = self._get_player_catamaran(screen_px, screen_py, angle)
-        for poly in catamaran_polys:
-            pygame.draw.polygon(self.screen, ship_colors["ship_fill"], poly, 0)
-            pygame.draw.polygon(self.screen, ship_colors["ship_outline"], poly, 2)
-
-        # Draw bright front tip glow for directionality
-        front_x, front_y = front_point
-        tip_r_inner = max(1, int(3 * self.zoom))
-        tip_r_outer = max(2, int(5 * self.zoom))
-        pygame.draw.circle(self.screen, ship_colors["ship_tip"], (int(front_x), int(front_y)), tip_r_inner, 0)
-        pygame.draw.circle(self.screen, ship_colors["ship_tip"], (int(front_x), int(front_y)), tip_r_outer, 1)
-
-        self._draw_particles(cam_x, cam_y, shake_x, shake_y)
-        self._draw_vignette()
+        with profiler.scope("draw.flip"):
+            pygame.display.flip()
 
+    def _draw_hud(self) -> None:
         draw_hud(
             self.screen,
             self.font,
-            self.player,
-            self.remaining,
+            self.sim.player,
+            self.sim.remaining,
             [
                 {
-                    "label": f"{self.primary_weapon.name} [{self.primary_weapon.mounting[:1].upper()}] G{self.selected_weapon_group}",
-                    "ammo_current": self.primary_weapon.ammo_current,
-                    "ammo_max": self.primary_weapon.ammo_max,
+                    "label": f"{self.sim.primary_weapon.name} [{self.sim.primary_weapon.mounting[:1].upper()}] G{self.sim.selected_weapon_group}",
+                    "ammo_current": self.sim.primary_weapon.ammo_current,
+                    "ammo_max": self.sim.primary_weapon.ammo_max,
                 },
                 {
-                    "label": f"{self.secondary_weapon.name} [{self.secondary_weapon.mounting[:1].upper()}]",
-                    "ammo_current": self.secondary_weapon.ammo_current,
-                    "ammo_max": self.secondary_weapon.ammo_max,
+                    "label": f"{self.sim.secondary_weapon.name} [{self.sim.secondary_weapon.mounting[:1].upper()}]",
+                    "ammo_current": self.sim.secondary_weapon.ammo_current,
+                    "ammo_max": self.sim.secondary_weapon.ammo_max,
                 },
             ],
             [],
@@ -620,36 +505,32 @@ class Game:
             int(self.save_data["meta"].get("total_runs", 0)),
         )
         if self.show_threat_board:
-            threat_board.draw_threat_board(self.screen, self.font, self.current_threats)
+            threat_board.draw_threat_board(self.screen, self.font, self.sim.current_threats)
 
         if self.state == "PAUSE":
             draw_pause_menu(self.screen, self.font, self.big_font, self.pause_selection)
         
-        draw_end_screen(self.screen, self.font, self.big_font, self.state, self.player)
-        if self.state in ("PLAY", "PAUSE"):
-            self.debug_overlay.draw(self.screen)
-
-        pygame.display.flip()
+        draw_end_screen(self.screen, self.font, self.big_font, self.state, self.sim.player)
 
     def run(self) -> None:
         try:
             while self.running:
-                dt = self.clock.tick(FPS) / 1000.0
+                frame_dt = self.clock.tick(FPS) / 1000.0
+                profiler.begin_frame()
 
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
                         self.running = False
                     elif event.type == pygame.MOUSEWHEEL:
                         if self.state == "PLAY":
-                            self.zoom_target += event.y * settings.ZOOM_STEP
-                            self.zoom_target = max(
-                                settings.ZOOM_MIN,
-                                min(settings.ZOOM_MAX, self.zoom_target),
-                            )
+                            self.pending_input.zoom_steps += event.y
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_F3:
                             self.debug_overlay.toggle()
                             continue
+                        if event.key == pygame.K_F9:
+                            self.toggle_trace()
+                            continue
                         if self.state == "PLAY" and self.debug_overlay.handle_input(event):
                             continue
                         if self.state == "MENU":
@@ -727,13 +608,11 @@ class Game:
                             if event.key == pygame.K_ESCAPE:
                                 self.state = "PAUSE"
                             elif pygame.K_1 <= event.key <= pygame.K_5:
-                                self.selected_weapon_group = event.key - pygame.K_0
+                                self.pending_input.weapon_group = event.key - pygame.K_0
                             elif event.key == pygame.K_TAB:
                                 self.show_threat_board = not self.show_threat_board
-                            elif event.key == pygame.K_x and self.elapsed >= EXTRACTION_AVAILABLE_AT:
-                                if not self.extraction_active:
-                                    self.extraction_active = True
-                                    self.extraction_timer = EXTRACTION_CHANNEL_TIME
+                            elif event.key == pygame.K_x:
+                                self.pending_input.extract = True
                         elif self.state == "PAUSE":
                             if event.key == pygame.K_ESCAPE:
                                 self.state = "PLAY"
@@ -790,11 +669,28 @@ class Game:
                 if not self.running:
                     break
 
-                self.update(dt)
-                self.draw()
+                for _ in range(self.timestep.advance(frame_dt)):
+                    with profiler.phase("Game.update"):
+                        self.update(self.timestep.step_dt)
+                # Outside of play nothing moves between steps, so draw as-is.
+                self.render_alpha = self.timestep.alpha if self.state == "PLAY" else 1.0
+                with profiler.phase("Game.draw"):
+                    self.draw()
+                profiler.end_frame()
         finally:
+            # Keep abandoned runs replayable too.
+            self._save_replay()
+            profiler.stop_trace()
             pygame.quit()
 
+    def toggle_trace(self, path: Path | None = None) -> None:
+        """Start a Chrome trace capture of game-loop spans, or finish the current one."""
+        if profiler.trace is not None:
+            print(f"Trace saved: {profiler.stop_trace()}")
+            return
+        trace = profiler.start_trace(path or default_trace_path())
+        print(f"Trace recording to {trace.path} (F9 to stop)")
+
     def _apply_display_mode(self) -> None:
         _, (width, height) = self.available_resolutions[self.resolution_index]
         settings.WIDTH = width
@@ -802,185 +698,187 @@ class Game:
         flags = pygame.FULLSCREEN if self.fullscreen else 0
         self.screen = pygame.display.set_mode((width, height), flags)
         self.font, self.big_font = assets.load_fonts()
-        self.cutscene_font = pygame.font.SysFont("consolas", 24)
+        self.cutscene_font = get_font("consolas", 24)
+        # Baked surfaces were converted to the old display's pixel format.
+        self.star_surfaces.clear()
+        self.nebula_surfaces.clear()
+        self.grid_tiles.clear()
+        self.enemy_sprites.clear()
+        self.bullet_sprites.clear()
+        self.hull_renderer.clear()
 
     def _get_shake_offset(self) -> tuple[float, float]:
-        if self.shake_timer <= 0:
+        if self.sim.shake_timer <= 0:
             return (0.0, 0.0)
-        ratio = min(1.0, self.shake_timer / 0.18)
-        strength = self.shake_strength * ratio
+        ratio = min(1.0, self.sim.shake_timer / 0.18)
+        strength = self.sim.shake_strength * ratio
+        rng = self.sim.rng.cosmetic
         return (
-            random.uniform(-strength, strength),
-            random.uniform(-strength, strength),
+            rng.uniform(-strength, strength),
+            rng.uniform(-strength, strength),
         )
 
-    def _add_screen_shake(self, strength: float) -> None:
-        self.shake_strength = max(self.shake_strength, strength)
-        self.shake_timer = max(self.shake_timer, 0.18)
-
     def _get_extraction_text(self) -> str:
-        if self.elapsed < EXTRACTION_AVAILABLE_AT:
+        if self.sim.elapsed < EXTRACTION_AVAILABLE_AT:
             return ""
-        if self.extraction_active:
-            return f"EXTRACTING... {self.extraction_timer:0.1f}s"
+        if self.sim.extraction_active:
+            return f"EXTRACTING... {self.sim.extraction_timer:0.1f}s"
         return "EXTRACTION AVAILABLE - Press X"
 
-    def _update_particles(self, dt: float) -> None:
-        for particle in self.particles:
-            particle.x += particle.vx * dt
-            particle.y += particle.vy * dt
-            particle.ttl -= dt
-            particle.vx *= 0.98
-            particle.vy *= 0.98
-        self.particles = [p for p in self.particles if p.ttl > 0]
-
-    def _draw_particles(
-        self, cam_x: float, cam_y: float, shake_x: float, shake_y: float
+    def _draw_bullets(
+        self,
+        cam_x: float,
+        cam_y: float,
+        shake_x: float,
+        shake_y: float,
+        view: tuple[float, float, float, float],
     ) -> None:
-        for particle in self.particles:
-            sx, sy = self._world_to_screen(
-                particle.x, particle.y, cam_x, cam_y, shake_x, shake_y
-            )
-            pygame.draw.circle(
-                self.screen,
-                particle.color,
-                (sx, sy),
-                max(1, int(particle.radius * self.zoom)),
+        bullets = self.sim.bullets
+        step_x = bullets["x"] - bullets["prev_x"]
+        step_y = bullets["y"] - bullets["prev_y"]
+        head_xs = bullets["prev_x"] + step_x * self.render_alpha
+        head_ys = bullets["prev_y"] + step_y * self.render_alpha
+        # A trail is one step long, far shorter than the margin, so testing its
+        # head is enough.
+        min_x, min_y, max_x, max_y = view
+        visible = (head_xs >= min_x) & (head_xs <= max_x) & (head_ys >= min_y) & (head_ys <= max_y)
+        self.cull_counts["bullets"] = (int(np.count_nonzero(visible)), len(bullets))
+        if not visible.any():
+            return
+        head_xs = head_xs[visible]
+        head_ys = head_ys[visible]
+        zoom = self.sim.zoom
+        # Same arithmetic as _world_to_screen, for every bullet at once.
+        screen_xs = ((head_xs - cam_x) * zoom + shake_x).astype(np.int64)
+        screen_ys = ((head_ys - cam_y) * zoom + shake_y).astype(np.int64)
+        bullet_r = max(1, int(BULLET_RADIUS * zoom))
+        if zoom < BULLET_TRAIL_MIN_ZOOM:
+            width = 0
+            offset_xs = offset_ys = np.zeros(len(screen_xs), dtype=np.int64)
+        else:
+            width = max(1, int(2 * zoom))
+            tail_xs = ((head_xs - step_x[visible] - cam_x) * zoom + shake_x).astype(np.int64)
+            tail_ys = ((head_ys - step_y[visible] - cam_y) * zoom + shake_y).astype(np.int64)
+            offset_xs = tail_xs - screen_xs
+            offset_ys = tail_ys - screen_ys
+
+        # Trails start and end on whole pixels, so a sprite per tail offset
+        # draws exactly what a line and circle at each bullet would.
+        frame_sprites: dict[tuple[int, int], tuple[pygame.Surface, int, int]] = {}
+        blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for x, y, dx, dy in zip(
+            screen_xs.tolist(), screen_ys.tolist(), offset_xs.tolist(), offset_ys.tolist()
+        ):
+            entry = frame_sprites.get((dx, dy))
+            if entry is None:
+                key = (dx, dy, width, bullet_r)
+                sprite = self.bullet_sprites.get(key, lambda: self._bake_bullet_sprite(*key))
+                entry = frame_sprites[(dx, dy)] = (sprite, *_bullet_head(*key))
+            sprite, head_x, head_y = entry
+            blits.append((sprite, (x - head_x, y - head_y)))
+        self.screen.blits(blits, doreturn=False)
+
+    def _bake_bullet_sprite(self, dx: int, dy: int, width: int, radius: int) -> pygame.Surface:
+        """A bullet head of ``radius`` with its trail back to offset (dx, dy); width 0 is a dot."""
+        head_x, head_y = _bullet_head(dx, dy, width, radius)
+        size = (head_x + max(radius, dx + width) + 1, head_y + max(radius, dy + width) + 1)
+        surface = pygame.Surface(size).convert()
+        # Colorkeyed and RLE-packed like the star chunks; solid colours blit faster than alpha.
+        surface.fill(BG)
+        surface.set_colorkey(BG, pygame.RLEACCEL)
+        if width:
+            pygame.draw.line(
+                surface, NEON_YELLOW, (head_x + dx, head_y + dy), (head_x, head_y), width
             )
+        pygame.draw.circle(surface, NEON_YELLOW, (head_x, head_y), radius)
+        return surface
 
-    def _spawn_explosion(
-        self, pos: tuple[float, float], color: tuple[int, int, int], count: int
+    def _draw_particles(
+        self,
+        cam_x: float,
+        cam_y: float,
+        shake_x: float,
+        shake_y: float,
+        view: tuple[float, float, float, float],
     ) -> None:
-        x, y = pos
-        for _ in range(count):
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(120, 280)
-            radius = random.uniform(1.5, 3.5)
-            self.particles.append(
-                Particle(
-                    x=x,
-                    y=y,
-                    vx=math.cos(angle) * speed,
-                    vy=math.sin(angle) * speed,
-                    ttl=random.uniform(0.3, 0.6),
-                    radius=radius,
-                    color=color,
-                )
-            )
-
-    def _spawn_hit_sparks(self, pos: tuple[float, float]) -> None:
-        x, y = pos
-        for _ in range(4):
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(60, 160)
-            self.particles.append(
-                Particle(
-                    x=x,
-                    y=y,
-                    vx=math.cos(angle) * speed,
-                    vy=math.sin(angle) * speed,
-                    ttl=random.uniform(0.12, 0.25),
-                    radius=random.uniform(1.0, 2.0),
-                    color=NEON_YELLOW,
-                )
-            )
-
-    def _spawn_engine_particles(self) -> None:
-        """Spawn engine thrust particles from the back of the ship."""
-        if self.player.body is None:
-            return
-
-        angle = float(self.player.body.angle)
-        px, py = self.player.pos
-
-        throttle_level = max(0.0, min(1.0, float(getattr(self.player, "throttle_level", 0.0))))
-        boost_timer = float(getattr(self.player, "boost_timer", 0.0))
-        thrust_ratio = 1.0 if boost_timer > 0.0 else throttle_level
-
-        # Only spawn particles while thrust is applied
-        if thrust_ratio <= 0.0:
+        particles = self.sim.particles
+        slots = particles.live_slots()
+        total = len(slots)
+        if total:
+            min_x, min_y, max_x, max_y = view
+            xs = particles.x[slots]
+            ys = particles.y[slots]
+            slots = slots[(xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)]
+        self.cull_counts["particles"] = (len(slots), total)
+        if len(slots) == 0:
             return
-
-        # Calculate back of ship position
-        size = PLAYER_RADIUS + 4
-        # Backward direction vector (opposite of forward which is (0, -1) rotated)
-        back_dx = -math.sin(angle)
-        back_dy = math.cos(angle)
-        back_offset = size * 0.8  # Position at back of ship
-        back_x = px + back_dx * back_offset
-        back_y = py + back_dy * back_offset
-
-        # Spawn 0-2 particles per frame depending on thrust ratio
-        max_particles = 2
-        particle_count = int(thrust_ratio * max_particles)
-        if random.random() < (thrust_ratio * max_particles - particle_count):
-            particle_count += 1
-
-        for _ in range(particle_count):
-            # Particles shoot out the back (opposite of ship direction)
-            particle_angle = math.atan2(back_dy, back_dx) + random.uniform(-0.3, 0.3)
-            particle_speed = random.uniform(80, 150) * (0.4 + 0.6 * thrust_ratio)
-
-            # Color shifts from cyan to white based on thrust
-            intensity = thrust_ratio
-            base_color = NEON_BLUE
-            color = (
-                int(base_color[0] + (255 - base_color[0]) * intensity * 0.3),
-                int(base_color[1] + (255 - base_color[1]) * intensity * 0.3),
-                int(base_color[2]),
-            )
-
-            self.particles.append(
-                Particle(
-                    x=back_x,
-                    y=back_y,
-                    vx=math.cos(particle_angle) * particle_speed,
-                    vy=math.sin(particle_angle) * particle_speed,
-                    ttl=random.uniform(0.12, 0.3) * (0.6 + 0.4 * thrust_ratio),
-                    radius=random.uniform(1.0, 2.2) * (0.6 + 0.4 * thrust_ratio),
-                    color=color,
-                )
-            )
+        radii = np.maximum(1, (particles.radius[slots] * self.sim.zoom).astype(np.int64))
+        for x, y, color, radius in zip(
+            particles.x[slots].tolist(),
+            particles.y[slots].tolist(),
+            particles.color[slots].tolist(),
+            radii.tolist(),
+        ):
+            sx, sy = self._world_to_screen(x, y, cam_x, cam_y, shake_x, shake_y)
+            pygame.draw.circle(self.screen, color, (sx, sy), radius)
 
     def _draw_background(
         self, cam_x: float, cam_y: float, shake_x: float, shake_y: float
     ) -> None:
         self._draw_nebulae(cam_x, cam_y, shake_x, shake_y)
-        spacing = 60
-        grid_color = (12, 12, 24)
-        width, height = self.screen.get_size()
-        view_w = width / self.zoom
-        view_h = height / self.zoom
-        start_world_x = int(math.floor(cam_x / spacing) * spacing)
-        start_world_y = int(math.floor(cam_y / spacing) * spacing)
-        end_world_x = int(cam_x + view_w + spacing)
-        end_world_y = int(cam_y + view_h + spacing)
-
-        for world_x in range(start_world_x, end_world_x, spacing):
-            xpos = int((world_x - cam_x) * self.zoom + shake_x)
-            pygame.draw.line(
-                self.screen,
-                grid_color,
-                (xpos, int(0 + shake_y)),
-                (xpos, int(height + shake_y)),
-                1,
-            )
-        for world_y in range(start_world_y, end_world_y, spacing):
-            ypos = int((world_y - cam_y) * self.zoom + shake_y)
-            pygame.draw.line(
-                self.screen,
-                grid_color,
-                (int(0 + shake_x), ypos),
-                (int(width + shake_x), ypos),
-                1,
-            )
+        self._draw_grid(cam_x, cam_y, shake_x, shake_y)
         self._draw_stars(cam_x, cam_y, shake_x, shake_y)
         self._draw_shooting_stars(cam_x, cam_y, shake_x, shake_y)
 
-    def _get_star_chunk(self, chunk_x: int, chunk_y: int) -> list[dict[str, object]]:
+    def _draw_grid(self, cam_x: float, cam_y: float, shake_x: float, shake_y: float) -> None:
+        width, height = self.screen.get_size()
+        zoom = self.sim.zoom
+        bucket = quantize_zoom(zoom)
+        tile = self.grid_tiles.get(bucket, lambda: self._bake_grid_tile(bucket))
+        size = tile.get_width()
+        # Anchor the tile pattern to the world so lines stay put as the camera moves.
+        # Floored, not truncated: the pattern starts left of the screen, and
+        # truncating negatives would shift every visible line a pixel.
+        span = size / bucket
+        start_x = math.floor((math.floor(cam_x / span) * span - cam_x) * zoom + shake_x)
+        start_y = math.floor((math.floor(cam_y / span) * span - cam_y) * zoom + shake_y)
+        if start_x > 0:
+            start_x -= size
+        if start_y > 0:
+            start_y -= size
+        self.screen.blits(
+            [(tile, (x, y)) for x in range(start_x, width, size) for y in range(start_y, height, size)],
+            doreturn=False,
+        )
+
+    def _bake_grid_tile(self, zoom: float) -> pygame.Surface:
+        period = GRID_SPACING * zoom
+        # Enough lines that the tile is a whole number of pixels across, so tiles
+        # butt together without a seam.
+        lines = 1
+        while lines < 1000 and (
+            lines * period < GRID_TILE_MIN_PX or abs(lines * period - round(lines * period)) > 1e-6
+        ):
+            lines += 1
+        size = int(round(lines * period))
+        surface = pygame.Surface((size, size)).convert()
+        surface.fill(BG)
+        surface.set_colorkey(BG, pygame.RLEACCEL)
+        for line in range(lines):
+            offset = int(line * period)
+            pygame.draw.line(surface, GRID_COLOR, (offset, 0), (offset, size - 1), 1)
+            pygame.draw.line(surface, GRID_COLOR, (0, offset), (size - 1, offset), 1)
+        return surface
+
+    def _get_star_chunk(
+        self, chunk_x: int, chunk_y: int
+    ) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
+        """Return a chunk's stars and the subset that twinkles live."""
         key = (chunk_x, chunk_y)
-        if key in self.star_chunks:
-            return self.star_chunks[key]
+        chunk = self.star_chunks.get(key)
+        if chunk is not None:
+            self.star_chunks.move_to_end(key)
+            return chunk
 
         seed = (
             self.background_seed
@@ -1014,13 +912,42 @@ class Game:
                     "twinkle_offset": rng.uniform(0, math.tau),
                 }
             )
-        self.star_chunks[key] = stars
-        return stars
+        # Single-pixel stars are baked; only the larger ones get a live twinkle.
+        chunk = (stars, [star for star in stars if int(star["size"]) > 1])
+        self.star_chunks[key] = chunk
+        if len(self.star_chunks) > settings.STAR_CHUNK_DATA_LIMIT:
+            self.star_chunks.popitem(last=False)
+        return chunk
+
+    def _bake_star_chunk(self, chunk_x: int, chunk_y: int, zoom: float) -> pygame.Surface:
+        stars, _ = self._get_star_chunk(chunk_x, chunk_y)
+        pad = STAR_CHUNK_PAD
+        size = int(math.ceil(self.star_chunk_size * zoom)) + pad * 2
+        surface = pygame.Surface((size, size)).convert()
+        surface.fill(BG)
+        surface.set_colorkey(BG, pygame.RLEACCEL)
+        origin_x = chunk_x * self.star_chunk_size
+        origin_y = chunk_y * self.star_chunk_size
+        for star in stars:
+            if int(star["size"]) > 1:
+                continue
+            factor = max(80, min(255, float(star["brightness"]))) / 255.0
+            tint = star["tint"]
+            surface.set_at(
+                (
+                    int((float(star["x"]) - origin_x) * zoom) + pad,
+                    int((float(star["y"]) - origin_y) * zoom) + pad,
+                ),
+                (int(tint[0] * factor), int(tint[1] * factor), int(tint[2] * factor)),
+            )
+        return surface
 
     def _get_nebula_chunk(self, chunk_x: int, chunk_y: int) -> list[dict[str, object]]:
         key = (chunk_x, chunk_y)
-        if key in self.nebula_chunks:
-            return self.nebula_chunks[key]
+        nebulae = self.nebula_chunks.get(key)
+        if nebulae is not None:
+            self.nebula_chunks.move_to_end(key)
+            return nebulae
 
         seed = (
             self.background_seed
@@ -1028,21 +955,23 @@ class Game:
             + chunk_y * 51790321
         ) & 0xFFFFFFFF
         rng = random.Random(seed)
-        nebulae: list[dict[str, object]] = []
+        nebulae = []
         if rng.random() < 0.3:
             radius = rng.randint(400, 800)
             color = rng.choice([(255, 100, 150), (150, 100, 255), (100, 150, 255)])
             alpha = rng.randint(15, 35)
-            surface = self._create_nebula_surface(radius, color, alpha)
             nebulae.append(
                 {
                     "x": chunk_x * self.nebula_chunk_size + rng.uniform(0, self.nebula_chunk_size),
                     "y": chunk_y * self.nebula_chunk_size + rng.uniform(0, self.nebula_chunk_size),
                     "radius": radius,
-                    "surface": surface,
+                    "color": color,
+                    "alpha": alpha,
                 }
             )
         self.nebula_chunks[key] = nebulae
+        if len(self.nebula_chunks) > settings.NEBULA_CHUNK_DATA_LIMIT:
+            self.nebula_chunks.popitem(last=False)
         return nebulae
 
     def _create_nebula_surface(
@@ -1065,26 +994,47 @@ class Game:
             )
         return surface
 
+    def _get_nebula_surface(
+        self, key: tuple[int, int, int], nebula: dict[str, object], zoom: float
+    ) -> pygame.Surface:
+        """Nebula art scaled to a zoom bucket, upscaled from a low-resolution original."""
+        radius = int(nebula["radius"])
+
+        def create_base() -> pygame.Surface:
+            return self._create_nebula_surface(
+                max(1, int(radius * NEBULA_BASE_SCALE)), nebula["color"], int(nebula["alpha"])
+            )
+
+        def create_scaled() -> pygame.Surface:
+            base = self.nebula_surfaces.get(("base", *key), create_base)
+            size = max(1, int(radius * zoom) * 2)
+            return pygame.transform.smoothscale(base, (size, size)).convert_alpha()
+
+        return self.nebula_surfaces.get((*key, zoom), create_scaled)
+
     def _draw_nebulae(
         self, cam_x: float, cam_y: float, shake_x: float, shake_y: float
     ) -> None:
         width, height = self.screen.get_size()
-        view_w = width / self.zoom
-        view_h = height / self.zoom
+        zoom = self.sim.zoom
+        view_w = width / zoom
+        view_h = height / zoom
         start_chunk_x = int(math.floor(cam_x / self.nebula_chunk_size))
         start_chunk_y = int(math.floor(cam_y / self.nebula_chunk_size))
         end_chunk_x = int(math.floor((cam_x + view_w) / self.nebula_chunk_size)) + 1
         end_chunk_y = int(math.floor((cam_y + view_h) / self.nebula_chunk_size)) + 1
+        # Nebulae are soft gradients, so a coarse bucket is indistinguishable.
+        bucket = quantize_zoom(zoom, NEBULA_ZOOM_STEP)
 
         for chunk_x in range(start_chunk_x, end_chunk_x):
             for chunk_y in range(start_chunk_y, end_chunk_y):
-                for nebula in self._get_nebula_chunk(chunk_x, chunk_y):
+                for index, nebula in enumerate(self._get_nebula_chunk(chunk_x, chunk_y)):
                     nebula_x = float(nebula["x"])
                     nebula_y = float(nebula["y"])
                     radius = int(nebula["radius"])
-                    screen_x = int((nebula_x - cam_x) * self.zoom + shake_x)
-                    screen_y = int((nebula_y - cam_y) * self.zoom + shake_y)
-                    scaled_radius = int(radius * self.zoom)
+                    screen_x = int((nebula_x - cam_x) * zoom + shake_x)
+                    screen_y = int((nebula_y - cam_y) * zoom + shake_y)
+                    scaled_radius = int(radius * zoom)
                     if (
                         screen_x + scaled_radius < 0
                         or screen_x - scaled_radius > width
@@ -1092,31 +1042,43 @@ class Game:
                         or screen_y - scaled_radius > height
                     ):
                         continue
-                    surface = nebula["surface"]
-                    if self.zoom != 1.0:
-                        size = max(1, scaled_radius * 2)
-                        surface = pygame.transform.scale(surface, (size, size))
-                    self.screen.blit(surface, (screen_x - scaled_radius, screen_y - scaled_radius))
+                    surface = self._get_nebula_surface((chunk_x, chunk_y, index), nebula, bucket)
+                    half = surface.get_width() // 2
+                    self.screen.blit(surface, (screen_x - half, screen_y - half))
 
     def _draw_stars(
         self, cam_x: float, cam_y: float, shake_x: float, shake_y: float
     ) -> None:
         width, height = self.screen.get_size()
-        view_w = width / self.zoom
-        view_h = height / self.zoom
+        zoom = self.sim.zoom
+        view_w = width / zoom
+        view_h = height / zoom
         start_chunk_x = int(math.floor(cam_x / self.star_chunk_size))
         start_chunk_y = int(math.floor(cam_y / self.star_chunk_size))
         end_chunk_x = int(math.floor((cam_x + view_w) / self.star_chunk_size)) + 1
         end_chunk_y = int(math.floor((cam_y + view_h) / self.star_chunk_size)) + 1
         time_seconds = pygame.time.get_ticks() / 1000.0
+        bucket = quantize_zoom(zoom)
 
         for chunk_x in range(start_chunk_x, end_chunk_x):
             for chunk_y in range(start_chunk_y, end_chunk_y):
-                for star in self._get_star_chunk(chunk_x, chunk_y):
+                surface = self.star_surfaces.get(
+                    (chunk_x, chunk_y, bucket),
+                    lambda: self._bake_star_chunk(chunk_x, chunk_y, bucket),
+                )
+                self.screen.blit(
+                    surface,
+                    (
+                        int((chunk_x * self.star_chunk_size - cam_x) * zoom + shake_x) - STAR_CHUNK_PAD,
+                        int((chunk_y * self.star_chunk_size - cam_y) * zoom + shake_y) - STAR_CHUNK_PAD,
+                    ),
+                )
+                _, twinklers = self._get_star_chunk(chunk_x, chunk_y)
+                for star in twinklers:
                     world_x = float(star["x"])
                     world_y = float(star["y"])
-                    screen_x = int((world_x - cam_x) * self.zoom + shake_x)
-                    screen_y = int((world_y - cam_y) * self.zoom + shake_y)
+                    screen_x = int((world_x - cam_x) * zoom + shake_x)
+                    screen_y = int((world_y - cam_y) * zoom + shake_y)
                     if screen_x < -3 or screen_x > width + 3 or screen_y < -3 or screen_y > height + 3:
                         continue
                     base_brightness = float(star["brightness"])
@@ -1131,41 +1093,38 @@ class Game:
                         int(tint[1] * factor),
                         int(tint[2] * factor),
                     )
-                    size = int(star["size"])
-                    if size <= 1:
-                        self.screen.set_at((screen_x, screen_y), color)
-                    else:
-                        pygame.draw.circle(self.screen, color, (screen_x, screen_y), size)
+                    pygame.draw.circle(self.screen, color, (screen_x, screen_y), int(star["size"]))
 
     def _update_shooting_stars(self, dt: float) -> None:
-        if random.random() < dt * 0.02:
+        rng = self.sim.rng.cosmetic
+        if rng.random() < dt * 0.02:
             cam_x, cam_y = self._get_camera_origin()
             width, height = self.screen.get_size()
-            view_w = width / self.zoom
-            view_h = height / self.zoom
-            edge = random.choice(["left", "right", "top", "bottom"])
+            view_w = width / self.sim.zoom
+            view_h = height / self.sim.zoom
+            edge = rng.choice(["left", "right", "top", "bottom"])
             if edge == "left":
                 start_x = cam_x - 40
-                start_y = cam_y + random.uniform(0, view_h)
-                vx = random.uniform(120, 180)
-                vy = random.uniform(-30, 30)
+                start_y = cam_y + rng.uniform(0, view_h)
+                vx = rng.uniform(120, 180)
+                vy = rng.uniform(-30, 30)
             elif edge == "right":
                 start_x = cam_x + view_w + 40
-                start_y = cam_y + random.uniform(0, view_h)
-                vx = random.uniform(-180, -120)
-                vy = random.uniform(-30, 30)
+                start_y = cam_y + rng.uniform(0, view_h)
+                vx = rng.uniform(-180, -120)
+                vy = rng.uniform(-30, 30)
             elif edge == "top":
-                start_x = cam_x + random.uniform(0, view_w)
+                start_x = cam_x + rng.uniform(0, view_w)
                 start_y = cam_y - 40
-                vx = random.uniform(-60, 60)
-                vy = random.uniform(120, 180)
+                vx = rng.uniform(-60, 60)
+                vy = rng.uniform(120, 180)
             else:
-                start_x = cam_x + random.uniform(0, view_w)
+                start_x = cam_x + rng.uniform(0, view_w)
                 start_y = cam_y + view_h + 40
-                vx = random.uniform(-60, 60)
-                vy = random.uniform(-180, -120)
+                vx = rng.uniform(-60, 60)
+                vy = rng.uniform(-180, -120)
             self.shooting_stars.append(
-                {"x": start_x, "y": start_y, "vx": vx, "vy": vy, "ttl": random.uniform(1.2, 2.0)}
+                {"x": start_x, "y": start_y, "vx": vx, "vy": vy, "ttl": rng.uniform(1.2, 2.0)}
             )
 
         for star in self.shooting_stars:
@@ -1181,13 +1140,13 @@ class Game:
             return
         width, height = self.screen.get_size()
         for star in self.shooting_stars:
-            screen_x = int((star["x"] - cam_x) * self.zoom + shake_x)
-            screen_y = int((star["y"] - cam_y) * self.zoom + shake_y)
+            screen_x = int((star["x"] - cam_x) * self.sim.zoom + shake_x)
+            screen_y = int((star["y"] - cam_y) * self.sim.zoom + shake_y)
             if screen_x < -100 or screen_x > width + 100 or screen_y < -100 or screen_y > height + 100:
                 continue
             vx = star["vx"]
             vy = star["vy"]
-            length = 40 * self.zoom
+            length = 40 * self.sim.zoom
             mag = math.hypot(vx, vy)
             if mag == 0:
                 continue
@@ -1213,80 +1172,105 @@ class Game:
         if self.vignette_surface is not None:
             self.screen.blit(self.vignette_surface, (0, 0))
 
-    def _get_player_catamaran(
-        self, x: float, y: float, angle: float
-    ) -> tuple[list[list[tuple[float, float]]], tuple[float, float]]:
-        scale = (PLAYER_RADIUS * 2) / 40.0 * self.zoom
-        # OBA catamaran hull points (from ship-test.py), facing up
-        left_hull = [(-15, -20), (-7, -20), (-7, 4), (-15, 4)]
-        right_hull = [(7, -20), (15, -20), (15, 4), (7, 4)]
-        base = [(-15, 0), (15, 0), (15, 14), (-15, 14)]
-        left_engine = [(-12, 14), (-8, 14), (-6, 20), (-14, 20)]
-        right_engine = [(8, 14), (12, 14), (14, 20), (6, 20)]
-
-        sin_a = math.sin(angle)
-        cos_a = math.cos(angle)
-
-        def _transform(points: list[tuple[float, float]]) -> list[tuple[float, float]]:
-            rotated: list[tuple[float, float]] = []
-            for px, py in points:
-                sx = px * scale
-                sy = py * scale
-                rx = sx * cos_a - sy * sin_a
-                ry = sx * sin_a + sy * cos_a
-                rotated.append((x + rx, y + ry))
-            return rotated
-
-        polys = [
-            _transform(base),
-            _transform(left_hull),
-            _transform(right_hull),
-            _transform(left_engine),
-            _transform(right_engine),
-        ]
-
-        # Front tip glow centered between hulls
-        front_px, front_py = 0.0, -20.0 * scale
-        front_x = x + (front_px * cos_a - front_py * sin_a)
-        front_y = y + (front_px * sin_a + front_py * cos_a)
-        return polys, (front_x, front_y)
-
-    def _draw_enemy(
-        self, enemy: Enemy, cam_x: float, cam_y: float, shake_x: float, shake_y: float
+    def _draw_enemies(
+        self,
+        cam_x: float,
+        cam_y: float,
+        shake_x: float,
+        shake_y: float,
+        view: tuple[float, float, float, float],
     ) -> None:
-        ex, ey = self._world_to_screen(enemy.x, enemy.y, cam_x, cam_y, shake_x, shake_y)
-        outline_color = NEON_MAGENTA if enemy.is_boss else WHITE
-        fill_color = (80, 0, 80) if enemy.is_boss else (180, 180, 180)
-        scaled_radius = enemy.radius * self.zoom
-
-        if enemy.sides <= 1:
+        zoom = self.sim.zoom
+        bucket = quantize_zoom(zoom)
+        alpha = self.render_alpha
+        min_x, min_y, max_x, max_y = view
+        enemies = self.sim.enemies
+        grid = self.sim.enemy_grid
+        view_cells = ((max_x - min_x) / grid.cell_size + 1) * ((max_y - min_y) / grid.cell_size + 1)
+        if view_cells < len(enemies) and len(grid) == len(enemies):
+            # Zoomed in on a crowd: the broadphase grid, current as of the last
+            # step, finds the few on screen in list order.
+            candidates = grid.query_rect(min_x, min_y, max_x, max_y)
+        else:
+            candidates = enemies
+        # Sprite and half-size per archetype, looked up in the LRU once per frame.
+        frame_sprites: dict[tuple[int, float, bool], tuple[pygame.Surface, int]] = {}
+        blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for enemy in candidates:
+            world_x = enemy.prev_x + (enemy.x - enemy.prev_x) * alpha
+            world_y = enemy.prev_y + (enemy.y - enemy.prev_y) * alpha
+            radius = enemy.radius
+            if (
+                world_x + radius < min_x
+                or world_x - radius > max_x
+                or world_y + radius < min_y
+                or world_y - radius > max_y
+            ):
+                continue
+            key = (enemy.sides, radius, enemy.is_boss)
+            entry = frame_sprites.get(key)
+            if entry is None:
+                sprite = self.enemy_sprites.get(
+                    (*key, bucket), lambda: self._bake_enemy_sprite(*key, bucket)
+                )
+                entry = frame_sprites[key] = (sprite, sprite.get_width() // 2)
+            sprite, half = entry
+            blits.append(
+                (
+                    sprite,
+                    (
+                        int((world_x - cam_x) * zoom + shake_x) - half,
+                        int((world_y - cam_y) * zoom + shake_y) - half,
+                    ),
+                )
+            )
+        self.screen.blits(blits, doreturn=False)
+        self.cull_counts["enemies"] = (len(blits), len(enemies))
+
+    def _bake_enemy_sprite(self, sides: int, radius: float, is_boss: bool, zoom: float) -> pygame.Surface:
+        outline_color = NEON_MAGENTA if is_boss else WHITE
+        fill_color = (80, 0, 80) if is_boss else (180, 180, 180)
+        scaled_radius = radius * zoom
+        half = int(math.ceil(scaled_radius)) + ENEMY_SPRITE_PAD
+        surface = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        if sides <= 1:
             pygame.draw.circle(
-                self.screen,
+                surface,
                 outline_color,
-                (int(ex), int(ey)),
+                (half, half),
                 max(1, int(scaled_radius)),
-                max(1, int(2 * self.zoom)),
+                max(1, int(2 * zoom)),
             )
             pygame.draw.circle(
-                self.screen,
+                surface,
                 fill_color,
-                (int(ex), int(ey)),
-                max(1, int(scaled_radius - 3 * self.zoom)),
+                (half, half),
+                max(1, int(scaled_radius - 3 * zoom)),
                 0,
             )
-            return
-
-        points = self._get_polygon_points(ex, ey, scaled_radius, enemy.sides)
-        inner_points = self._get_polygon_points(ex, ey, max(1.0, scaled_radius - 3 * self.zoom), enemy.sides)
-        pygame.draw.polygon(self.screen, outline_color, points, 2)
-        pygame.draw.polygon(self.screen, fill_color, inner_points, 0)
+        else:
+            points = self._get_polygon_points(half, half, scaled_radius, sides)
+            inner_points = self._get_polygon_points(half, half, max(1.0, scaled_radius - 3 * zoom), sides)
+            pygame.draw.polygon(surface, outline_color, points, 2)
+            pygame.draw.polygon(surface, fill_color, inner_points, 0)
+        return surface.convert_alpha()
+
+    def _interpolate(self, entity: object) -> tuple[float, float]:
+        """Draw position between the last two simulation steps."""
+        alpha = self.render_alpha
+        x = float(getattr(entity, "x"))
+        y = float(getattr(entity, "y"))
+        prev_x = float(getattr(entity, "prev_x", x))
+        prev_y = float(getattr(entity, "prev_y", y))
+        return (prev_x + (x - prev_x) * alpha, prev_y + (y - prev_y) * alpha)
 
     def _get_camera_origin(self) -> tuple[float, float]:
         width, height = self.screen.get_size()
+        player_x, player_y = self._interpolate(self.sim.player)
         # Camera origin accounts for zoom: we see more world when zoomed out
         return (
-            self.player.x - width / (2.0 * self.zoom),
-            self.player.y - height / (2.0 * self.zoom),
+            player_x - width / (2.0 * self.sim.zoom),
+            player_y - height / (2.0 * self.sim.zoom),
         )
 
     def _world_to_screen(
@@ -1299,26 +1283,20 @@ class Game:
         shake_y: float = 0.0,
     ) -> tuple[int, int]:
         return (
-            int((world_x - cam_x) * self.zoom + shake_x),
-            int((world_y - cam_y) * self.zoom + shake_y),
+            int((world_x - cam_x) * self.sim.zoom + shake_x),
+            int((world_y - cam_y) * self.sim.zoom + shake_y),
         )
 
     def _screen_to_world(self, screen_pos: tuple[int, int]) -> tuple[float, float]:
         cam_x, cam_y = self._get_camera_origin()
-        return (screen_pos[0] / self.zoom + cam_x, screen_pos[1] / self.zoom + cam_y)
+        return (screen_pos[0] / self.sim.zoom + cam_x, screen_pos[1] / self.sim.zoom + cam_y)
 
-    def _is_world_position_on_screen(
-        self,
-        world_x: float,
-        world_y: float,
-        cam_x: float,
-        cam_y: float,
-        screen_w: int,
-        screen_h: int,
-    ) -> bool:
-        screen_x = (world_x - cam_x) * self.zoom
-        screen_y = (world_y - cam_y) * self.zoom
-        return 0.0 <= screen_x <= float(screen_w) and 0.0 <= screen_y <= float(screen_h)
+    def _get_view_rect(self, cam_x: float, cam_y: float) -> tuple[float, float, float, float]:
+        """World bounds of the screen, padded by ``CULL_MARGIN_PX``, for culling."""
+        width, height = self.screen.get_size()
+        zoom = self.sim.zoom
+        pad = CULL_MARGIN_PX / zoom
+        return (cam_x - pad, cam_y - pad, cam_x + width / zoom + pad, cam_y + height / zoom + pad)
 
     def _get_polygon_points(
         self, x: float, y: float, radius: float, sides: int
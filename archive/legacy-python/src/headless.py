@@ -0,0 +1,70 @@
+"""Step full rounds without a window, display or event queue."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from game import settings
+from game.policies import POLICIES, make_policy
+from game.profiler import profiler
+from game.simulation import Simulation, default_loadout
+from game.snapshot import load_snapshot, restore_snapshot, save_snapshot, take_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--hz", type=float, default=settings.SIM_HZ, help="simulation steps per second")
+    parser.add_argument("--ship", default="", help="ship id from ships.json")
+    parser.add_argument("--pilot", choices=POLICIES, default="idle", help="scripted policy flying the ship")
+    parser.add_argument("--seed", type=int, help="seed of the first run; later runs count up from it")
+    parser.add_argument("--no-effects", action="store_true", help="skip cosmetic particles")
+    parser.add_argument("--trace", type=Path, metavar="PATH", help="record simulation spans to a Chrome trace file")
+    parser.add_argument("--resume", type=Path, metavar="PATH", help="start every run from a saved snapshot")
+    parser.add_argument(
+        "--snapshot-at",
+        nargs=2,
+        metavar=("SECONDS", "PATH"),
+        help="save a snapshot when the first run reaches SECONDS of sim time",
+    )
+    args = parser.parse_args()
+
+    ship, modules, equipment = default_loadout(args.ship)
+    sim = Simulation()
+    policy = make_policy(args.pilot)
+    dt = 1.0 / args.hz
+    resume = load_snapshot(args.resume) if args.resume is not None else None
+    if args.trace is not None:
+        profiler.start_trace(args.trace)
+    try:
+        for run_index in range(args.runs):
+            if resume is not None:
+                restore_snapshot(sim, resume)
+            else:
+                seed = None if args.seed is None else args.seed + run_index
+                sim.reset(ship, modules, equipment, seed)
+            sim.effects_enabled = not args.no_effects
+            policy.reset(sim)
+            started = time.perf_counter()
+            if args.snapshot_at is not None and run_index == 0:
+                seconds, path = float(args.snapshot_at[0]), Path(args.snapshot_at[1])
+                while sim.outcome is None and sim.elapsed < seconds:
+                    sim.step(dt, policy(sim))
+                if sim.outcome is None:
+                    print(f"snapshot at {sim.elapsed:.1f}s saved to {save_snapshot(take_snapshot(sim), path)}")
+            outcome = sim.run(policy, dt)
+            wall_time = time.perf_counter() - started
+            summary = sim.run_summary()
+            print(
+                f"run {run_index + 1} (seed {summary['seed']}): {outcome} after {summary['survival_time']:.1f}s sim "
+                f"({wall_time:.2f}s wall, {summary['survival_time'] / max(wall_time, 1e-9):.0f}x) "
+                f"kills={summary['kills']} hull_damage={summary['hull_damage']:.1f}"
+            )
+    finally:
+        profiler.stop_trace()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,28 @@
+"""Launch the game window."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
 from game.world import Game
 
 
 def main() -> None:
-    Game().run()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, help="play every run with this seed")
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="PATH",
+        help="record game-loop spans to a Chrome trace file from launch (F9 toggles in game)",
+    )
+    args = parser.parse_args()
+
+    game = Game(seed=args.seed)
+    if args.trace is not None:
+        game.toggle_trace(args.trace)
+    game.run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+"""Re-simulate a recorded run, headless at full speed or in the game window."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from game.replay import Replay, last_run_path
+from game.simulation import Simulation
+
+# Summary fields a faithful replay must reproduce exactly.
+CHECKED_FIELDS = ("seed", "survival_time", "kills", "ammo_spent", "fuel_spent", "hull_damage", "data_earned")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path, nargs="?", help="recording to play (default: the last run)")
+    parser.add_argument("--realtime", action="store_true", help="play back in the game window at normal speed")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path or last_run_path())
+    if args.realtime:
+        from game.world import Game
+
+        game = Game(replay=replay)
+        game.restart()
+        game.run()
+        return
+
+    sim = Simulation()
+    started = time.perf_counter()
+    outcome = replay.run(sim)
+    wall_time = time.perf_counter() - started
+    summary = sim.run_summary()
+    print(
+        f"replay (seed {replay.seed}): {outcome or 'no outcome'} after {summary['survival_time']:.1f}s sim, "
+        f"{replay.tick} ticks in {wall_time:.2f}s wall ({replay.tick / max(wall_time, 1e-9):.0f} ticks/s)"
+    )
+    recorded = replay.header.get("summary")
+    if recorded is None:
+        print("recording has no summary to verify against (run was abandoned)")
+        return
+    mismatched = [name for name in CHECKED_FIELDS if recorded.get(name) != summary[name]]
+    if mismatched:
+        raise SystemExit(
+            "replay diverged: "
+            + ", ".join(f"{name} {recorded.get(name)!r} -> {summary[name]!r}" for name in mismatched)
+        )
+    print("matches the recorded summary")
+
+
+if __name__ == "__main__":
+    main()